@@ -0,0 +1,83 @@
+import os
+import time
+import datetime
+import tempfile
+
+# Compare against a local mongod, never the shared cluster from .env
+os.environ["MONGO_URI"] = os.getenv("LOCAL_MONGO_URI", "mongodb://localhost:27017")
+os.environ["MONGO_SERVER_SELECTION_TIMEOUT_MS"] = "2000"
+
+from pymongo.errors import PyMongoError
+from data.connection import get_client
+from data.store import EventStore
+from data.backends.mongo import MongoBackend
+from data.backends.sqlite import SQLiteBackend
+
+BENCH_USER = "backend-bench-user"
+EVENTS = 2000
+READS = 200
+
+
+def workload():
+    today = datetime.date.today()
+    events = []
+    for i in range(EVENTS):
+        day = today - datetime.timedelta(days=i % 365)
+        events.append({
+            "title": f"Event {i}",
+            "start_date": f"{day.isoformat()} {9 + i % 8:02d}:00",
+            "end_date": f"{day.isoformat()} {10 + i % 8:02d}:00",
+            "description": "",
+            "recurrence": "weekends" if i % 100 == 0 else None,
+        })
+    return events
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def run(label, backend):
+    store = EventStore(backend)
+    # Measure the backend itself: no replica, and the month cache is emptied before every read
+    store.sync_enabled = False
+    if store.backend is None:
+        print(f"{label}: not available")
+        return
+    store.set_user(BENCH_USER)
+    try:
+        added, insert_ms = timed(store.add_events, workload())
+        today = datetime.date.today()
+        read_ms = []
+        for i in range(READS):
+            first = (today - datetime.timedelta(days=(i * 7) % 365)).replace(day=1)
+            store.cache.clear()
+            _, ms = timed(store.get_events_for_month, first.year, first.month, projection="grid")
+            read_ms.append(ms)
+        _, update_ms = timed(store.update_event, added[0]["id"], {"title": "Renamed"})
+        read_ms.sort()
+        print(
+            f"{label:<8} bulk insert {EVENTS} {insert_ms:8.1f} ms   "
+            f"month read p50 {read_ms[len(read_ms) // 2]:6.2f} ms  p95 {read_ms[int(len(read_ms) * 0.95)]:6.2f} ms   "
+            f"update {update_ms:6.2f} ms"
+        )
+    finally:
+        store.delete_events([doc["id"] for doc in added if doc is not None], ordered=False)
+        store.set_user(None)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        run("sqlite", SQLiteBackend(os.path.join(directory, "bench.db")))
+    try:
+        get_client().admin.command("ping")
+    except PyMongoError as e:
+        print(f"mongo: not available ({type(e).__name__})")
+        return
+    run("mongo", MongoBackend())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import datetime
+import random
+import statistics
+import time
+from types import SimpleNamespace
+import flet as ft
+from data.day_index import DayIndex
+from components.timeline import Timeline
+from utils.event_layout import layout_cache, layout_events
+
+EVENTS_PER_DAY = 1000
+RUNS = 20
+
+
+class BenchPage(SimpleNamespace):
+    def __init__(self):
+        super().__init__(theme_mode=ft.ThemeMode.LIGHT, height=800)
+
+    def update(self, *controls):
+        pass
+
+
+def day_events(day, count, rng):
+    events = []
+    for i in range(count):
+        start = rng.randrange(6 * 60, 22 * 60)
+        end = min(start + rng.choice((15, 30, 45, 60, 90, 120)), 23 * 60 + 59)
+        events.append({
+            "id": f"{day}-{i}",
+            "title": f"Event {i}",
+            "start": f"{day} {start // 60:02d}:{start % 60:02d}",
+            "end": f"{day} {end // 60:02d}:{end % 60:02d}",
+            "type": "task" if i % 5 == 0 else "event",
+        })
+    return events
+
+
+def timed_ms(func, runs=RUNS):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    rng = random.Random(11)
+    day = datetime.date(2025, 3, 10)
+
+    print("layout_events, cold (median of %d runs)" % RUNS)
+    for count in (250, 500, 1000, 2000, 4000):
+        events = day_events(day, count, rng)
+        ms = timed_ms(lambda: layout_events(events))
+        lanes = max(cluster.lanes for cluster in layout_events(events))
+        print(f"  {count:>5} events: {ms:7.2f} ms  ({ms / count * 1000:5.2f} us/event, widest cluster {lanes} lanes)")
+
+    events = day_events(day, EVENTS_PER_DAY, rng)
+    index = DayIndex(events)
+    version = index.version(day)
+    layout_cache.get(day, version, events)
+    cached = timed_ms(lambda: layout_cache.get(day, index.version(day), index.on(day)), runs=1000)
+    print(f"layout_cache hit, {EVENTS_PER_DAY} events: {cached * 1000:.1f} us")
+
+    # Whole render path: day view and week view at 1,000 events per day
+    week = [day + datetime.timedelta(days=i) for i in range(7)]
+    week_index = DayIndex([e for d in week for e in day_events(d, EVENTS_PER_DAY, rng)])
+    for label, days, dates, source in (("day", 1, [day], index), ("week", 7, week, week_index)):
+        layout_cache.clear()
+        timeline = Timeline(days=days)
+        timeline.page = BenchPage()
+        first = timed_ms(lambda: timeline.show(source, dates), runs=1)
+        again = timed_ms(lambda: timeline.show(source, dates))
+        cards = sum(len(column.cards) for column in timeline.columns)
+        print(
+            f"Timeline.show {label:<4} ({days * EVENTS_PER_DAY} events): first {first:7.1f} ms, "
+            f"re-render {again:6.1f} ms, {cards} cards in the window"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import datetime
+import random
+import tracemalloc
+from types import SimpleNamespace
+import flet as ft
+from data.day_index import DayIndex
+from components.calendar import MonthView
+
+NAVIGATIONS = 24
+EVENTS_PER_MONTH = 120
+
+
+class BenchPage(SimpleNamespace):
+    def __init__(self):
+        super().__init__(theme_mode=ft.ThemeMode.LIGHT)
+
+    def update(self, *controls):
+        pass
+
+
+def month_events(year, month, rng):
+    days = (datetime.date(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)).day
+    return [
+        {
+            "id": f"{year}-{month}-{i}",
+            "title": f"Event {i}",
+            "start": f"{year}-{month:02d}-{rng.randint(1, days):02d} {rng.randint(7, 19):02d}:00",
+            "type": "task" if i % 4 == 0 else "event",
+        }
+        for i in range(EVENTS_PER_MONTH)
+    ]
+
+
+def months():
+    year, month = 2025, 1
+    for _ in range(NAVIGATIONS):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def new_view():
+    view = MonthView()
+    view.page = BenchPage()
+    view.is_loading = False
+    return view
+
+
+def navigate(view, year, month, events):
+    view.current_date = datetime.date(year, month, 1)
+    view.day_index = DayIndex(events)
+    view.render_calendar("navigate")
+
+
+def measure(label, step):
+    rng = random.Random(7)
+    data = [(year, month, month_events(year, month, rng)) for year, month in months()]
+    step(*data[0]) # warm up: first render, imports, pools
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    for year, month, events in data[1:]:
+        step(year, month, events)
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot_after.compare_to(snapshot_before, "filename")
+    allocated = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    count = len(data) - 1
+    print(
+        f"{label:<24} {allocated / count / 1024:8.1f} KiB net alloc/nav   "
+        f"{blocks / count:8.0f} blocks/nav   peak {peak / 1024:8.1f} KiB"
+    )
+
+
+def main():
+    print(f"{NAVIGATIONS - 1} month navigations, {EVENTS_PER_MONTH} events per month")
+
+    # What navigation used to cost: a fresh grid and fresh chips every time
+    holder = {}
+    def rebuild(year, month, events):
+        holder["view"] = new_view()
+        navigate(holder["view"], year, month, events)
+    measure("rebuild per navigation", rebuild)
+
+    view = new_view()
+    created = []
+    def rebind(year, month, events):
+        navigate(view, year, month, events)
+        created.append(view.render_stats.last["created"])
+    measure("pooled / rebound", rebind)
+    print(f"controls created per navigation after warm-up: {sum(created[1:]) / max(len(created) - 1, 1):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+# TEST-NET address: connections hang until the server selection timeout
+UNREACHABLE_URI = "mongodb://192.0.2.1:27017"
+
+
+def child(eager):
+    started = time.perf_counter()
+    import main  # noqa: F401 - imports every component and service like the real launch
+    from data.store import store
+    from services.auth_service import auth_service
+    from components.login_view import LoginView
+
+    if eager:
+        # What launch used to do: connect before the first screen exists
+        auth_service._ensure_connected()
+        store._ensure_connected()
+    else:
+        auth_service.connect_in_background()
+        store.connect_in_background()
+
+    LoginView(on_login=lambda user_info: None)
+    first_frame = time.perf_counter() - started
+
+    store._ensure_connected()
+    auth_service._ensure_connected()
+    db_ready = time.perf_counter() - started
+    print(json.dumps({"first_frame_s": first_frame, "db_ready_s": db_ready}))
+
+
+def run(label, mongo_uri, eager):
+    env = dict(os.environ)
+    if mongo_uri:
+        env["MONGO_URI"] = mongo_uri
+    args = [sys.executable, __file__, "--child"] + (["--eager"] if eager else [])
+    output = subprocess.run(args, env=env, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    lines = [line for line in output.stdout.splitlines() if line.startswith("{")]
+    if not lines:
+        print(f"{label}: failed\n{output.stderr}")
+        return
+    result = json.loads(lines[-1])
+    print(f"{label:<32} first frame {result['first_frame_s'] * 1000:8.1f} ms   db ready {result['db_ready_s'] * 1000:8.1f} ms")
+
+
+def main():
+    for eager in (True, False):
+        mode = "eager" if eager else "lazy"
+        run(f"{mode} / MONGO_URI from .env", None, eager)
+        run(f"{mode} / unreachable database", UNREACHABLE_URI, eager)
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child(eager="--eager" in sys.argv)
+    else:
+        main()
@@ -0,0 +1,56 @@
+import os
+import datetime
+
+# This check must run against a local mongod, never the shared cluster from .env
+os.environ["MONGO_URI"] = os.getenv("LOCAL_MONGO_URI", "mongodb://localhost:27017")
+os.environ["STORAGE_BACKEND"] = "mongo"
+
+from data.store import store
+from data.indexes import ensure_indexes, explain_stages, uses_index
+from services.auth_service import auth_service
+from bson.objectid import ObjectId
+
+TEST_USER = "index-check-user"
+
+
+def seed_events():
+    store.set_user(TEST_USER)
+    today = datetime.date.today()
+    for i in range(200):
+        day = today - datetime.timedelta(days=i * 3)
+        store.add_event(
+            title=f"Event {i}",
+            start_date=f"{day.isoformat()} 09:00",
+            end_date=f"{day.isoformat()} 10:00",
+            description="",
+            recurrence="weekends" if i % 20 == 0 else None
+        )
+
+
+def check(name, cursor):
+    ok = uses_index(cursor)
+    print(f"{'PASS' if ok else 'FAIL'}: {name} -> {explain_stages(cursor)}")
+    return ok
+
+
+def main():
+    assert store.backend is not None, "local mongod is not reachable"
+    print("Events indexes:", ensure_indexes(store.backend.db, "events"))
+    print("Users indexes:", ensure_indexes(auth_service.users.database, "users"))
+
+    seed_events()
+    try:
+        first, last = datetime.date.today().replace(day=1), datetime.date.today()
+        results = [
+            check("events by range", store.backend.collection.find(store.backend.range_query(TEST_USER, first, last))),
+            check("events by user", store.backend.collection.find({"user_id": TEST_USER})),
+            check("event by id", store.backend.collection.find({"_id": ObjectId(), "user_id": TEST_USER})),
+            check("user by username", auth_service.users.find({"username": TEST_USER})),
+        ]
+        assert all(results), "some hot queries do not use an index"
+    finally:
+        store.backend.collection.delete_many({"user_id": TEST_USER})
+
+
+if __name__ == "__main__":
+    main()
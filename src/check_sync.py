@@ -0,0 +1,84 @@
+import os
+import time
+import datetime
+from bson.objectid import ObjectId
+
+# Needs a local single-node replica set, e.g. `mongod --replSet rs0` + `rs.initiate()`
+os.environ["MONGO_URI"] = os.getenv("LOCAL_MONGO_RS_URI", "mongodb://localhost:27017/?replicaSet=rs0&directConnection=true")
+os.environ["STORAGE_BACKEND"] = "mongo"
+os.environ["SYNC_POLL_INTERVAL_S"] = "0.5"
+
+from data.store import store
+from data.sync import utcnow
+
+TEST_USER = "sync-check-user"
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def remote_insert(title, day):
+    # Written straight to the collection, as another session/device would
+    start_at = datetime.datetime.combine(day, datetime.time(9, 0))
+    result = store.backend.collection.insert_one({
+        "user_id": TEST_USER,
+        "title": title,
+        "start": start_at.strftime("%Y-%m-%d %H:%M"),
+        "end": (start_at + datetime.timedelta(hours=1)).strftime("%Y-%m-%d %H:%M"),
+        "type": "event",
+        "recurrence": None,
+        "start_at": start_at,
+        "end_at": start_at + datetime.timedelta(hours=1),
+        "updated_at": utcnow(),
+    })
+    return str(result.inserted_id)
+
+
+def titles(day):
+    return {e["title"] for e in store.get_events_in_range(day, day)}
+
+
+def run(mode):
+    store.replica.use_change_streams = mode == "change_stream"
+    store.set_user(TEST_USER)
+    assert store.replica.ready.wait(5), "replica did not load"
+    assert store.replica.mode == mode, store.replica.mode
+
+    day = datetime.date.today()
+    notified = []
+    listener = lambda: notified.append(1)
+    store.replica.subscribe(listener)
+    try:
+        store.add_event("Local", f"{day} 08:00", f"{day} 09:00", "")
+        assert titles(day) == {"Local"}
+
+        remote_id = remote_insert("Remote", day)
+        assert wait_for(lambda: "Remote" in titles(day)), "remote insert not synced"
+
+        store.backend.collection.update_one({"_id": ObjectId(remote_id)}, {"$set": {"title": "Renamed", "updated_at": utcnow()}})
+        assert wait_for(lambda: "Renamed" in titles(day)), "remote update not synced"
+
+        store.delete_event(remote_id)
+        assert titles(day) == {"Local"}
+        assert notified, "listeners were not told about remote changes"
+        print(f"PASS: {mode}")
+    finally:
+        store.replica.unsubscribe(listener)
+        store.set_user(None)
+        store.backend.collection.delete_many({"user_id": TEST_USER})
+
+
+def main():
+    assert store.backend is not None, "local replica set is not reachable"
+    run("change_stream")
+    run("polling")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 import flet as ft
-from utils.translations import translations
+from utils.translations import Translations, Labels
 
 class AccountView(ft.Container):
-    def __init__(self, user_info, on_logout):
+    def __init__(self, user_info, on_logout, translations=None):
         super().__init__()
+        self.translations = translations or Translations()
         self.user_info = user_info
         self.on_logout = on_logout
+        self.labels = Labels(self.translations)
         self.expand = True
         self.padding = 40
         self.expand = True
@@ -38,55 +40,50 @@ class AccountView(ft.Container):
         )
 
         # Account Info Section
-        self.name_field = ft.TextField(
-            label=translations.get("name"),
+        self.name_field = self.labels.bind(ft.TextField(
             value=self.user_info.get("name", ""),
             border_color=ft.Colors.GREY_400,
             text_size=14,
             height=50,
-        )
+        ), "name", "label")
         
-        self.email_field = ft.TextField(
-            label=translations.get("email"),
+        self.email_field = self.labels.bind(ft.TextField(
             value=self.user_info.get("email", ""),
             read_only=True,
             border_color=ft.Colors.GREY_400,
             text_size=14,
             height=50,
             # bgcolor=ft.Colors.GREY_100 # Removed hardcoded color
-        )
+        ), "email", "label")
 
         # Security Section
-        self.current_password = ft.TextField(
-            label=translations.get("current_password"),
+        self.current_password = self.labels.bind(ft.TextField(
             password=True,
             can_reveal_password=True,
             border_color=ft.Colors.GREY_400,
             text_size=14,
             height=50
-        )
+        ), "current_password", "label")
         
-        self.new_password = ft.TextField(
-            label=translations.get("new_password"),
+        self.new_password = self.labels.bind(ft.TextField(
             password=True,
             can_reveal_password=True,
             border_color=ft.Colors.GREY_400,
             text_size=14,
             height=50
-        )
+        ), "new_password", "label")
         
-        self.confirm_password = ft.TextField(
-            label=translations.get("confirm_password"),
+        self.confirm_password = self.labels.bind(ft.TextField(
             password=True,
             can_reveal_password=True,
             border_color=ft.Colors.GREY_400,
             text_size=14,
             height=50
-        )
+        ), "confirm_password", "label")
 
         self.content = ft.Column(
             [
-                ft.Text(translations.get("account"), size=32, weight=ft.FontWeight.BOLD),
+                ft.Text(self.translations.get("account"), size=32, weight=ft.FontWeight.BOLD),
                 ft.Divider(height=20, color=ft.Colors.GREY_200),
                 
                 ft.Row(
@@ -122,7 +119,7 @@ class AccountView(ft.Container):
         # Re-building content to match Image 1 & 2 flow better
         self.content = ft.ListView(
             [
-                ft.Text(translations.get("account"), size=32, weight=ft.FontWeight.BOLD),
+                self.labels.bind(ft.Text(size=32, weight=ft.FontWeight.BOLD), "account"),
                 ft.Divider(height=30, color=ft.Colors.GREY_200),
                 
                 # Profile Header
@@ -163,17 +160,19 @@ class AccountView(ft.Container):
             padding=ft.padding.only(bottom=50)
         )
 
+    def relabel(self):
+        self.labels.apply()
+
     def _build_info_card(self):
         return ft.Container(
             content=ft.Column(
                 [
-                    ft.Text(translations.get("account_info"), size=18, weight=ft.FontWeight.BOLD),
+                    self.labels.bind(ft.Text(size=18, weight=ft.FontWeight.BOLD), "account_info"),
                     ft.Container(height=10),
                     self.name_field,
                     self.email_field,
                     ft.Container(height=10),
-                    ft.ElevatedButton(
-                        translations.get("save_name"),
+                    self.labels.bind(ft.ElevatedButton(
                         icon=ft.Icons.SAVE,
                         style=ft.ButtonStyle(
                             color=ft.Colors.BLUE_700,
@@ -181,7 +180,7 @@ class AccountView(ft.Container):
                             shape=ft.RoundedRectangleBorder(radius=8),
                         ),
                         on_click=lambda e: print("Save Name Clicked")
-                    )
+                    ), "save_name", "text")
                 ]
             ),
             padding=20,
@@ -194,14 +193,13 @@ class AccountView(ft.Container):
         return ft.Container(
             content=ft.Column(
                 [
-                    ft.Text(translations.get("security"), size=18, weight=ft.FontWeight.BOLD),
+                    self.labels.bind(ft.Text(size=18, weight=ft.FontWeight.BOLD), "security"),
                     ft.Container(height=10),
                     self.current_password,
                     self.new_password,
                     self.confirm_password,
                     ft.Container(height=10),
-                    ft.ElevatedButton(
-                        translations.get("change_password"),
+                    self.labels.bind(ft.ElevatedButton(
                         icon=ft.Icons.LOCK,
                         style=ft.ButtonStyle(
                             color=ft.Colors.BLUE_700,
@@ -209,7 +207,7 @@ class AccountView(ft.Container):
                             shape=ft.RoundedRectangleBorder(radius=8),
                         ),
                         on_click=lambda e: print("Change Password Clicked")
-                    )
+                    ), "change_password", "text")
                 ]
             ),
             padding=20,
@@ -222,10 +220,9 @@ class AccountView(ft.Container):
         return ft.Container(
             content=ft.Column(
                 [
-                    ft.Text(translations.get("actions"), size=18, weight=ft.FontWeight.BOLD),
+                    self.labels.bind(ft.Text(size=18, weight=ft.FontWeight.BOLD), "actions"),
                     ft.Container(height=10),
-                    ft.ElevatedButton(
-                        translations.get("logout"),
+                    self.labels.bind(ft.ElevatedButton(
                         icon=ft.Icons.LOGOUT,
                         style=ft.ButtonStyle(
                             color=ft.Colors.WHITE,
@@ -233,17 +230,16 @@ class AccountView(ft.Container):
                             shape=ft.RoundedRectangleBorder(radius=20), # Rounded as per image
                         ),
                         on_click=self.on_logout
-                    ),
+                    ), "logout", "text"),
                     ft.Container(height=5),
-                    ft.TextButton(
-                        translations.get("delete_account"),
+                    self.labels.bind(ft.TextButton(
                         icon=ft.Icons.DELETE_OUTLINE,
                         icon_color=ft.Colors.RED_400,
                         style=ft.ButtonStyle(
                             color=ft.Colors.RED_400,
                         ),
                         on_click=lambda e: print("Delete Account Clicked")
-                    )
+                    ), "delete_account", "text")
                 ]
             ),
             padding=20,
@@ -0,0 +1,189 @@
+import flet as ft
+import asyncio
+import datetime
+from data.store import store
+from components.event_details_dialog import EventDetailsDialog
+from utils.translations import Translations, Labels
+
+PAGE_SIZE = 50
+# The next page is requested once the list is scrolled this close to its end
+LOAD_AHEAD_PIXELS = 400
+
+
+class AgendaView(ft.Column):
+    """
+    Occurrences from today onwards in one chronological list, earlier ones on request.
+
+    Pages of PAGE_SIZE come from store.get_agenda_page as the list scrolls towards its
+    end, so going through a year of history only ever loads what has been scrolled past.
+    Rows are grouped under one header per day, including days split across pages.
+    """
+
+    def __init__(self, translations=None):
+        super().__init__()
+        self.translations = translations or Translations()
+        self.expand = True
+        self.filters = {"events": True, "tasks": True}
+        self.labels = Labels(self.translations)
+        self.generation = 0 # bumped by load_events(); older page fetches are dropped
+        self.loading = False
+        self.after = None # cursor of the next page forward, None when there is none
+        self.before = None # cursor of the next page back in time
+        self.day_headers = {} # date -> header control
+        self.day_rows = {} # date -> row controls
+        self.list_view = ft.ListView(expand=True, spacing=2, on_scroll=self.handle_scroll, on_scroll_interval=100)
+        self.earlier_button = self.labels.bind(
+            ft.TextButton(icon=ft.Icons.HISTORY, on_click=self.load_earlier), "show_earlier", "text"
+        )
+        self.end_text = self.labels.bind(ft.Text(size=12, color=ft.Colors.GREY, visible=False), "no_more_events")
+        self.progress = ft.ProgressBar(visible=False)
+        self.controls = [
+            ft.Row(
+                [self.labels.bind(ft.Text(size=24, weight=ft.FontWeight.BOLD), "agenda_view"), self.earlier_button],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+            ),
+            self.list_view,
+            self.progress,
+            self.end_text,
+        ]
+
+    def did_mount(self):
+        self.load_events()
+
+    def relabel(self):
+        self.labels.apply()
+        for day, header in self.day_headers.items():
+            header.content.value = self.header_label(day)
+
+    def load_events(self):
+        # Start over from today; pages still in flight belong to the previous list
+        self.generation += 1
+        self.loading = False
+        today = datetime.datetime.combine(datetime.date.today(), datetime.time.min)
+        self.after = self.before = (today, "") # "" sorts before every id, so today is included
+        self.day_headers, self.day_rows = {}, {}
+        self.list_view.controls = []
+        self.end_text.visible = False
+        self.earlier_button.disabled = False
+        self.load_page(backward=False)
+
+    def load_page(self, backward):
+        cursor = self.before if backward else self.after
+        if self.loading or cursor is None:
+            return
+        self.loading = True
+        self.progress.visible = True
+        self.page.run_task(self._fetch_page, self.generation, backward)
+
+    async def _fetch_page(self, generation, backward):
+        try:
+            if backward:
+                events, cursor = await store.aget_agenda_page(before=self.before, limit=PAGE_SIZE)
+            else:
+                events, cursor = await store.aget_agenda_page(after=self.after, limit=PAGE_SIZE)
+        except asyncio.TimeoutError:
+            print("Timed out loading agenda page")
+            events = cursor = None
+        if generation != self.generation:
+            return # The list was reset while we were fetching
+        self.loading = False
+        self.progress.visible = False
+        if events is not None:
+            if backward:
+                self.before = cursor
+                self.prepend(events[::-1])
+            else:
+                self.after = cursor
+                self.append(events)
+        self.earlier_button.disabled = self.before is None
+        self.end_text.visible = self.after is None
+        self.update()
+
+    def handle_scroll(self, e):
+        if e.max_scroll_extent is not None and e.pixels >= e.max_scroll_extent - LOAD_AHEAD_PIXELS:
+            self.load_page(backward=False)
+
+    def load_earlier(self, e):
+        self.load_page(backward=True)
+
+    # Rows
+
+    def append(self, events):
+        self.list_view.controls.extend(self._build(events, above=False))
+
+    def prepend(self, events):
+        """Insert an older page (given ascending) above the list."""
+        self.list_view.controls[:0] = self._build(events, above=True)
+
+    def _build(self, events, above):
+        # A day split between pages keeps a single header: appended rows continue under
+        # it, and rows inserted above take the header up with them
+        controls = []
+        days = []
+        for event in events:
+            day = datetime.date.fromisoformat(event["start"][:10])
+            if not days or days[-1] != day:
+                days.append(day)
+                header = self.day_headers.get(day)
+                if header is None:
+                    header = self.day_headers[day] = self.new_header(day)
+                    self.day_rows[day] = []
+                    controls.append(header)
+                elif above:
+                    self.list_view.controls.remove(header)
+                    controls.append(header)
+            row = self.new_row(event)
+            self.day_rows[day].append(row)
+            controls.append(row)
+        for day in days:
+            self._apply_filters(day)
+        return controls
+
+    def header_label(self, day):
+        months = self.translations.get("months")
+        weekdays = self.translations.get("weekdays_short")
+        return f"{weekdays[day.weekday()]}, {day.day} {months[day.month - 1]} {day.year}"
+
+    def new_header(self, day):
+        return ft.Container(
+            content=ft.Text(self.header_label(day), weight=ft.FontWeight.BOLD),
+            padding=ft.padding.only(top=12, bottom=4),
+        )
+
+    def new_row(self, event):
+        is_task = event.get("type") == "task"
+        start = event.get("start") or ""
+        end = event.get("end") or ""
+        times = f"{start[11:16]} - {end[11:16]}" if len(start) > 10 and len(end) > 10 else start[11:16]
+        return ft.Container(
+            content=ft.Row(
+                [
+                    ft.Container(width=4, height=32, bgcolor=ft.Colors.RED_400 if is_task else ft.Colors.BLUE_400, border_radius=2),
+                    ft.Text(times, size=12, width=90, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Text(event.get("title", ""), expand=True, no_wrap=True, overflow=ft.TextOverflow.ELLIPSIS),
+                ],
+                spacing=10
+            ),
+            padding=ft.padding.symmetric(horizontal=8, vertical=4),
+            border_radius=6,
+            ink=True,
+            on_click=self.handle_row_click,
+            data=event,
+        )
+
+    def handle_row_click(self, e):
+        self.page.open(EventDetailsDialog(self.page, e.control.data, on_dismiss=self.load_events))
+
+    # Filters only hide rows; loaded pages are kept
+
+    def update_filter(self, filters):
+        self.filters = filters
+        for day in self.day_rows:
+            self._apply_filters(day)
+        self.update()
+
+    def _apply_filters(self, day):
+        for row in self.day_rows[day]:
+            event = row.data
+            row.visible = self.filters.get("tasks", True) if event.get("type") == "task" else self.filters.get("events", True)
+        self.day_headers[day].visible = any(row.visible for row in self.day_rows[day])
@@ -1,184 +1,220 @@
 import flet as ft
+import asyncio
 import calendar
 import datetime
 from data.store import store
-from utils.translations import translations
+from data.recurrence import month_bounds
+from data.prefetch import Prefetcher
+from data.day_index import DayIndex
+from utils.translations import Translations
+from utils.theme import ThemeState
+from utils.render_stats import RenderStats
+from utils.control_pool import ControlPool
 from components.event_dialog import EventDialog
 from components.event_details_dialog import EventDetailsDialog
 
+# Rough pixel heights used to work out how many chips fit in a day cell
+CHIP_HEIGHT = 18 # 10pt title, 2px vertical padding, 2px column spacing
+BADGE_HEIGHT = 44 # 30px day badge, 5px margins, column spacing
+HEADER_HEIGHT = 120 # month navigation, weekday names and page padding
+DEFAULT_CHIPS_PER_CELL = 3 # before the page reports its height
+# Navigation clicks closer together than this share one fetch for where the user stops
+NAVIGATION_DEBOUNCE = 0.15 # seconds
+
+
 class MonthView(ft.Column):
-    def __init__(self, on_day_click=None):
+    def __init__(self, on_day_click=None, theme=None, translations=None):
         super().__init__()
         self.on_day_click = on_day_click
+        self.theme = theme or ThemeState()
+        self.translations = translations or Translations()
         self.expand = True
         self.current_date = datetime.date.today()
         self.filters = {"events": True, "tasks": True}
-        self.events_cache = []
+        self.day_index = DayIndex()
         self.is_loading = True # Start loading immediately, did_mount will fetch
-        self.calendar_grid = ft.Column(expand=True, spacing=1)
+        self.prefetcher = Prefetcher("grid")
+        self.chips_per_cell = DEFAULT_CHIPS_PER_CELL
+        # Every load_events() bumps the generation; a fetch only renders if it is still current
+        self.fetch_generation = 0
+        self.fetch_task = None
+        self.render_stats = RenderStats("MonthView")
+        self.render_stats.begin("build")
+        # Chips a day no longer needs wait here for the next day that needs more
+        self.chip_pool = ControlPool(self.new_chip)
+        # A stable 6x7 grid of day cells, filled in by render_calendar
+        self.day_cells = [
+            [DayCell(self.render_stats, self.chip_pool, self.handle_day_click, self.show_day_overflow, self.translations) for _ in range(7)]
+            for _ in range(6)
+        ]
+        self.week_rows = [
+            ft.Row(controls=[cell.container for cell in cells], expand=True, spacing=1)
+            for cells in self.day_cells
+        ]
+        self.calendar_grid = ft.Column(controls=self.week_rows, expand=True, spacing=1)
+        self.loading_indicator = ft.Container(
+            content=ft.ProgressRing(),
+            alignment=ft.alignment.center,
+            expand=True
+        )
+        self.calendar_grid.visible = False # Cells get their days once the first fetch lands
         self.controls = [
             self.build_header(),
-            self.calendar_grid
+            self.calendar_grid,
+            self.loading_indicator
         ]
-        self.render_calendar()
+        self.render_stats.end()
 
     def build_header(self):
-        days = translations.get("weekdays_short")
-        
         # Navigation Header
-        month_name = translations.get("months")[self.current_date.month - 1]
+        self.title_text = ft.Text(size=20, weight=ft.FontWeight.BOLD)
         nav_header = ft.Row(
             [
                 ft.IconButton(ft.Icons.CHEVRON_LEFT, on_click=self.prev_month),
-                ft.Text(f"{month_name} {self.current_date.year}", size=20, weight=ft.FontWeight.BOLD),
+                self.title_text,
                 ft.IconButton(ft.Icons.CHEVRON_RIGHT, on_click=self.next_month),
             ],
             alignment=ft.MainAxisAlignment.START
         )
 
+        self.weekday_texts = [ft.Text(size=12, weight=ft.FontWeight.BOLD, color=ft.Colors.GREY_700) for _ in range(7)]
         days_header = ft.Row(
             controls=[
                 ft.Container(
-                    content=ft.Text(day, size=12, weight=ft.FontWeight.BOLD, color=ft.Colors.GREY_700),
+                    content=text,
                     expand=True,
                     alignment=ft.alignment.center
-                ) for day in days
+                ) for text in self.weekday_texts
             ]
         )
+        self.relabel_header()
         
         return ft.Column([nav_header, days_header])
 
+    def relabel_header(self):
+        month_name = self.translations.get("months")[self.current_date.month - 1]
+        self.title_text.value = f"{month_name} {self.current_date.year}"
+        for text, day in zip(self.weekday_texts, self.translations.get("weekdays_short")):
+            text.value = day
+
+    def relabel(self):
+        # Language switch: header texts and "+N more" links change, the grid and chips stay
+        self.relabel_header()
+        self.render_calendar("relabel")
+
     def did_mount(self):
+        self.page.on_resized = self.handle_resize
         self.load_events()
 
-    def load_events(self):
-        self.is_loading = True
-        self.render_calendar() # Show loading state
-        self.page.run_task(self._fetch_events)
+    def will_unmount(self):
+        self.prefetcher.cancel()
+        self.cancel_fetch()
+        if self.page.on_resized == self.handle_resize:
+            self.page.on_resized = None
 
-    async def _fetch_events(self):
-        year = self.current_date.year
-        month = self.current_date.month
-        # Run in executor to avoid blocking main thread
-        import asyncio
-        loop = asyncio.get_running_loop()
-        self.events_cache = await loop.run_in_executor(None, store.get_events_for_month, year, month)
+    def chip_capacity(self, rows):
+        """How many chip slots a day cell has when the grid shows `rows` weeks."""
+        height = getattr(self.page, "height", None)
+        if not height:
+            return DEFAULT_CHIPS_PER_CELL
+        cell_height = (height - HEADER_HEIGHT) / rows
+        return max(1, int((cell_height - BADGE_HEIGHT) // CHIP_HEIGHT))
+
+    def handle_resize(self, e):
+        rows = sum(1 for row in self.week_rows if row.visible)
+        if rows and self.chip_capacity(rows) != self.chips_per_cell:
+            self.render_calendar("resize")
+            self.update()
+
+    def load_events(self, debounce=0):
+        """
+        Fetch and render the current month, superseding any fetch still in flight.
+
+        With `debounce`, an uncached month waits that long first, so a burst of
+        navigation clicks ends in one read for the month the user stopped at.
+        """
+        # Months already in the store cache (e.g. prefetched) render without a spinner
+        first_day, last_day = month_bounds(self.current_date.year, self.current_date.month)
+        self.is_loading = not store.has_range(first_day, last_day, projection="grid")
+        if self.is_loading:
+            self.render_calendar("navigate") # Show loading state
+        self.cancel_fetch()
+        self.fetch_generation += 1
+        self.fetch_task = self.page.run_task(
+            self._fetch_events, self.fetch_generation, debounce if self.is_loading else 0
+        )
+
+    def cancel_fetch(self):
+        if self.fetch_task is not None and not self.fetch_task.done():
+            self.fetch_task.cancel()
+        self.fetch_task = None
+
+    async def _fetch_events(self, generation=None, delay=0):
+        if delay:
+            await asyncio.sleep(delay) # A newer click cancels us here, before any I/O
+        if generation is not None and generation != self.fetch_generation:
+            return
+        first_day, last_day = month_bounds(self.current_date.year, self.current_date.month)
+        try:
+            events = await store.aget_range(first_day, last_day, projection="grid")
+        except asyncio.TimeoutError:
+            print(f"Timed out loading events for {first_day:%Y-%m}")
+            events = None
+        if generation is not None and generation != self.fetch_generation:
+            return # Superseded while reading; never render a month that is no longer shown
+        if events is not None:
+            self.day_index = DayIndex(events)
         self.is_loading = False
-        self.render_calendar()
+        self.render_calendar("events loaded")
         self.update()
+        # Warm up the neighbouring months once this one is on screen
+        previous_month = first_day - datetime.timedelta(days=1)
+        next_month = last_day + datetime.timedelta(days=1)
+        self.prefetcher.schedule([
+            month_bounds(previous_month.year, previous_month.month),
+            month_bounds(next_month.year, next_month.month),
+        ])
 
-    def render_calendar(self):
+    def render_calendar(self, interaction="render"):
+        # Cells and chips are reused across renders; only what changed is sent to the client
+        self.render_stats.begin(interaction)
+        self.loading_indicator.visible = self.is_loading
+        self.calendar_grid.visible = not self.is_loading
         if self.is_loading:
-            self.calendar_grid.controls = [
-                ft.Container(
-                    content=ft.ProgressRing(),
-                    alignment=ft.alignment.center,
-                    expand=True
-                )
-            ]
-            # Don't return here if called from init, but we need to ensure controls are set
-            # If called from init, page might not be ready, so we just set controls
+            self.render_stats.end()
             return
 
         year = self.current_date.year
         month = self.current_date.month
+        today = datetime.date.today()
+        dark = self.theme.dark
         
         # Get calendar matrix
         cal = calendar.monthcalendar(year, month)
+        # Cells hold at most this many chips; the rest of a busy day sits behind "+N more"
+        self.chips_per_cell = self.chip_capacity(len(cal))
         
-        grid_rows = []
-        for week in cal:
-            row_controls = []
-            for day in week:
-                if day == 0:
-                    # Empty day from other month
-                    row_controls.append(
-                        ft.Container(
-                            expand=True,
-                            bgcolor=ft.Colors.SURFACE if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.GREY_50,
-                            border=ft.border.all(0.5, ft.Colors.GREY_300),
-                        )
-                    )
-                else:
-                    is_today = (day == datetime.date.today().day and 
-                                month == datetime.date.today().month and 
-                                year == datetime.date.today().year)
-                    
-                    # Filter events from cache
-                    day_events = [
-                        e for e in self.events_cache 
-                        if int(e["start"].split(" ")[0].split("-")[2]) == day and 
-                        (
-                            (e.get("type") == "task" and self.filters.get("tasks", True)) or 
-                            (e.get("type") != "task" and self.filters.get("events", True))
-                        )
-                    ]
-
-                    day_content = ft.Column(
-                        controls=[
-                            ft.Container(
-                                content=ft.Text(
-                                    str(day), 
-                                    size=12, 
-                                    weight=ft.FontWeight.BOLD,
-                                    color=ft.Colors.ON_SURFACE if not is_today else ft.Colors.WHITE
-                                ),
-                                bgcolor=ft.Colors.BLUE if is_today else None,
-                                border_radius=15,
-                                padding=5,
-                                alignment=ft.alignment.center,
-                                width=30,
-                                height=30,
-                                margin=5
-                            ),
-                            # Events
-                            ft.Column(
-                                controls=[
-                                    ft.Container(
-                                        content=ft.Text(
-                                            e["title"], 
-                                            size=10, 
-                                            color=ft.Colors.WHITE, 
-                                            no_wrap=True, 
-                                            overflow=ft.TextOverflow.ELLIPSIS
-                                        ),
-                                        bgcolor=ft.Colors.RED_400 if e.get("type") == "task" else ft.Colors.BLUE_400,
-                                        border_radius=4,
-                                        padding=ft.padding.symmetric(horizontal=4, vertical=2),
-                                        width=100,
-                                        on_click=lambda e, ev=e: self.open_event_details(ev),
-                                        ink=True,
-                                    ) for e in day_events
-                                ],
-                                spacing=2
-                            )
-                        ],
-                        alignment=ft.MainAxisAlignment.START,
-                        spacing=2
-                    )
-                    
-                    row_controls.append(
-                        ft.Container(
-                            content=day_content,
-                            expand=True,
-                            bgcolor=ft.Colors.SURFACE if self.page.theme_mode == ft.ThemeMode.DARK else ft.Colors.WHITE,
-                            border=ft.border.all(0.5, ft.Colors.OUTLINE_VARIANT),
-                            padding=0,
-                            alignment=ft.alignment.top_center,
-                            on_click=lambda e, d=day, m=month, y=year: self.handle_day_click(y, m, d),
-                            ink=True
-                        )
-                    )
-            
-            grid_rows.append(
-                ft.Row(
-                    controls=row_controls,
-                    expand=True,
-                    spacing=1
-                )
-            )
-            
-        self.calendar_grid.controls = grid_rows
+        days = []
+        for row_index, (row, cells) in enumerate(zip(self.week_rows, self.day_cells)):
+            week = cal[row_index] if row_index < len(cal) else None
+            row.visible = week is not None
+            for col_index, cell in enumerate(cells):
+                day = week[col_index] if week else 0
+                date = datetime.date(year, month, day) if day else None
+                events = self.day_index.on(date, self.filters) if date else []
+                # Pool the chips this cell cannot use before any cell asks for more
+                cell.release_spares(events, self.chips_per_cell)
+                days.append((cell, date, events))
+
+        for cell, date, events in days:
+            if date is None:
+                # Empty day from other month
+                cell.show_empty(dark)
+            else:
+                cell.show_day(date, date == today, dark)
+                cell.set_events(events, self.chips_per_cell)
+            self.render_stats.reused(DayCell.CONTROLS)
+        self.render_stats.end()
 
     def prev_month(self, e):
         # Go back one month
@@ -189,12 +225,9 @@ class MonthView(ft.Column):
             year -= 1
         self.current_date = self.current_date.replace(year=year, month=month, day=1)
         
-        # Update header text
-        # Update header text
-        month_name = translations.get("months")[month - 1]
-        self.controls[0].controls[0].controls[1].value = f"{month_name} {year}"
+        self.relabel_header()
         
-        self.load_events()
+        self.load_events(debounce=NAVIGATION_DEBOUNCE)
         self.update()
 
     def next_month(self, e):
@@ -206,12 +239,9 @@ class MonthView(ft.Column):
             year += 1
         self.current_date = self.current_date.replace(year=year, month=month, day=1)
         
-        # Update header text
-        # Update header text
-        month_name = translations.get("months")[month - 1]
-        self.controls[0].controls[0].controls[1].value = f"{month_name} {year}"
+        self.relabel_header()
         
-        self.load_events()
+        self.load_events(debounce=NAVIGATION_DEBOUNCE)
         self.update()
 
     def open_event_details(self, event):
@@ -219,14 +249,184 @@ class MonthView(ft.Column):
         self.page.open(dialog)
 
     def refresh_calendar(self):
-        self.render_calendar()
+        # Re-read the month; after a write this comes from the store's cache/replica
+        self.load_events()
         self.update()
 
     def update_filter(self, filters):
+        # Cells rebind to the filtered occurrences; chips are kept or rebound, not rebuilt
         self.filters = filters
-        self.render_calendar()
+        self.render_calendar("filter")
         self.update()
 
-    def handle_day_click(self, year, month, day):
-        if self.on_day_click:
-            self.on_day_click(datetime.date(year, month, day))
+    def show_day_overflow(self, date):
+        # The day's full list is only built when someone asks to see it
+        events = self.day_index.on(date, self.filters)
+        dialog = ft.AlertDialog(
+            title=ft.Text(date.strftime("%d.%m.%Y")),
+            content=ft.Container(
+                content=ft.ListView(
+                    controls=[
+                        ft.ListTile(
+                            leading=ft.Icon(
+                                ft.Icons.CHECK_BOX_OUTLINED if e.get("type") == "task" else ft.Icons.EVENT,
+                                color=ft.Colors.RED_400 if e.get("type") == "task" else ft.Colors.BLUE_400
+                            ),
+                            title=ft.Text(e["title"], no_wrap=True, overflow=ft.TextOverflow.ELLIPSIS),
+                            subtitle=ft.Text((e.get("start") or "")[11:16]),
+                            dense=True,
+                            on_click=lambda _, ev=e: self.open_overflow_event(dialog, ev),
+                        ) for e in events
+                    ],
+                ),
+                width=320,
+                height=min(400, 56 * len(events)),
+            ),
+        )
+        self.page.open(dialog)
+
+    def open_overflow_event(self, dialog, event):
+        self.page.close(dialog)
+        self.open_event_details(event)
+
+    def new_chip(self):
+        # One shared handler for all chips; the event is read from the chip's data
+        return ft.Container(
+            content=ft.Text(
+                size=10, 
+                color=ft.Colors.WHITE, 
+                no_wrap=True, 
+                overflow=ft.TextOverflow.ELLIPSIS
+            ),
+            border_radius=4,
+            padding=ft.padding.symmetric(horizontal=4, vertical=2),
+            width=100,
+            on_click=self.handle_chip_click,
+            ink=True,
+        )
+
+    def handle_chip_click(self, e):
+        self.open_event_details(e.control.data)
+
+    def handle_day_click(self, date):
+        if self.on_day_click and date is not None:
+            self.on_day_click(date)
+
+
+class DayCell:
+    """One day of the month grid; its controls live as long as the MonthView."""
+
+    CONTROLS = 7 # container, column, day badge, day number, chip column, "+N more" and its text
+    CHIP_CONTROLS = 2 # container, title
+
+    def __init__(self, stats, chip_pool, on_day_click, on_more_click, translations):
+        self.stats = stats
+        self.translations = translations
+        self.chip_pool = chip_pool
+        self.date = None
+        self.chips = {} # (event id, start) -> chip container
+        self.more_text = ft.Text(size=10, weight=ft.FontWeight.BOLD, color=ft.Colors.ON_SURFACE_VARIANT)
+        self.more = ft.Container(
+            content=self.more_text,
+            padding=ft.padding.symmetric(horizontal=4, vertical=2),
+            on_click=lambda e: on_more_click(self.date),
+            visible=False
+        )
+        self.day_number = ft.Text(size=12, weight=ft.FontWeight.BOLD)
+        self.badge = ft.Container(
+            content=self.day_number,
+            border_radius=15,
+            padding=5,
+            alignment=ft.alignment.center,
+            width=30,
+            height=30,
+            margin=5
+        )
+        self.chip_column = ft.Column(spacing=2)
+        self.content = ft.Column(
+            controls=[self.badge, self.chip_column, self.more],
+            alignment=ft.MainAxisAlignment.START,
+            spacing=2
+        )
+        self.container = ft.Container(
+            content=self.content,
+            expand=True,
+            padding=0,
+            alignment=ft.alignment.top_center,
+            on_click=lambda e: on_day_click(self.date),
+            ink=True
+        )
+        stats.created(self.CONTROLS)
+
+    def show_empty(self, dark):
+        self.date = None
+        self.content.visible = False
+        self.container.bgcolor = ft.Colors.SURFACE if dark else ft.Colors.GREY_50
+        self.container.border = ft.border.all(0.5, ft.Colors.GREY_300)
+        self.container.ink = False
+        self.release_spares([], 0)
+        self.set_events([], 0)
+
+    def show_day(self, date, is_today, dark):
+        self.date = date
+        self.content.visible = True
+        self.day_number.value = str(date.day)
+        self.day_number.color = ft.Colors.WHITE if is_today else ft.Colors.ON_SURFACE
+        self.badge.bgcolor = ft.Colors.BLUE if is_today else None
+        self.container.bgcolor = ft.Colors.SURFACE if dark else ft.Colors.WHITE
+        self.container.border = ft.border.all(0.5, ft.Colors.OUTLINE_VARIANT)
+        self.container.ink = True
+
+    @staticmethod
+    def shown(events, capacity):
+        """The occurrences that get a chip: all of them if they fit, else one slot goes to "+N more"."""
+        return events if len(events) <= capacity else events[:capacity - 1]
+
+    def release_spares(self, events, capacity):
+        """Give the pool every chip beyond those `events` can keep or rebind."""
+        wanted = {(e.get("id"), e.get("start")) for e in self.shown(events, capacity)}
+        spare = [key for key in self.chips if key not in wanted]
+        needed = len(wanted - set(self.chips))
+        for key in spare[needed:]:
+            chip = self.chips.pop(key)
+            chip.data = None
+            self.chip_pool.release(chip)
+            self.stats.removed(self.CHIP_CONTROLS)
+
+    def set_events(self, events, capacity):
+        """
+        Bind `events` to the day's chips, at most `capacity` slots of them. A chip already
+        showing an occurrence keeps it; the other chips of this day are rebound in place
+        (e.g. after navigating), then pooled chips are used, and only then new ones are
+        created. Spare chips go back to the pool.
+        """
+        shown = self.shown(events, capacity)
+        hidden = len(events) - len(shown)
+        self.more.visible = hidden > 0
+        self.more_text.value = self.translations.get("more_events").format(count=hidden) if hidden else ""
+        keyed = [((e.get("id"), e.get("start")), e) for e in shown]
+        wanted = {key for key, _ in keyed}
+        spare = [chip for key, chip in self.chips.items() if key not in wanted]
+        chips = {}
+        for key, e in keyed:
+            chip = self.chips.get(key)
+            if chip is None and spare:
+                chip = spare.pop()
+            if chip is None:
+                if len(self.chip_pool):
+                    self.stats.reused(self.CHIP_CONTROLS)
+                else:
+                    self.stats.created(self.CHIP_CONTROLS)
+                chip = self.chip_pool.acquire()
+            else:
+                self.stats.reused(self.CHIP_CONTROLS)
+            chip.data = e
+            chip.content.value = e["title"]
+            chip.bgcolor = ft.Colors.RED_400 if e.get("type") == "task" else ft.Colors.BLUE_400
+            chips[key] = chip
+        for chip in spare:
+            chip.data = None
+            self.chip_pool.release(chip)
+        self.stats.removed(len(spare) * self.CHIP_CONTROLS)
+        self.chips = chips
+        self.chip_column.controls = list(chips.values())
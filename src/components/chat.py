@@ -95,7 +95,7 @@ class ChatWidget(ft.Column):
         if update:
             self.update()
 
-    def send_message(self, e):
+    async def send_message(self, e):
         text = self.input_field.value
         if not text:
             return
@@ -105,9 +105,9 @@ class ChatWidget(ft.Column):
         self.update()
         
         # Process command
-        self.process_command(text)
+        await self.process_command(text)
 
-    def process_command(self, text):
+    async def process_command(self, text):
         # Enhanced parsing logic
         try:
             title = "New Event"
@@ -153,7 +153,7 @@ class ChatWidget(ft.Column):
             event_type = "task" if "remind" in lower_text or "task" in lower_text else "event"
             
             # Create event
-            store.add_event(
+            await store.aadd_event(
                 title=title.title(),
                 start_date=start_str,
                 end_date=start_str,
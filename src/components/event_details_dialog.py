@@ -1,4 +1,5 @@
 import flet as ft
+import asyncio
 from data.store import store
 
 class EventDetailsDialog(ft.AlertDialog):
@@ -6,6 +7,10 @@ class EventDetailsDialog(ft.AlertDialog):
         self.page_ref = page
         self.event = event
         self.on_dismiss_callback = on_dismiss
+        # Grid events carry only what the month view draws; the rest loads once the dialog is open
+        self.description_text = ft.Text(
+            self._description_label(event) if "description" in event else "Description: Loading..."
+        )
         
         super().__init__(
             modal=True,
@@ -13,7 +18,7 @@ class EventDetailsDialog(ft.AlertDialog):
             content=ft.Column(
                 [
                     ft.Text(f"Date: {event['start']}"),
-                    ft.Text(f"Description: {event['description'] or 'No description'}"),
+                    self.description_text,
                 ],
                 width=400,
                 height=200,
@@ -26,8 +31,26 @@ class EventDetailsDialog(ft.AlertDialog):
             actions_alignment=ft.MainAxisAlignment.END,
         )
 
-    def delete_event(self, e):
-        store.delete_event(self.event["id"])
+    def _description_label(self, event):
+        return f"Description: {event.get('description') or 'No description'}"
+
+    def did_mount(self):
+        if "description" not in self.event:
+            self.page_ref.run_task(self._load_details)
+
+    async def _load_details(self):
+        try:
+            details = await store.aget_event(self.event["id"])
+        except asyncio.TimeoutError:
+            details = None
+        self.description_text.value = self._description_label(details or {})
+        self.description_text.update()
+
+    async def delete_event(self, e):
+        try:
+            await store.adelete_event(self.event["id"])
+        except asyncio.TimeoutError:
+            print(f"Timed out deleting event {self.event['id']}")
         self.page_ref.close(self)
         self.page_ref.update()
         if self.on_dismiss_callback:
@@ -1,4 +1,5 @@
 import flet as ft
+import asyncio
 import datetime
 from data.store import store
 
@@ -96,7 +97,7 @@ class EventDialog(ft.AlertDialog):
         if self.on_dismiss_callback:
             self.on_dismiss_callback()
 
-    def save_event(self, e):
+    async def save_event(self, e):
         if not self.title_field.value:
             self.title_field.error_text = "Title is required"
             self.title_field.update()
@@ -120,12 +121,17 @@ class EventDialog(ft.AlertDialog):
         start_dt = f"{self.date_field.value} {self.start_time_field.value}"
         end_dt = f"{self.date_field.value} {self.end_time_field.value}"
             
-        store.add_event(
-            title=self.title_field.value,
-            start_date=start_dt,
-            end_date=end_dt,
-            description=self.description_field.value,
-            event_type="task" if self.is_task_checkbox.value else "event",
-            recurrence=self.recurrence_dropdown.value if self.recurrence_dropdown.value != "none" else None
-        )
+        try:
+            await store.aadd_event(
+                title=self.title_field.value,
+                start_date=start_dt,
+                end_date=end_dt,
+                description=self.description_field.value,
+                event_type="task" if self.is_task_checkbox.value else "event",
+                recurrence=self.recurrence_dropdown.value if self.recurrence_dropdown.value != "none" else None
+            )
+        except asyncio.TimeoutError:
+            self.title_field.error_text = "Saving timed out, please try again"
+            self.title_field.update()
+            return
         self.close_dialog(e)
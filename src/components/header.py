@@ -1,9 +1,13 @@
 import flet as ft
+from utils.theme import ThemeState
+from utils.translations import Translations
 
 class Header(ft.AppBar):
-    def __init__(self, page: ft.Page, on_account_click, on_language_change=None, on_menu_click=None, on_theme_change=None):
+    def __init__(self, page: ft.Page, on_account_click, on_language_change=None, on_menu_click=None, on_theme_change=None, theme=None, translations=None):
         super().__init__()
         self.page_ref = page
+        self.theme = theme or ThemeState(page.theme_mode)
+        self.translations = translations or Translations()
         self.on_account_click = on_account_click
         self.on_language_change = on_language_change
         self.on_theme_change = on_theme_change
@@ -18,6 +22,7 @@ class Header(ft.AppBar):
             ft.IconButton(
                 icon=ft.Icons.DARK_MODE_OUTLINED,
                 selected_icon=ft.Icons.LIGHT_MODE_OUTLINED,
+                selected=self.theme.dark,
                 on_click=self.toggle_theme,
                 tooltip="Toggle Theme"
             ),
@@ -41,8 +46,8 @@ class Header(ft.AppBar):
     def toggle_theme(self, e):
         e.control.selected = not e.control.selected
         self.page_ref.theme_mode = ft.ThemeMode.DARK if e.control.selected else ft.ThemeMode.LIGHT
+        self.theme.set_mode(self.page_ref.theme_mode) # Views re-skin in place
         self.page_ref.update()
-        e.control.update()
         if self.on_theme_change:
             self.on_theme_change()
 
@@ -62,11 +67,9 @@ class Header(ft.AppBar):
         self.page_ref.open(dialog)
 
     def show_settings(self, e):
-        from utils.translations import translations
-        
         def change_language(e):
             lang_code = e.control.value
-            translations.set_language(lang_code)
+            self.translations.set_language(lang_code) # Views re-label in place
             self.page_ref.client_storage.set("language", lang_code)
             if self.on_language_change:
                 self.on_language_change()
@@ -74,7 +77,7 @@ class Header(ft.AppBar):
 
         lang_dropdown = ft.Dropdown(
             label="Language",
-            value=translations.current_language,
+            value=self.translations.current_language,
             options=[
                 ft.dropdown.Option("en", "English"),
                 ft.dropdown.Option("ru", "Russian"),
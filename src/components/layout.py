@@ -1,25 +1,34 @@
 import flet as ft
 import flet as ft
+from data.store import store
+from utils.translations import Translations
+from utils.theme import ThemeState
 from components.sidebar import Sidebar
 from components.calendar import MonthView
 from components.day_view import DayView
 from components.week_view import WeekView
+from components.agenda_view import AgendaView
 from components.account_view import AccountView
 
 class AppLayout(ft.Row):
-    def __init__(self, page: ft.Page, user_info: dict, on_logout):
+    def __init__(self, page: ft.Page, user_info: dict, on_logout, translations=None):
         super().__init__()
         self.page = page
         self.user_info = user_info
         self.on_logout = on_logout
         self.expand = True
         self.spacing = 0
+        # This page's light/dark mode and language, shared with the header that switches them
+        self.theme = ThemeState(page.theme_mode)
+        self.translations = translations or Translations()
         
         # Sidebar
         self.sidebar = ft.Container(
             content=Sidebar(
                 on_view_change=self.set_view,
-                on_filter_change=self.refresh_active_view
+                on_filter_change=self.update_filters,
+                on_day_click=self.go_to_day,
+                translations=self.translations
             ),
             width=250,
             bgcolor=ft.Colors.SURFACE,
@@ -29,10 +38,11 @@ class AppLayout(ft.Row):
         self.filters = {"events": True, "tasks": True}
         
         # Views
-        self.month_view = MonthView(on_day_click=self.go_to_day)
-        self.day_view = DayView()
+        self.month_view = MonthView(on_day_click=self.go_to_day, theme=self.theme, translations=self.translations)
+        self.day_view = DayView(translations=self.translations)
         self.week_view = WeekView()
-        self.account_view = AccountView(self.user_info, self.on_logout)
+        self.agenda_view = AgendaView(translations=self.translations)
+        self.account_view = AccountView(self.user_info, self.on_logout, translations=self.translations)
 
         # Main Content Area
         self.content_area = ft.Container(
@@ -47,6 +57,31 @@ class AppLayout(ft.Row):
             self.content_area
         ]
 
+    def did_mount(self):
+        # Changes made from other sessions/devices arrive through the store's sync
+        store.replica.subscribe(self.refresh_active_view)
+        self.translations.subscribe(self.relabel)
+        self.theme.subscribe(self.reskin)
+
+    def will_unmount(self):
+        store.replica.unsubscribe(self.refresh_active_view)
+        self.translations.unsubscribe(self.relabel)
+        self.theme.unsubscribe(self.reskin)
+
+    def relabel(self):
+        # Language switch: views re-label their existing controls, keeping loaded events and scroll positions
+        self.sidebar.content.relabel()
+        self.month_view.relabel()
+        self.agenda_view.relabel()
+        self.account_view.relabel()
+        self.update()
+
+    def reskin(self):
+        # Theme colours (SURFACE, ON_SURFACE, ...) follow page.theme_mode by themselves;
+        # only the month grid picks colours by mode, so its cells are re-rendered in place
+        self.month_view.render_calendar("theme")
+        self.update()
+
     def set_view(self, view_name):
         if view_name == "Month":
             self.content_area.content = self.month_view
@@ -56,6 +91,9 @@ class AppLayout(ft.Row):
         elif view_name == "Week":
             self.week_view.render_view() # Refresh
             self.content_area.content = self.week_view
+        elif view_name == "Agenda":
+            self.agenda_view.filters = self.filters
+            self.content_area.content = self.agenda_view # Loads its first page when mounted
         elif view_name == "Account":
             if self.account_view:
                 self.content_area.content = self.account_view
@@ -69,22 +107,23 @@ class AppLayout(ft.Row):
         self.sidebar.update()
 
     def update_filters(self, filters):
+        # Filters only change what is shown; the loaded events are reused
         self.filters = filters
-        self.refresh_active_view()
-
-    def refresh_active_view(self):
-        # Re-render the current view
         if self.content_area.content == self.month_view:
             self.month_view.update_filter(self.filters) # This triggers render
-        elif self.content_area.content == self.week_view:
-            self.week_view.filters = self.filters
-            self.week_view.render_view()
-            self.week_view.update()
-        elif self.content_area.content == self.day_view:
-            self.day_view.filters = self.filters
-            self.day_view.render_view()
-            self.day_view.update()
-        self.content_area.update()
+        elif self.content_area.content == self.agenda_view:
+            self.agenda_view.update_filter(self.filters)
+        elif self.content_area.content in (self.week_view, self.day_view):
+            self.content_area.content.filters = self.filters
+            self.content_area.content.render_view()
+            self.content_area.content.update()
+
+    def refresh_active_view(self):
+        # Re-read the current view's events, e.g. after changes from another session
+        self.sidebar.content.load_density()
+        if self.content_area.content in (self.month_view, self.week_view, self.day_view, self.agenda_view):
+            self.content_area.content.filters = self.filters
+            self.content_area.content.load_events()
 
     def toggle_sidebar(self):
         # self.sidebar.visible = not self.sidebar.visible
@@ -1,18 +1,22 @@
 import flet as ft
+import asyncio
 import datetime
 import calendar
+from data.store import store
 from components.event_dialog import EventDialog
-from utils.translations import translations
+from utils.translations import Translations, Labels
 
 class Sidebar(ft.Container):
-    def __init__(self, on_view_change=None, on_filter_change=None, on_refresh=None):
+    def __init__(self, on_view_change=None, on_filter_change=None, on_refresh=None, on_day_click=None, translations=None):
         super().__init__()
+        self.translations = translations or Translations()
         self.on_view_change = on_view_change
+        self.on_day_click = on_day_click
         self.on_filter_change = on_filter_change
         self.on_refresh = on_refresh
         self.width = 250
         self.padding = 10
-        self.current_date = datetime.date.today()
+        self.labels = Labels(self.translations)
         self.content = ft.Column(
             controls=[
                 self.build_create_button(),
@@ -28,9 +32,10 @@ class Sidebar(ft.Container):
     def build_view_switcher(self):
         return ft.Column(
             [
-                ft.TextButton(translations.get("month_view"), on_click=lambda e: self.on_view_change("Month") if self.on_view_change else None, icon=ft.Icons.CALENDAR_MONTH),
-                ft.TextButton(translations.get("week_view"), on_click=lambda e: self.on_view_change("Week") if self.on_view_change else None, icon=ft.Icons.VIEW_WEEK),
-                ft.TextButton(translations.get("day_view"), on_click=lambda e: self.on_view_change("Day") if self.on_view_change else None, icon=ft.Icons.TODAY),
+                self.labels.bind(ft.TextButton(on_click=lambda e: self.on_view_change("Month") if self.on_view_change else None, icon=ft.Icons.CALENDAR_MONTH), "month_view", "text"),
+                self.labels.bind(ft.TextButton(on_click=lambda e: self.on_view_change("Week") if self.on_view_change else None, icon=ft.Icons.VIEW_WEEK), "week_view", "text"),
+                self.labels.bind(ft.TextButton(on_click=lambda e: self.on_view_change("Day") if self.on_view_change else None, icon=ft.Icons.TODAY), "day_view", "text"),
+                self.labels.bind(ft.TextButton(on_click=lambda e: self.on_view_change("Agenda") if self.on_view_change else None, icon=ft.Icons.VIEW_AGENDA), "agenda_view", "text"),
             ]
         )
 
@@ -39,7 +44,7 @@ class Sidebar(ft.Container):
             content=ft.Row(
                 [
                     ft.Icon(ft.Icons.ADD, color=ft.Colors.ON_PRIMARY_CONTAINER),
-                    ft.Text(translations.get("create"), color=ft.Colors.ON_PRIMARY_CONTAINER, weight=ft.FontWeight.W_500),
+                    self.labels.bind(ft.Text(color=ft.Colors.ON_PRIMARY_CONTAINER, weight=ft.FontWeight.W_500), "create"),
                 ],
                 alignment=ft.MainAxisAlignment.CENTER,
             ),
@@ -66,45 +71,121 @@ class Sidebar(ft.Container):
             e.page.update()
 
     def build_mini_calendar(self):
-        # Simple static mini calendar for now
-        today = datetime.date.today()
-        cal = calendar.monthcalendar(today.year, today.month)
-        
-        month_name = translations.get("months")[today.month - 1]
-        
-        rows = [
-            ft.Text(f"{month_name} {today.year}", weight=ft.FontWeight.BOLD, size=14),
-            ft.Row([ft.Text(d, size=10, width=20, text_align=ft.TextAlign.CENTER) for d in ["S", "M", "T", "W", "T", "F", "S"]], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
+        # A fixed 6x7 grid rebound per month; shading shows how busy each day is
+        self.mini_month = datetime.date.today().replace(day=1)
+        self.mini_counts = {} # date -> {"events": n, "tasks": n} for mini_month
+        self.mini_title = ft.Text(weight=ft.FontWeight.BOLD, size=14, expand=True)
+        self.mini_weekdays = [ft.Text(size=10, width=20, text_align=ft.TextAlign.CENTER) for _ in range(7)]
+        self.mini_days = [
+            [
+                ft.Container(
+                    content=ft.Text(size=10),
+                    width=20,
+                    height=20,
+                    border_radius=10,
+                    alignment=ft.alignment.center,
+                    on_click=self.handle_mini_day_click,
+                ) for _ in range(7)
+            ] for _ in range(6)
         ]
-        
-        for week in cal:
-            week_row = []
-            for day in week:
-                if day == 0:
-                    week_row.append(ft.Container(width=20))
+        self.mini_rows = [ft.Row(cells, alignment=ft.MainAxisAlignment.SPACE_BETWEEN) for cells in self.mini_days]
+        self.relabel_mini_calendar()
+        self.render_mini_calendar()
+
+        header = ft.Row(
+            [
+                self.mini_title,
+                ft.IconButton(ft.Icons.CHEVRON_LEFT, icon_size=16, on_click=self.prev_mini_month),
+                ft.IconButton(ft.Icons.CHEVRON_RIGHT, icon_size=16, on_click=self.next_mini_month),
+            ],
+            spacing=0
+        )
+        return ft.Column(
+            [header, ft.Row(self.mini_weekdays, alignment=ft.MainAxisAlignment.SPACE_BETWEEN)] + self.mini_rows,
+            spacing=5
+        )
+
+    def relabel_mini_calendar(self):
+        self.mini_title.value = f"{self.translations.get('months')[self.mini_month.month - 1]} {self.mini_month.year}"
+        for text, day in zip(self.mini_weekdays, self.translations.get("weekdays_short")):
+            text.value = day[0]
+
+    def render_mini_calendar(self):
+        today = datetime.date.today()
+        year, month = self.mini_month.year, self.mini_month.month
+        cal = calendar.monthcalendar(year, month)
+        for row_index, (row, cells) in enumerate(zip(self.mini_rows, self.mini_days)):
+            week = cal[row_index] if row_index < len(cal) else None
+            row.visible = week is not None
+            for col_index, cell in enumerate(cells):
+                day = week[col_index] if week else 0
+                date = datetime.date(year, month, day) if day else None
+                counts = self.mini_counts.get(date) if date else None
+                busy = counts["events"] + counts["tasks"] if counts else 0
+                cell.data = date
+                cell.content.value = str(day) if day else ""
+                cell.content.color = ft.Colors.ON_PRIMARY if date == today else None
+                if date == today:
+                    cell.bgcolor = ft.Colors.PRIMARY
+                elif busy:
+                    # Heat shading: one occurrence is a light tint, four or more the darkest
+                    cell.bgcolor = ft.Colors.with_opacity(0.15 * min(busy, 4), ft.Colors.PRIMARY)
                 else:
-                    is_today = day == self.current_date.day and self.current_date.month == datetime.date.today().month and self.current_date.year == datetime.date.today().year
-                    week_row.append(
-                        ft.Container(
-                            content=ft.Text(str(day), size=10, color=ft.Colors.ON_PRIMARY if is_today else None),
-                            width=20,
-                            height=20,
-                            bgcolor=ft.Colors.PRIMARY if is_today else None,
-                            border_radius=10,
-                            alignment=ft.alignment.center,
-                        )
-                    )
-            rows.append(ft.Row(week_row, alignment=ft.MainAxisAlignment.SPACE_BETWEEN))
-
-        return ft.Column(rows, spacing=5)
+                    cell.bgcolor = None
+                cell.tooltip = (
+                    f"{self.translations.get('events')}: {counts['events']}, {self.translations.get('tasks')}: {counts['tasks']}"
+                    if counts else None
+                )
+
+    def did_mount(self):
+        self.load_density()
+
+    def load_density(self):
+        self.page.run_task(self._fetch_density)
+
+    async def _fetch_density(self):
+        month = self.mini_month
+        try:
+            counts = await store.aget_day_counts(month.year, month.month)
+        except asyncio.TimeoutError:
+            print(f"Timed out counting events for {month:%Y-%m}")
+            return
+        if month != self.mini_month:
+            return # User moved on while we were counting
+        self.mini_counts = counts
+        self.render_mini_calendar()
+        self.update()
+
+    def show_mini_month(self, month):
+        self.mini_month = month
+        self.mini_counts = {}
+        self.relabel_mini_calendar()
+        self.render_mini_calendar()
+        self.update()
+        self.load_density()
+
+    def prev_mini_month(self, e):
+        self.show_mini_month((self.mini_month - datetime.timedelta(days=1)).replace(day=1))
+
+    def next_mini_month(self, e):
+        self.show_mini_month((self.mini_month + datetime.timedelta(days=31)).replace(day=1))
+
+    def handle_mini_day_click(self, e):
+        if self.on_day_click and e.control.data is not None:
+            self.on_day_click(e.control.data)
+
+    def relabel(self):
+        self.labels.apply()
+        self.relabel_mini_calendar()
+        self.render_mini_calendar() # tooltips
 
     def build_my_calendars(self):
-        self.events_checkbox = ft.Checkbox(label=translations.get("events"), value=True, on_change=self.trigger_filter)
-        self.tasks_checkbox = ft.Checkbox(label=translations.get("tasks"), value=True, on_change=self.trigger_filter)
+        self.events_checkbox = self.labels.bind(ft.Checkbox(value=True, on_change=self.trigger_filter), "events", "label")
+        self.tasks_checkbox = self.labels.bind(ft.Checkbox(value=True, on_change=self.trigger_filter), "tasks", "label")
         
         return ft.Column(
             controls=[
-                ft.Text(translations.get("my_calendars"), weight=ft.FontWeight.BOLD),
+                self.labels.bind(ft.Text(weight=ft.FontWeight.BOLD), "my_calendars"),
                 self.events_checkbox,
                 self.tasks_checkbox,
             ]
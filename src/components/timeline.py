@@ -0,0 +1,261 @@
+import flet as ft
+from utils.render_stats import RenderStats
+from utils.control_pool import ControlPool
+from utils.event_layout import event_span, layout_cache
+
+PIXELS_PER_HOUR = 60
+TOTAL_HEIGHT = 24 * PIXELS_PER_HOUR
+TIME_COLUMN_WIDTH = 50
+# Cards are materialized this far above and below the visible window
+WINDOW_MARGIN = 2 * PIXELS_PER_HOUR
+DEFAULT_VIEWPORT = 800
+
+
+def _px(minutes):
+    return minutes / 60 * PIXELS_PER_HOUR
+
+
+class ClusterView:
+    """
+    One cluster of overlapping events: a positioned row of equal-width lanes.
+
+    The row splits the column width between lanes itself, so events get their share
+    of the day without the timeline having to know how wide a day column is.
+    """
+
+    def __init__(self):
+        self.row = ft.Row(spacing=2, vertical_alignment=ft.CrossAxisAlignment.START)
+        self.container = ft.Container(content=self.row, left=2, right=2)
+        self.lanes = [] # Stacks, one per lane, grown on demand and kept
+        self.cards = {} # key -> card currently in a lane
+
+
+class TimelineColumn:
+    """One day of a Timeline: hour lines built once, clusters and cards bound per render."""
+
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.lines = [
+            ft.Container(height=1, bgcolor=ft.Colors.GREY_200, top=hour * PIXELS_PER_HOUR, left=0, right=0)
+            for hour in range(24)
+        ]
+        self.stack = ft.Stack(controls=list(self.lines), height=TOTAL_HEIGHT)
+        self.container = ft.Container(
+            content=self.stack,
+            expand=True,
+            border=ft.border.all(0.5, ft.Colors.GREY_200)
+        )
+        self.clusters = [] # layout for the bound day, shared through layout_cache
+        self.events = {} # key -> occurrence, for the current data behind each box
+        self.views = [] # ClusterViews currently in the stack, in cluster order
+
+    @property
+    def cards(self):
+        return {key: card for view in self.views for key, card in view.cards.items()}
+
+    def set_events(self, date, version, events):
+        self.clusters = layout_cache.get(date, version, events)
+        self.events = {(e.get("id"), e.get("start")): e for e in events}
+
+    def visible(self, window_top, window_bottom):
+        """(cluster, boxes) for the clusters and boxes that reach into the window."""
+        plan = []
+        for cluster in self.clusters:
+            if _px(cluster.start) >= window_bottom or _px(cluster.end) <= window_top:
+                continue
+            boxes = [b for b in cluster.boxes if _px(b.start) < window_bottom and _px(b.end) > window_top]
+            plan.append((cluster, boxes))
+        return plan
+
+    def release_spares(self, plan):
+        """Pool the clusters and cards beyond those the visible plan can keep or rebind."""
+        for view in self.views[len(plan):]:
+            for card in view.cards.values():
+                self.timeline.release_card(card)
+            view.cards = {}
+            self.timeline.release_cluster(view)
+        del self.views[len(plan):]
+        for view, (cluster, boxes) in zip(self.views, plan):
+            wanted = {box.key for box in boxes}
+            spare = [key for key in view.cards if key not in wanted]
+            needed = len(wanted - set(view.cards))
+            for key in spare[needed:]:
+                self.timeline.release_card(view.cards.pop(key))
+
+    def bind(self, plan):
+        timeline = self.timeline
+        while len(self.views) < len(plan):
+            self.views.append(timeline.acquire_cluster())
+        for view, (cluster, boxes) in zip(self.views, plan):
+            top = _px(cluster.start)
+            view.container.top = top
+            view.container.height = _px(cluster.end) - top
+            while len(view.lanes) < cluster.lanes:
+                view.lanes.append(ft.Stack(expand=True))
+                timeline.render_stats.created(1)
+            lanes = view.lanes[:cluster.lanes]
+            for lane in lanes:
+                lane.height = view.container.height
+                lane.controls = []
+            wanted = {box.key for box in boxes}
+            spare = [card for key, card in view.cards.items() if key not in wanted]
+            cards = {}
+            for box in boxes:
+                card = view.cards.get(box.key)
+                if card is None:
+                    card = spare.pop() if spare else None
+                if card is None:
+                    card = timeline.acquire_card()
+                else:
+                    timeline.render_stats.reused(Timeline.CARD_CONTROLS)
+                timeline.bind_card(card, self.events[box.key], _px(box.start) - top, _px(box.end - box.start))
+                lanes[box.lane].controls.append(card)
+                cards[box.key] = card
+            for card in spare:
+                timeline.release_card(card)
+            view.cards = cards
+            view.row.controls = lanes
+        self.stack.controls = self.lines + [view.container for view in self.views]
+
+
+class Timeline(ft.Column):
+    """
+    Scrollable hour grid with one column per day.
+
+    The time column and every column's hour lines are built once. show() only binds
+    event cards, and only for the part of the day inside the scroll window (plus a
+    margin); scrolling materializes the rest. Cards leaving the window go back to a
+    pool and are rebound to whatever scrolls in.
+
+    Placement comes from utils.event_layout: overlapping events share a cluster row
+    and split its width, and each day's layout is computed once per version of its
+    events, whichever view asks first.
+    """
+
+    CARD_CONTROLS = 4 # container, column, title, time
+    CLUSTER_CONTROLS = 2 # container, row; lanes are counted as they are added
+
+    def __init__(self, days=1, detailed=False, on_event_click=None):
+        super().__init__()
+        self.expand = True
+        self.spacing = 0
+        self.scroll = ft.ScrollMode.AUTO
+        self.on_scroll = self.handle_scroll
+        self.on_scroll_interval = 50
+        self.detailed = detailed # Day view cards also show their times
+        self.on_event_click = on_event_click
+        self.scroll_top = 0
+        self.viewport = None
+        self.render_stats = RenderStats("Timeline")
+        self.render_stats.begin("build")
+        self.card_pool = ControlPool(self.new_card)
+        self.cluster_pool = ControlPool(ClusterView)
+        self.time_column = ft.Column(
+            controls=[
+                ft.Container(
+                    content=ft.Text(f"{hour:02d}:00", size=10, color=ft.Colors.GREY),
+                    height=PIXELS_PER_HOUR,
+                    alignment=ft.alignment.top_right,
+                    padding=ft.padding.only(right=5)
+                ) for hour in range(24)
+            ],
+            spacing=0,
+            width=TIME_COLUMN_WIDTH
+        )
+        self.columns = [TimelineColumn(self) for _ in range(days)]
+        self.controls = [
+            ft.Row(
+                controls=[self.time_column] + [column.container for column in self.columns],
+                spacing=0,
+                vertical_alignment=ft.CrossAxisAlignment.START
+            )
+        ]
+        self.render_stats.created(1 + 24 * 2 + 1 + days * (24 + 2))
+        self.render_stats.end()
+
+    def show(self, day_index, dates, filters=None, interaction="show"):
+        """Bind the occurrences of one date per column."""
+        self.render_stats.begin(interaction)
+        for column, date in zip(self.columns, dates):
+            column.set_events(date, day_index.version(date, filters), day_index.on(date, filters))
+        self._materialize()
+        self.render_stats.end()
+
+    def handle_scroll(self, e):
+        self.scroll_top = e.pixels or 0
+        self.viewport = e.viewport_dimension
+        self.render_stats.begin("scroll")
+        self._materialize()
+        self.render_stats.end()
+        self.update()
+
+    def window(self):
+        viewport = self.viewport
+        if not viewport:
+            viewport = self.page.height if self.page is not None and self.page.height else DEFAULT_VIEWPORT
+        return max(0, self.scroll_top - WINDOW_MARGIN), self.scroll_top + viewport + WINDOW_MARGIN
+
+    def _materialize(self):
+        window_top, window_bottom = self.window()
+        visible = [column.visible(window_top, window_bottom) for column in self.columns]
+        # Two passes so a column that needs more cards finds the ones others gave up
+        for column, placements in zip(self.columns, visible):
+            column.release_spares(placements)
+        for column, placements in zip(self.columns, visible):
+            column.bind(placements)
+
+    # Clusters and cards
+
+    def acquire_cluster(self):
+        if len(self.cluster_pool):
+            self.render_stats.reused(self.CLUSTER_CONTROLS)
+        else:
+            self.render_stats.created(self.CLUSTER_CONTROLS)
+        return self.cluster_pool.acquire()
+
+    def release_cluster(self, view):
+        self.cluster_pool.release(view)
+        self.render_stats.removed(self.CLUSTER_CONTROLS)
+
+    def new_card(self):
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text(weight=ft.FontWeight.BOLD, size=12 if self.detailed else 10, color=ft.Colors.WHITE, no_wrap=True, overflow=ft.TextOverflow.ELLIPSIS),
+                    ft.Text(size=10, color=ft.Colors.WHITE70, visible=self.detailed),
+                ],
+                spacing=2
+            ),
+            border_radius=6 if self.detailed else 4,
+            padding=5 if self.detailed else 2,
+            left=0,
+            right=0,
+            on_click=self.handle_card_click,
+        )
+
+    def acquire_card(self):
+        if len(self.card_pool):
+            self.render_stats.reused(self.CARD_CONTROLS)
+        else:
+            self.render_stats.created(self.CARD_CONTROLS)
+        return self.card_pool.acquire()
+
+    def release_card(self, card):
+        card.data = None
+        self.card_pool.release(card)
+        self.render_stats.removed(self.CARD_CONTROLS)
+
+    def bind_card(self, card, event, top, height):
+        title, times = card.content.controls
+        title.value = event["title"]
+        if self.detailed:
+            start, end = event_span(event)
+            times.value = f"{start // 60:02d}:{start % 60:02d} - {end // 60:02d}:{end % 60:02d}"
+        card.bgcolor = ft.Colors.BLUE if event.get("type") != "task" else ft.Colors.RED_400
+        card.top = top
+        card.height = height
+        card.data = event
+
+    def handle_card_click(self, e):
+        if self.on_event_click and e.control.data is not None:
+            self.on_event_click(e.control.data)
@@ -0,0 +1,30 @@
+import os
+import asyncio
+import tempfile
+from types import SimpleNamespace
+import flet as ft
+
+# Unit tests never reach the MONGO_URI in .env: anything that falls through to the
+# global store gets a throwaway SQLite file. Set before the app modules load .env.
+os.environ["STORAGE_BACKEND"] = "sqlite"
+os.environ["SQLITE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="calendar-tests-"), "calendar.db")
+
+
+class FakePage(SimpleNamespace):
+    """Just enough of ft.Page for views under test: updates are no-ops, opened dialogs are kept."""
+
+    def __init__(self, height=None):
+        super().__init__(theme_mode=ft.ThemeMode.LIGHT, height=height, opened=[])
+
+    def update(self, *controls):
+        pass
+
+    def open(self, control):
+        self.opened.append(control)
+
+
+class LoopPage(FakePage):
+    """run_task() schedules on the running loop, like Flet's page does on its own."""
+
+    def run_task(self, handler, *args):
+        return asyncio.get_running_loop().create_task(handler(*args))
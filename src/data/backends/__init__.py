@@ -0,0 +1,21 @@
+import os
+from data.backends.base import EventBackend
+
+
+def backend_name():
+    """STORAGE_BACKEND ("mongo" or "sqlite"); unset means Mongo when MONGO_URI is configured, else SQLite."""
+    name = os.getenv("STORAGE_BACKEND", "").strip().lower()
+    if name:
+        return name
+    return "mongo" if os.getenv("MONGO_URI") else "sqlite"
+
+
+def create_backend(name=None):
+    name = name or backend_name()
+    if name == "mongo":
+        from data.backends.mongo import MongoBackend
+        return MongoBackend()
+    if name == "sqlite":
+        from data.backends.sqlite import SQLiteBackend
+        return SQLiteBackend()
+    raise ValueError(f"Unknown STORAGE_BACKEND {name!r} (expected 'mongo' or 'sqlite')")
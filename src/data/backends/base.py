@@ -0,0 +1,87 @@
+class EventBackend:
+    """
+    Storage for event documents, as used by EventStore.
+
+    Documents are plain dicts carrying a string "id"; "start_at"/"end_at"/"updated_at"
+    are naive datetimes. Backends do no caching or recurrence expansion of their own.
+    Bulk methods return the set of input indexes that were not applied; in ordered mode
+    everything after the first failure counts as not applied.
+    """
+
+    name = None
+    # True when watch() can follow changes made by other sessions as they happen
+    supports_watch = False
+
+    def connect(self):
+        """Open the storage and make sure its schema/indexes exist. Returns False when unavailable."""
+        raise NotImplementedError
+
+    def insert(self, doc):
+        """Store a new document and return its id."""
+        raise NotImplementedError
+
+    def insert_many(self, docs, ordered=True):
+        """Store new documents, setting doc["id"] on each one that was written."""
+        raise NotImplementedError
+
+    def update(self, user_id, event_id, updates):
+        """Set fields on one of the user's events. Returns True when it changed."""
+        raise NotImplementedError
+
+    def update_many(self, user_id, changes, ordered=True):
+        """Apply (event_id, updates) pairs."""
+        raise NotImplementedError
+
+    def delete(self, user_id, event_id):
+        """Remove one of the user's events, leaving a tombstone for delta sync."""
+        raise NotImplementedError
+
+    def delete_many(self, user_id, event_ids, ordered=True):
+        raise NotImplementedError
+
+    def get(self, user_id, event_id):
+        """The full document, or None."""
+        raise NotImplementedError
+
+    def find_range(self, user_id, start, end, fields=None):
+        """
+        One-off events starting within the dates [start, end] plus every recurring series
+        that has begun by `end`. `fields` limits the returned keys (None: everything).
+        """
+        raise NotImplementedError
+
+    def find_all(self, user_id, fields=None):
+        raise NotImplementedError
+
+    def day_counts(self, user_id, start, end):
+        """
+        Per-day counts of the one-off events starting within [start, end], computed by
+        the storage itself: {date: {"events": n, "tasks": n}}. Recurring series are not
+        counted; see find_series.
+        """
+        raise NotImplementedError
+
+    def find_series(self, user_id, end=None, fields=None):
+        """Every recurring series that has begun by `end` (None: all of them)."""
+        raise NotImplementedError
+
+    def find_page(self, user_id, after=None, before=None, limit=50, fields=None):
+        """
+        Up to `limit` one-off events ordered by (start_at, id), keyset-paginated.
+
+        `after=(start_at, id)` returns the events following that key in ascending order;
+        `before=(start_at, id)` the ones preceding it, nearest first (descending).
+        """
+        raise NotImplementedError
+
+    def changes_since(self, user_id, since, fields=None):
+        """Documents updated after `since` and ids deleted after it: (docs, deleted_ids)."""
+        raise NotImplementedError
+
+    def missing_normalized_dates(self, user_id):
+        """Documents written before start_at/end_at/updated_at existed."""
+        raise NotImplementedError
+
+    def watch(self, user_id, resume_after=None):
+        """A context-managed change stream of the user's events (only when supports_watch)."""
+        raise NotImplementedError
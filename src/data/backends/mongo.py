@@ -0,0 +1,209 @@
+from datetime import datetime, time, timedelta
+from bson.objectid import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING, DESCENDING, InsertOne, UpdateOne, DeleteOne
+from pymongo.errors import BulkWriteError
+from data.backends.base import EventBackend
+from data.connection import get_client, DATABASE_NAME
+from data.indexes import ensure_indexes
+from data.sync import utcnow
+
+ONE_OFF = [None, "none"]
+
+
+def _with_id(doc):
+    doc["id"] = str(doc["_id"])
+    return doc
+
+
+class MongoBackend(EventBackend):
+    name = "mongo"
+    supports_watch = True
+
+    def __init__(self):
+        self.db = None
+        self.collection = None
+        self.tombstones = None
+
+    def connect(self):
+        client = get_client()
+        if client is None:
+            print("MONGO_URI not found in .env")
+            return False
+        self.db = client.get_database(DATABASE_NAME)
+        self.collection = self.db.get_collection("events")
+        # Deleted event ids, so polling replicas can see deletes (expire after 30 days)
+        self.tombstones = self.db.get_collection("event_tombstones")
+        print("Connected to MongoDB")
+        ensure_indexes(self.db, "events")
+        ensure_indexes(self.db, "event_tombstones")
+        return True
+
+    def _projection(self, fields):
+        return None if fields is None else {field: 1 for field in fields if field != "id"}
+
+    def _bulk_write(self, operations, ordered):
+        """Run bulk_write and return the set of operation indexes that did not apply."""
+        if not operations:
+            return set()
+        try:
+            self.collection.bulk_write(operations, ordered=ordered)
+            return set()
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            if ordered and failed:
+                # Ordered batches stop at the first error
+                failed |= set(range(min(failed), len(operations)))
+            for error in e.details.get("writeErrors", []):
+                print(f"Error in bulk write item {error['index']}: {error.get('errmsg')}")
+            return failed
+        except Exception as e:
+            print(f"Error in bulk write: {e}")
+            return set(range(len(operations)))
+
+    def _object_ids(self, event_ids, ordered, action):
+        """(input index, ObjectId) for the valid ids, plus the indexes that cannot be applied."""
+        valid = []
+        failed = set()
+        for index, event_id in enumerate(event_ids):
+            try:
+                valid.append((index, ObjectId(event_id)))
+            except (InvalidId, TypeError):
+                print(f"Error {action} event: invalid id {event_id!r}")
+                if ordered:
+                    failed |= set(range(index, len(event_ids)))
+                    break
+                failed.add(index)
+        return valid, failed
+
+    def _apply(self, valid, failed, operations, ordered):
+        failed_ops = self._bulk_write(operations, ordered)
+        failed = set(failed)
+        for op_index, (index, _) in enumerate(valid):
+            if op_index in failed_ops:
+                failed.add(index)
+        return failed
+
+    def insert(self, doc):
+        doc["_id"] = ObjectId()
+        self.collection.insert_one(doc)
+        return str(doc["_id"])
+
+    def insert_many(self, docs, ordered=True):
+        for doc in docs:
+            doc["_id"] = ObjectId()
+        failed = self._bulk_write([InsertOne(doc) for doc in docs], ordered)
+        for index, doc in enumerate(docs):
+            if index not in failed:
+                doc["id"] = str(doc["_id"])
+        return failed
+
+    def update(self, user_id, event_id, updates):
+        result = self.collection.update_one({"_id": ObjectId(event_id), "user_id": user_id}, {"$set": updates})
+        return result.modified_count > 0
+
+    def update_many(self, user_id, changes, ordered=True):
+        valid, failed = self._object_ids([event_id for event_id, _ in changes], ordered, "updating")
+        operations = [UpdateOne({"_id": object_id, "user_id": user_id}, {"$set": changes[index][1]}) for index, object_id in valid]
+        return self._apply(valid, failed, operations, ordered)
+
+    def delete(self, user_id, event_id):
+        result = self.collection.delete_one({"_id": ObjectId(event_id), "user_id": user_id})
+        self._record_deletes(user_id, [event_id])
+        return result.deleted_count > 0
+
+    def delete_many(self, user_id, event_ids, ordered=True):
+        valid, failed = self._object_ids(event_ids, ordered, "deleting")
+        operations = [DeleteOne({"_id": object_id, "user_id": user_id}) for _, object_id in valid]
+        failed = self._apply(valid, failed, operations, ordered)
+        self._record_deletes(user_id, [event_id for index, event_id in enumerate(event_ids) if index not in failed])
+        return failed
+
+    def _record_deletes(self, user_id, event_ids):
+        if not event_ids:
+            return
+        try:
+            deleted_at = utcnow()
+            self.tombstones.insert_many([{"user_id": user_id, "event_id": event_id, "deleted_at": deleted_at} for event_id in event_ids])
+        except Exception as e:
+            print(f"Error recording deleted events: {e}")
+
+    def get(self, user_id, event_id):
+        doc = self.collection.find_one({"_id": ObjectId(event_id), "user_id": user_id})
+        return _with_id(doc) if doc is not None else None
+
+    def range_query(self, user_id, start, end):
+        range_start = datetime.combine(start, time.min)
+        range_end = datetime.combine(end + timedelta(days=1), time.min)
+        return {
+            "user_id": user_id,
+            "$or": [
+                # Views place an event on the day it starts, so only those starting inside the range
+                {"recurrence": {"$in": ONE_OFF}, "start_at": {"$gte": range_start, "$lt": range_end}},
+                {"recurrence": {"$nin": ONE_OFF}, "start_at": {"$lt": range_end}},
+            ]
+        }
+
+    def find_range(self, user_id, start, end, fields=None):
+        return [_with_id(doc) for doc in self.collection.find(self.range_query(user_id, start, end), self._projection(fields))]
+
+    def find_all(self, user_id, fields=None):
+        return [_with_id(doc) for doc in self.collection.find({"user_id": user_id}, self._projection(fields))]
+
+    def day_counts(self, user_id, start, end):
+        # Served by the (user_id, start_at) index; only one small document per day and type comes back
+        pipeline = [
+            {"$match": {
+                "user_id": user_id,
+                "recurrence": {"$in": ONE_OFF},
+                "start_at": {"$gte": datetime.combine(start, time.min), "$lt": datetime.combine(end + timedelta(days=1), time.min)},
+            }},
+            {"$group": {
+                "_id": {"day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$start_at"}}, "task": {"$eq": ["$type", "task"]}},
+                "count": {"$sum": 1},
+            }},
+        ]
+        counts = {}
+        for row in self.collection.aggregate(pipeline):
+            day = datetime.strptime(row["_id"]["day"], "%Y-%m-%d").date()
+            bucket = counts.setdefault(day, {"events": 0, "tasks": 0})
+            bucket["tasks" if row["_id"]["task"] else "events"] += row["count"]
+        return counts
+
+    def find_series(self, user_id, end=None, fields=None):
+        query = {"user_id": user_id, "recurrence": {"$nin": ONE_OFF}}
+        if end is not None:
+            query["start_at"] = {"$lt": datetime.combine(end + timedelta(days=1), time.min)}
+        return [_with_id(doc) for doc in self.collection.find(query, self._projection(fields))]
+
+    def find_page(self, user_id, after=None, before=None, limit=50, fields=None):
+        query = {"user_id": user_id, "recurrence": {"$in": ONE_OFF}}
+        key, op, order = (after, "$gt", ASCENDING) if before is None else (before, "$lt", DESCENDING)
+        if key is not None:
+            start_at, event_id = key
+            try:
+                query["$or"] = [{"start_at": {op: start_at}}, {"start_at": start_at, "_id": {op: ObjectId(event_id)}}]
+            except (InvalidId, TypeError):
+                # Not an ObjectId, e.g. the "" a first page starts from: it sorts before every id
+                query["start_at"] = {"$gte" if before is None else "$lt": start_at}
+        cursor = self.collection.find(query, self._projection(fields)).sort([("start_at", order), ("_id", order)]).limit(limit)
+        return [_with_id(doc) for doc in cursor]
+
+    def changes_since(self, user_id, since, fields=None):
+        changed = [_with_id(doc) for doc in self.collection.find({"user_id": user_id, "updated_at": {"$gt": since}}, self._projection(fields))]
+        deleted = [doc["event_id"] for doc in self.tombstones.find({"user_id": user_id, "deleted_at": {"$gt": since}}, {"event_id": 1})]
+        return changed, deleted
+
+    def missing_normalized_dates(self, user_id):
+        cursor = self.collection.find(
+            {"user_id": user_id, "$or": [{"start_at": {"$exists": False}}, {"updated_at": {"$exists": False}}]},
+            {"start": 1, "end": 1}
+        )
+        return [_with_id(doc) for doc in cursor]
+
+    def watch(self, user_id, resume_after=None):
+        pipeline = [{"$match": {"$or": [
+            {"fullDocument.user_id": user_id},
+            {"operationType": "delete"},
+        ]}}]
+        return self.collection.watch(pipeline, full_document="updateLookup", resume_after=resume_after, max_await_time_ms=500)
@@ -0,0 +1,310 @@
+import os
+import json
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+from data.backends.base import EventBackend
+from data.sync import utcnow
+
+# Event fields with a column of their own; anything else round-trips through the "extra" JSON column
+COLUMNS = ("user_id", "title", "start", "end", "description", "type", "recurrence", "priority",
+           "completed", "start_at", "end_at", "created_at", "updated_at")
+DATETIME_COLUMNS = {"start_at", "end_at", "created_at", "updated_at"}
+TOMBSTONE_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    title TEXT,
+    start TEXT,
+    "end" TEXT,
+    description TEXT,
+    type TEXT,
+    recurrence TEXT,
+    priority TEXT,
+    completed INTEGER,
+    start_at TEXT,
+    end_at TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS events_user_start_at_id ON events (user_id, start_at, id);
+CREATE INDEX IF NOT EXISTS events_user_updated_at ON events (user_id, updated_at);
+CREATE TABLE IF NOT EXISTS event_tombstones (
+    event_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    deleted_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tombstones_user_deleted_at ON event_tombstones (user_id, deleted_at);
+"""
+
+# One-off events starting inside the range (views place an event on the day it starts),
+# plus every series that has begun by its end
+RANGE_FILTER = """
+user_id = ? AND start_at < ? AND (
+    (COALESCE(recurrence, 'none') = 'none' AND start_at >= ?)
+    OR COALESCE(recurrence, 'none') != 'none'
+)
+"""
+
+
+def _quote(column):
+    return f'"{column}"'
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        # ISO text sorts the same way the datetimes do
+        return value.isoformat(sep=" ")
+    return value
+
+
+def _decode_value(column, value):
+    if value is None:
+        return None
+    if column in DATETIME_COLUMNS:
+        return datetime.fromisoformat(value)
+    if column == "completed":
+        return bool(value)
+    return value
+
+
+def _split(doc):
+    """Column values and the JSON for the remaining fields of a document."""
+    values = {column: _encode(doc.get(column)) for column in COLUMNS}
+    extra = {key: value for key, value in doc.items() if key not in COLUMNS and key not in ("id", "_id")}
+    return values, json.dumps(extra, default=str) if extra else None
+
+
+class SQLiteBackend(EventBackend):
+    """
+    Events in a local SQLite file (SQLITE_PATH, default calendar.db).
+
+    Each thread gets its own connection; WAL mode lets the UI's readers run alongside
+    a writer. Needs a real file: ":memory:" would give every thread a separate database.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv("SQLITE_PATH", "calendar.db")
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit; writes open their own transactions
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def _transaction(self):
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def connect(self):
+        connection = self._connection()
+        connection.executescript(SCHEMA)
+        # Stand-in for the Mongo TTL index on tombstones
+        cutoff = _encode(utcnow() - timedelta(days=TOMBSTONE_DAYS))
+        connection.execute("DELETE FROM event_tombstones WHERE deleted_at < ?", (cutoff,))
+        print(f"Using SQLite event storage at {os.path.abspath(self.path)}")
+        return True
+
+    # Rows <-> documents
+
+    def _select(self, fields):
+        if fields is None:
+            return "*"
+        columns = ["id"] + [_quote(column) for column in COLUMNS if column in fields]
+        if any(field not in COLUMNS and field not in ("id", "_id") for field in fields):
+            columns.append("extra")
+        return ", ".join(columns)
+
+    def _doc(self, row):
+        doc = {"id": row["id"]}
+        for column in row.keys():
+            if column == "extra":
+                doc.update(json.loads(row["extra"]) if row["extra"] else {})
+            elif column != "id":
+                doc[column] = _decode_value(column, row[column])
+        return doc
+
+    def _query(self, sql, params, fields=None):
+        rows = self._connection().execute(sql.format(select=self._select(fields)), params)
+        return [self._doc(row) for row in rows]
+
+    # Writes
+
+    def _insert_row(self, connection, doc):
+        event_id = uuid.uuid4().hex
+        values, extra = _split(doc)
+        columns = ["id"] + [_quote(column) for column in COLUMNS] + ["extra"]
+        connection.execute(
+            f"INSERT INTO events ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            [event_id] + list(values.values()) + [extra]
+        )
+        return event_id
+
+    def _update_row(self, connection, user_id, event_id, updates):
+        row = connection.execute("SELECT * FROM events WHERE id = ? AND user_id = ?", (event_id, user_id)).fetchone()
+        if row is None:
+            return False
+        doc = {**self._doc(row), **updates}
+        values, extra = _split(doc)
+        assignments = ", ".join(f"{_quote(column)} = ?" for column in COLUMNS)
+        connection.execute(
+            f"UPDATE events SET {assignments}, extra = ? WHERE id = ?",
+            list(values.values()) + [extra, event_id]
+        )
+        return True
+
+    def _delete_row(self, connection, user_id, event_id):
+        deleted = connection.execute("DELETE FROM events WHERE id = ? AND user_id = ?", (event_id, user_id)).rowcount > 0
+        connection.execute(
+            "INSERT INTO event_tombstones (event_id, user_id, deleted_at) VALUES (?, ?, ?)",
+            (event_id, user_id, _encode(utcnow()))
+        )
+        return deleted
+
+    def _write_many(self, write, items, ordered):
+        """Run write(connection, item) per item in one transaction; returns the failed indexes."""
+        failed = set()
+        try:
+            with self._transaction() as connection:
+                for index, item in enumerate(items):
+                    try:
+                        ok = write(connection, item)
+                    except sqlite3.IntegrityError as e:
+                        print(f"Error in bulk write item {index}: {e}")
+                        ok = False
+                    if ok is False:
+                        if ordered:
+                            failed |= set(range(index, len(items)))
+                            break
+                        failed.add(index)
+        except sqlite3.Error as e:
+            print(f"Error in bulk write: {e}")
+            return set(range(len(items)))
+        return failed
+
+    def insert(self, doc):
+        with self._transaction() as connection:
+            return self._insert_row(connection, doc)
+
+    def insert_many(self, docs, ordered=True):
+        def write(connection, doc):
+            doc["id"] = self._insert_row(connection, doc)
+        failed = self._write_many(write, docs, ordered)
+        for index in failed:
+            docs[index].pop("id", None)
+        return failed
+
+    def update(self, user_id, event_id, updates):
+        with self._transaction() as connection:
+            return self._update_row(connection, user_id, event_id, updates)
+
+    def update_many(self, user_id, changes, ordered=True):
+        # Matching nothing is not a failure, as with Mongo's UpdateOne
+        def write(connection, change):
+            self._update_row(connection, user_id, *change)
+        return self._write_many(write, changes, ordered)
+
+    def delete(self, user_id, event_id):
+        with self._transaction() as connection:
+            return self._delete_row(connection, user_id, event_id)
+
+    def delete_many(self, user_id, event_ids, ordered=True):
+        # Like Mongo's DeleteOne, deleting an id that is already gone is not an error
+        def write(connection, event_id):
+            self._delete_row(connection, user_id, event_id)
+        return self._write_many(write, event_ids, ordered)
+
+    # Reads
+
+    def get(self, user_id, event_id):
+        docs = self._query("SELECT {select} FROM events WHERE id = ? AND user_id = ?", (event_id, user_id))
+        return docs[0] if docs else None
+
+    def _range_params(self, user_id, start, end):
+        range_start = datetime.combine(start, time.min)
+        range_end = datetime.combine(end + timedelta(days=1), time.min)
+        return (user_id, _encode(range_end), _encode(range_start))
+
+    def find_range(self, user_id, start, end, fields=None):
+        params = self._range_params(user_id, start, end)
+        return self._query(f"SELECT {{select}} FROM events WHERE {RANGE_FILTER}", params, fields)
+
+    def find_all(self, user_id, fields=None):
+        return self._query("SELECT {select} FROM events WHERE user_id = ?", (user_id,), fields)
+
+    def day_counts(self, user_id, start, end):
+        # start_at is stored as "YYYY-MM-DD HH:MM:SS", so its first ten characters are the day
+        range_start, range_end = datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+        rows = self._connection().execute(
+            """
+            SELECT substr(start_at, 1, 10) AS day, type = 'task' AS task, COUNT(*) AS count
+            FROM events
+            WHERE user_id = ? AND start_at >= ? AND start_at < ? AND COALESCE(recurrence, 'none') = 'none'
+            GROUP BY day, task
+            """,
+            (user_id, _encode(range_start), _encode(range_end))
+        )
+        counts = {}
+        for row in rows:
+            bucket = counts.setdefault(datetime.strptime(row["day"], "%Y-%m-%d").date(), {"events": 0, "tasks": 0})
+            bucket["tasks" if row["task"] else "events"] += row["count"]
+        return counts
+
+    def find_series(self, user_id, end=None, fields=None):
+        if end is None:
+            return self._query("SELECT {select} FROM events WHERE user_id = ? AND COALESCE(recurrence, 'none') != 'none'", (user_id,), fields)
+        range_end = datetime.combine(end + timedelta(days=1), time.min)
+        return self._query(
+            "SELECT {select} FROM events WHERE user_id = ? AND start_at < ? AND COALESCE(recurrence, 'none') != 'none'",
+            (user_id, _encode(range_end)), fields
+        )
+
+    def find_page(self, user_id, after=None, before=None, limit=50, fields=None):
+        key, op, order = (after, ">", "ASC") if before is None else (before, "<", "DESC")
+        sql = "SELECT {select} FROM events WHERE user_id = ? AND COALESCE(recurrence, 'none') = 'none' AND start_at IS NOT NULL"
+        params = [user_id]
+        if key is not None:
+            sql += f" AND (start_at, id) {op} (?, ?)"
+            params += [_encode(key[0]), key[1]]
+        sql += f" ORDER BY start_at {order}, id {order} LIMIT ?"
+        return self._query(sql, params + [limit], fields)
+
+    def changes_since(self, user_id, since, fields=None):
+        since = _encode(since)
+        changed = self._query("SELECT {select} FROM events WHERE user_id = ? AND updated_at > ?", (user_id, since), fields)
+        rows = self._connection().execute(
+            "SELECT event_id FROM event_tombstones WHERE user_id = ? AND deleted_at > ?", (user_id, since)
+        )
+        return changed, [row["event_id"] for row in rows]
+
+    def missing_normalized_dates(self, user_id):
+        return self._query(
+            "SELECT {select} FROM events WHERE user_id = ? AND (start_at IS NULL OR updated_at IS NULL)",
+            (user_id,), {"start", "end"}
+        )
+
+    def explain_range(self, user_id, start, end):
+        """SQLite's query plan for find_range, e.g. to check it searches an index."""
+        params = self._range_params(user_id, start, end)
+        rows = self._connection().execute(f"EXPLAIN QUERY PLAN SELECT * FROM events WHERE {RANGE_FILTER}", params)
+        return [row["detail"] for row in rows]
@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+
+
+class MonthCache:
+    """
+    Bounded LRU of expanded occurrences keyed by (user_id, year, month, projection).
+
+    Views fetch from worker threads, so every operation holds a lock.
+    """
+
+    def __init__(self, max_size=24):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Bumped on every invalidation so fetches started before a write don't cache stale data
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def contains(self, key):
+        """Membership check that leaves the counters and LRU order alone (used by prefetching)."""
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key, events, generation=None):
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = events
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate):
+        """Drop every entry whose key matches predicate(key); returns the number dropped."""
+        with self._lock:
+            self.generation += 1
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def keys_containing(self, user_id, event_id):
+        """Cached months of a user that hold an occurrence of the given event."""
+        with self._lock:
+            return [
+                key for key, events in self._entries.items()
+                if key[0] == user_id and any(e.get("id") == event_id for e in events)
+            ]
+
+    def find_event(self, user_id, event_id):
+        with self._lock:
+            for key, events in self._entries.items():
+                if key[0] != user_id:
+                    continue
+                for event in events:
+                    if event.get("id") == event_id:
+                        return event
+            return None
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,168 @@
+import os
+import threading
+from pymongo import MongoClient, monitoring
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATABASE_NAME = "ai_calendar_db"
+
+# Environment variable -> (MongoClient option, default, type)
+POOL_SETTINGS = {
+    "MONGO_MAX_POOL_SIZE": ("maxPoolSize", 50, int),
+    "MONGO_MIN_POOL_SIZE": ("minPoolSize", 0, int),
+    "MONGO_MAX_IDLE_TIME_MS": ("maxIdleTimeMS", None, int),
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS": ("waitQueueTimeoutMS", None, int),
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS": ("serverSelectionTimeoutMS", 5000, int),
+    "MONGO_CONNECT_TIMEOUT_MS": ("connectTimeoutMS", 5000, int),
+    "MONGO_SOCKET_TIMEOUT_MS": ("socketTimeoutMS", None, int),
+    # Comma separated, e.g. "zstd,snappy,zlib" (zstd/snappy need their python packages)
+    "MONGO_COMPRESSORS": ("compressors", None, str),
+}
+
+
+class PoolStats(monitoring.ConnectionPoolListener):
+    """Connection pool counters fed by pymongo's CMAP events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.max_checked_out = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.connections_open = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def connection_checked_out(self, event):
+        wait_ms = getattr(event, "duration", 0.0) * 1000
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.max_checked_out = max(self.max_checked_out, self.checked_out)
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out -= 1
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_open += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_open -= 1
+
+    # Remaining CMAP events are not needed for the counters
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "checked_out": self.checked_out,
+                "max_checked_out": self.max_checked_out,
+                "connections_open": self.connections_open,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "avg_wait_ms": self.total_wait_ms / self.checkouts if self.checkouts else 0.0,
+                "max_wait_ms": self.max_wait_ms,
+            }
+
+
+pool_stats = PoolStats()
+_client = None
+_client_lock = threading.Lock()
+
+
+def client_options():
+    """MongoClient keyword arguments built from the MONGO_* environment variables."""
+    options = {}
+    for env_name, (option, default, cast) in POOL_SETTINGS.items():
+        raw = os.getenv(env_name)
+        value = cast(raw) if raw else default
+        if value is not None:
+            options[option] = value
+    return options
+
+
+def get_client():
+    """The process-wide MongoClient, created on first use. None when MONGO_URI is not set."""
+    global _client
+    if _client is not None:
+        return _client
+    mongo_uri = os.getenv("MONGO_URI")
+    if not mongo_uri:
+        return None
+    with _client_lock:
+        if _client is None:
+            _client = MongoClient(mongo_uri, event_listeners=[pool_stats], **client_options())
+    return _client
+
+
+def get_database():
+    client = get_client()
+    return client.get_database(DATABASE_NAME) if client is not None else None
+
+
+class LazyConnection:
+    """
+    Mixin for services that connect on first use instead of at import time.
+
+    Subclasses implement _connect(); connect_in_background() lets startup warm the
+    connection up while the first screen renders. A caller that needs the database
+    before warm-up has finished waits on the same lock rather than connecting twice.
+    """
+
+    def __init__(self):
+        self._connected = False
+        self._connect_lock = threading.Lock()
+
+    def _ensure_connected(self):
+        if self._connected:
+            return
+        with self._connect_lock:
+            if not self._connected:
+                try:
+                    self._connect()
+                finally:
+                    # A failed attempt is not retried on every call, same as an eager connect
+                    self._connected = True
+
+    def connect_in_background(self):
+        if self._connected:
+            return
+        threading.Thread(
+            target=self._ensure_connected,
+            name=f"{type(self).__name__}-connect",
+            daemon=True
+        ).start()
+
+
+def close_client():
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
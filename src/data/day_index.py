@@ -0,0 +1,72 @@
+from data.recurrence import parse_date
+
+
+def start_minute(event):
+    """Minutes after midnight of an event's "YYYY-MM-DD HH:MM" start; 0 for date-only starts."""
+    parts = (event.get("start") or "").split(" ")
+    try:
+        hour, minute = parts[1].split(":")[:2]
+        return int(hour) * 60 + int(minute)
+    except (IndexError, ValueError):
+        return 0
+
+
+class DayIndex:
+    """
+    Occurrences bucketed by date, split by type and sorted by start minute.
+
+    Views build one per fetch; rendering a day is then a dict lookup instead of a scan
+    over every loaded event, so a render costs the same however busy the range is.
+    """
+
+    def __init__(self, events=()):
+        self._days = {}
+        self._versions = {}
+        for event in events:
+            day = parse_date(event.get("start"))
+            if day is None:
+                continue
+            kind = "tasks" if event.get("type") == "task" else "events"
+            bucket = self._days.setdefault(day, {"events": [], "tasks": [], "all": []})
+            bucket[kind].append(event)
+            bucket["all"].append(event)
+        for bucket in self._days.values():
+            for occurrences in bucket.values():
+                occurrences.sort(key=start_minute)
+
+    def on(self, day, filters=None):
+        """The occurrences on a date that pass the {"events": bool, "tasks": bool} filters."""
+        bucket = self._days.get(day)
+        if bucket is None:
+            return []
+        filters = filters or {}
+        show_events = filters.get("events", True)
+        show_tasks = filters.get("tasks", True)
+        if show_events and show_tasks:
+            return bucket["all"]
+        if show_events:
+            return bucket["events"]
+        if show_tasks:
+            return bucket["tasks"]
+        return []
+
+    def version(self, day, filters=None):
+        """
+        Identity of the occurrences on() returns for a date, for memoizing work derived from them.
+
+        Built from each occurrence's id and times rather than a counter, so two indexes
+        over the same events (the day and week views each keep one) agree on it.
+        """
+        filters = filters or {}
+        key = (day, filters.get("events", True), filters.get("tasks", True))
+        version = self._versions.get(key)
+        if version is None:
+            version = tuple((e.get("id"), e.get("start"), e.get("end")) for e in self.on(day, filters))
+            self._versions[key] = version
+        return version
+
+    def days(self):
+        return sorted(self._days)
+
+    def __len__(self):
+        return sum(len(bucket["all"]) for bucket in self._days.values())
@@ -0,0 +1,74 @@
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+
+# Indexes backing the hot queries, per collection
+INDEXES = {
+    "events": [
+        # get_events_in_range: one-off events by date, recurring series by start. _id makes
+        # it the agenda's keyset too, so ties on start_at page deterministically
+        IndexModel([("user_id", ASCENDING), ("start_at", ASCENDING), ("_id", ASCENDING)], name="user_start_at_id"),
+        IndexModel([("user_id", ASCENDING), ("recurrence", ASCENDING)], name="user_recurrence"),
+        # Delta sync when change streams are unavailable
+        IndexModel([("user_id", ASCENDING), ("updated_at", ASCENDING)], name="user_updated_at"),
+    ],
+    "event_tombstones": [
+        IndexModel([("user_id", ASCENDING), ("deleted_at", ASCENDING)], name="user_deleted_at"),
+        IndexModel([("deleted_at", ASCENDING)], name="deleted_at_ttl", expireAfterSeconds=30 * 24 * 3600),
+    ],
+    "users": [
+        # register / login lookups; also guarantees usernames stay unique
+        IndexModel([("username", ASCENDING)], name="username_unique", unique=True),
+    ],
+}
+
+
+def ensure_indexes(db, collection_name):
+    """
+    Create the indexes declared for a collection if they are missing.
+
+    Returns a {index_name: status} dict where status is "exists", "created" or "failed: <reason>".
+    """
+    collection = db.get_collection(collection_name)
+    status = {}
+    try:
+        existing = set(collection.index_information())
+    except PyMongoError as e:
+        return {model.document["name"]: f"failed: {e}" for model in INDEXES[collection_name]}
+
+    for model in INDEXES[collection_name]:
+        name = model.document["name"]
+        if name in existing:
+            status[name] = "exists"
+            continue
+        try:
+            collection.create_indexes([model])
+            status[name] = "created"
+        except PyMongoError as e:
+            # e.g. duplicate usernames already stored prevent the unique index
+            status[name] = f"failed: {e}"
+
+    for name, state in status.items():
+        print(f"Index {collection_name}.{name}: {state}")
+    return status
+
+
+def plan_stages(plan):
+    """Flatten the stage names of an explain() winning plan."""
+    stages = [plan.get("stage")]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages.extend(plan_stages(plan[key]))
+    for child in plan.get("inputStages", []):
+        stages.extend(plan_stages(child))
+    return [stage for stage in stages if stage]
+
+
+def explain_stages(cursor):
+    """Stages used by the winning plan of a find() cursor."""
+    explanation = cursor.explain()
+    return plan_stages(explanation["queryPlanner"]["winningPlan"])
+
+
+def uses_index(cursor):
+    stages = explain_stages(cursor)
+    return "COLLSCAN" not in stages and any(stage in ("IXSCAN", "IDHACK", "EXPRESS_IXSCAN") for stage in stages)
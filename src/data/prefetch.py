@@ -0,0 +1,43 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from data.store import store
+
+# A single worker shared by all views, separate from the store I/O pool, so
+# prefetching never competes with the fetch for what is on screen
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="store-prefetch")
+
+
+class Prefetcher:
+    """Warms the store cache for the periods next to the one a view is showing."""
+
+    def __init__(self, projection):
+        self.projection = projection
+        self._pending = {} # (start, end) -> Future
+        self._lock = threading.Lock()
+
+    def schedule(self, ranges):
+        """
+        Queue prefetches for the given (start, end) date ranges.
+
+        Queued prefetches for ranges that are no longer wanted (the user jumped
+        elsewhere) are cancelled; one that is already running just finishes.
+        """
+        wanted = set(ranges)
+        with self._lock:
+            for key, future in list(self._pending.items()):
+                if key not in wanted:
+                    future.cancel()
+                if key not in wanted or future.done():
+                    del self._pending[key]
+            for key in ranges:
+                if key not in self._pending:
+                    self._pending[key] = _executor.submit(self._prefetch, *key)
+
+    def cancel(self):
+        self.schedule([])
+
+    def _prefetch(self, start, end):
+        try:
+            store.prefetch_range(start, end, self.projection)
+        except Exception as e:
+            print(f"Error prefetching {start} - {end}: {e}")
@@ -0,0 +1,165 @@
+import calendar
+import datetime
+
+# Weekdays on which each weekly pattern fires (Mon=0, Sun=6)
+WEEKDAY_RULES = {
+    "workdays": frozenset(range(0, 5)),
+    "weekends": frozenset((5, 6)),
+}
+
+
+def parse_date(value):
+    """Return the date part of a "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" string, or None."""
+    try:
+        date_part = value.split(" ")[0]
+    except AttributeError:
+        return None
+    try:
+        # Fast path for the zero-padded dates the app writes
+        return datetime.date.fromisoformat(date_part)
+    except ValueError:
+        pass
+    try:
+        return datetime.datetime.strptime(date_part, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def parse_datetime(value):
+    """Return a datetime for a "YYYY-MM-DD HH:MM" or "YYYY-MM-DD" string, or None."""
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(value, fmt)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _time_part(value):
+    parts = value.split(" ") if isinstance(value, str) else []
+    return parts[1] if len(parts) > 1 else None
+
+
+def month_bounds(year, month):
+    """First and last date of a month."""
+    _, num_days = calendar.monthrange(year, month)
+    return datetime.date(year, month, 1), datetime.date(year, month, num_days)
+
+
+def months_between(start, end):
+    """(year, month) pairs touched by the date range [start, end]."""
+    year, month = start.year, start.month
+    months = []
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        month += 1
+        if month > 12:
+            month = 1
+            year += 1
+    return months
+
+
+def is_recurring(event):
+    recurrence = event.get("recurrence")
+    return bool(recurrence) and recurrence != "none"
+
+
+def _daily_dates(first, last):
+    step = datetime.timedelta(days=1)
+    current = first
+    while current <= last:
+        yield current
+        current += step
+
+
+def _weekday_offsets(allowed):
+    # For every weekday: days to the first allowed weekday (inclusive) and to the next one (exclusive)
+    first = [min(k for k in range(7) if (w + k) % 7 in allowed) for w in range(7)]
+    following = [min(k for k in range(1, 8) if (w + k) % 7 in allowed) for w in range(7)]
+    return first, following
+
+
+_OFFSETS = {rule: _weekday_offsets(days) for rule, days in WEEKDAY_RULES.items()}
+
+
+def _weekday_dates(rule, first, last):
+    to_first, to_next = _OFFSETS[rule]
+    current = first + datetime.timedelta(days=to_first[first.weekday()])
+    while current <= last:
+        yield current
+        current += datetime.timedelta(days=to_next[current.weekday()])
+
+
+def _monthly_dates(anchor, first, last):
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        _, num_days = calendar.monthrange(year, month)
+        # Months without the anchor day (e.g. the 31st) are skipped, as before
+        if anchor.day <= num_days:
+            current = datetime.date(year, month, anchor.day)
+            if first <= current <= last:
+                yield current
+        month += 1
+        if month > 12:
+            month = 1
+            year += 1
+
+
+def _yearly_dates(anchor, first, last):
+    for year in range(first.year, last.year + 1):
+        try:
+            current = anchor.replace(year=year)
+        except ValueError:
+            # Feb 29 only occurs in leap years
+            continue
+        if first <= current <= last:
+            yield current
+
+
+def occurrence_dates(event, range_start, range_end):
+    """Dates on which a recurring event occurs within [range_start, range_end]."""
+    start = parse_date(event.get("start"))
+    if start is None:
+        return
+    first = max(start, range_start)
+    if first > range_end:
+        return
+
+    recurrence = event.get("recurrence")
+    if recurrence == "daily":
+        yield from _daily_dates(first, range_end)
+    elif recurrence in WEEKDAY_RULES:
+        yield from _weekday_dates(recurrence, first, range_end)
+    elif recurrence == "monthly":
+        yield from _monthly_dates(start, first, range_end)
+    elif recurrence == "yearly":
+        yield from _yearly_dates(start, first, range_end)
+
+
+def occurrences(event, range_start, range_end):
+    """
+    Yield the instances of an event that fall within [range_start, range_end] (dates, inclusive).
+
+    One-off events are yielded as-is when they start inside the range. Recurring events
+    are expanded into copies whose "start"/"end" point at the occurrence date, keeping
+    the original time of day and the id of the series.
+    """
+    if not is_recurring(event):
+        start = parse_date(event.get("start"))
+        if start is not None and range_start <= start <= range_end:
+            yield event
+        return
+
+    start_time = _time_part(event.get("start"))
+    end_time = _time_part(event.get("end"))
+    start = parse_date(event.get("start"))
+    end = parse_date(event.get("end")) or start
+    span = max(end - start, datetime.timedelta(0)) if start else datetime.timedelta(0)
+
+    for current in occurrence_dates(event, range_start, range_end):
+        # Create a virtual event instance
+        instance = event.copy()
+        end_date = current + span
+        instance["start"] = f"{current.isoformat()} {start_time}" if start_time else current.isoformat()
+        instance["end"] = f"{end_date.isoformat()} {end_time}" if end_time else end_date.isoformat()
+        yield instance
@@ -1,40 +1,202 @@
 import os
-from datetime import datetime
-from pymongo import MongoClient
+import asyncio
+import functools
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from data.cache import MonthCache
+from data.connection import LazyConnection
+from data.backends import create_backend
+from data.sync import EventReplica, utcnow
+from data.recurrence import occurrences, occurrence_dates, month_bounds, months_between, parse_date, parse_datetime, is_recurring
 
 load_dotenv()
 
-class EventStore:
-    def __init__(self):
-        self.client = None
-        self.db = None
-        self.collection = None
+# Fields each kind of view needs. "id" always comes back; None means the whole document.
+# "start_at"/"recurrence" are always kept because cache invalidation relies on them.
+PROJECTIONS = {
+    "grid": {"title": 1, "type": 1, "start": 1, "recurrence": 1, "start_at": 1},
+    "timeline": {"title": 1, "type": 1, "start": 1, "end": 1, "recurrence": 1, "start_at": 1, "end_at": 1, "priority": 1, "completed": 1},
+    "details": None,
+}
+# Projection-like cache tag for per-day counts; they are invalidated with the rest of their month
+DENSITY = "density"
+# Agenda pages expand series a month at a time, never further than this from the cursor
+AGENDA_WINDOW_DAYS = 31
+AGENDA_HORIZON_DAYS = 10 * 366
+
+
+def _count_by_day(events):
+    counts = {}
+    for event in events:
+        day = parse_date(event.get("start"))
+        if day is None:
+            continue
+        bucket = counts.setdefault(day, {"events": 0, "tasks": 0})
+        bucket["tasks" if event.get("type") == "task" else "events"] += 1
+    return counts
+
+
+def _series_stream(event, cursor, backward=False):
+    """
+    ((start_at, id), occurrence) pairs of a recurring series past the keyset cursor:
+    ascending after it, or descending before it when `backward`. Expanded lazily a
+    window at a time, so a page only pays for the occurrences it takes.
+    """
+    start = parse_date(event.get("start"))
+    if start is None:
+        return
+    origin = cursor[0].date() if cursor else start
+    window = timedelta(days=AGENDA_WINDOW_DAYS)
+    one_day = timedelta(days=1)
+    if backward:
+        last = origin
+        while last >= start and (origin - last).days <= AGENDA_HORIZON_DAYS:
+            first = last - window + one_day
+            keyed = [((parse_datetime(o["start"]), event["id"]), o) for o in occurrences(event, first, last)]
+            for key, occurrence in reversed(keyed):
+                if cursor is None or key < cursor:
+                    yield key, occurrence
+            last = first - one_day
+    else:
+        first = max(origin, start)
+        while (first - origin).days <= AGENDA_HORIZON_DAYS:
+            last = first + window - one_day
+            for occurrence in occurrences(event, first, last):
+                key = (parse_datetime(occurrence["start"]), event["id"])
+                if cursor is None or key > cursor:
+                    yield key, occurrence
+            first = last + one_day
+
+class EventStore(LazyConnection):
+    def __init__(self, backend=None):
+        super().__init__()
+        # Chosen by STORAGE_BACKEND when not given; see data.backends
+        self._backend = backend
+        self._available = False
         self.user_id = None # Set when user logs in
-        self._connect()
+        self.backfill = None # Future of the login-time date backfill
+        self.cache = MonthCache(max_size=int(os.getenv("EVENT_CACHE_MONTHS", "24")))
+        self.call_timeout = float(os.getenv("STORE_CALL_TIMEOUT_S", "15"))
+        self._io_executor = None
+        # Local copy of the logged-in user's events, kept current by change streams or polling
+        self.sync_enabled = os.getenv("EVENT_SYNC", "on") != "off"
+        self.replica = EventReplica(on_change=self._on_replica_change)
+
+    @property
+    def backend(self):
+        """The connected storage backend, or None when it is unavailable."""
+        self._ensure_connected()
+        return self._backend if self._available else None
 
     def _connect(self):
-        mongo_uri = os.getenv("MONGO_URI")
-        if mongo_uri:
-            try:
-                self.client = MongoClient(mongo_uri)
-                self.db = self.client.get_database("ai_calendar_db")
-                self.collection = self.db.get_collection("events")
-                print("Connected to MongoDB")
-            except Exception as e:
-                print(f"Error connecting to MongoDB: {e}")
-        else:
-            print("MONGO_URI not found in .env")
+        self._available = False
+        try:
+            if self._backend is None:
+                self._backend = create_backend()
+            self._available = self._backend.connect()
+        except Exception as e:
+            print(f"Error connecting to event storage: {e}")
 
     def set_user(self, user_id):
         self.user_id = user_id
+        self.replica.stop()
+        if user_id:
+            # Off the login handler: a long history means one batch of many writes
+            self.backfill = self._executor().submit(self._backfill_normalized_dates, user_id)
+            if self.sync_enabled and self.backend is not None:
+                self.replica.start(self.backend, user_id, PROJECTIONS["timeline"])
 
-    def add_event(self, title, start_date, end_date, description, event_type="event", recurrence=None, priority="Medium", completed=False):
-        if self.collection is None or not self.user_id:
-            print("Database not connected or user not set")
-            return None
+    def _on_replica_change(self, old, new):
+        self._invalidate_all([self._placement_predicate(doc) for doc in (old, new) if doc is not None])
 
-        new_event = {
+    def _normalized_dates(self, start, end):
+        # Datetime copies of the "YYYY-MM-DD HH:MM" strings so the backend can range-filter
+        start_at = parse_datetime(start)
+        end_at = parse_datetime(end) or start_at
+        return {"start_at": start_at, "end_at": end_at}
+
+    def _backfill_normalized_dates(self, user_id):
+        # Events created before start_at/end_at (or updated_at) existed get them on first login,
+        # in one bulk write. Returns how many were updated.
+        if self.backend is None:
+            return 0
+        try:
+            docs = self.backend.missing_normalized_dates(user_id)
+            if not docs or user_id != self.user_id:
+                return 0
+            updated_at = utcnow()
+            changes = [
+                (doc["id"], {**self._normalized_dates(doc.get("start"), doc.get("end")), "updated_at": updated_at})
+                for doc in docs
+            ]
+            failed = self.backend.update_many(user_id, changes, ordered=False)
+        except Exception as e:
+            print(f"Error backfilling event dates: {e}")
+            return 0
+        if failed:
+            print(f"Error backfilling event dates: {len(failed)} of {len(changes)} events not updated")
+        # Months read while this ran were missing those events. A running replica picks
+        # the writes up through updated_at like any other change.
+        self.cache.invalidate(lambda key: key[0] == user_id)
+        return len(changes) - len(failed)
+
+    def _placement_predicate(self, event):
+        # Matches the cached months an event (or a version of it) shows up in
+        user_id = self.user_id
+        start_at = event.get("start_at")
+        start = start_at.date() if isinstance(start_at, datetime) else parse_date(event.get("start"))
+        if start is None:
+            return lambda key: key[0] == user_id
+        first = (start.year, start.month)
+        if not is_recurring(event):
+            return lambda key: key[:3] == (user_id, start.year, start.month)
+        if event.get("recurrence") == "yearly":
+            return lambda key: key[0] == user_id and key[1:3] >= first and key[2] == start.month
+        # Series touch every month from their start onwards
+        return lambda key: key[0] == user_id and key[1:3] >= first
+
+    def _update_predicate(self, event_id, updates):
+        # Months holding the old version, then wherever the new version lands
+        cached = self.cache.find_event(self.user_id, event_id)
+        stale_keys = set(self.cache.keys_containing(self.user_id, event_id))
+        if cached is not None:
+            moved = self._placement_predicate({**cached, **updates})
+        elif {"start", "recurrence"} & set(updates):
+            moved = self._placement_predicate({})
+        else:
+            moved = lambda key: False
+        return lambda key: key in stale_keys or moved(key)
+
+    def _delete_predicate(self, event_id, lookup=True):
+        # Months holding the event, per-day counts included; worked out before it is gone.
+        # A synced replica reports the delete itself, otherwise the stored doc is read.
+        stale_keys = set(self.cache.keys_containing(self.user_id, event_id))
+        doc = self.cache.find_event(self.user_id, event_id)
+        if doc is None and lookup and not self.replica.ready.is_set():
+            try:
+                doc = self.backend.get(self.user_id, event_id)
+            except Exception as e:
+                print(f"Error fetching event: {e}")
+        if doc is not None:
+            placed = self._placement_predicate(doc)
+        elif self.replica.ready.is_set():
+            placed = lambda key: False
+        else:
+            # Unknown placement: only counts can hold an event no cached month does
+            user_id = self.user_id
+            placed = lambda key: key[0] == user_id and key[3] == DENSITY
+        return lambda key: key in stale_keys or placed(key)
+
+    def _invalidate_all(self, predicates):
+        # One cache pass for a whole batch of writes
+        if predicates:
+            self.cache.invalidate(lambda key: any(predicate(key) for predicate in predicates))
+
+    def _new_event_doc(self, title, start_date, end_date, description, event_type="event", recurrence=None, priority="Medium", completed=False):
+        return {
             "user_id": self.user_id,
             "title": title,
             "start": start_date,
@@ -44,118 +206,335 @@ class EventStore:
             "recurrence": recurrence,
             "priority": priority,
             "completed": completed,
-            "created_at": datetime.now()
+            "created_at": datetime.now(),
+            "updated_at": utcnow(),
+            **self._normalized_dates(start_date, end_date)
         }
-        result = self.collection.insert_one(new_event)
-        new_event["id"] = str(result.inserted_id)
+
+    def _normalize_updates(self, updates):
+        updates = {**updates, "updated_at": utcnow()}
+        if "start" not in updates and "end" not in updates:
+            return updates
+        normalized = self._normalized_dates(updates.get("start"), updates.get("end"))
+        if "start" in updates:
+            updates["start_at"] = normalized["start_at"]
+        if "end" in updates:
+            updates["end_at"] = normalized["end_at"]
+        return updates
+
+    def add_event(self, title, start_date, end_date, description, event_type="event", recurrence=None, priority="Medium", completed=False):
+        if self.backend is None or not self.user_id:
+            print("Event storage not available or user not set")
+            return None
+
+        new_event = self._new_event_doc(title, start_date, end_date, description, event_type, recurrence, priority, completed)
+        new_event["id"] = self.backend.insert(new_event)
+        self._invalidate_all([self._placement_predicate(new_event)])
+        self.replica.upsert(new_event)
         return new_event
 
     def update_event(self, event_id, updates):
-        if self.collection is None or not self.user_id:
+        if self.backend is None or not self.user_id:
             return None
         
-        from bson.objectid import ObjectId
+        updates = self._normalize_updates(updates)
+        stale = self._update_predicate(event_id, updates)
         try:
             # Ensure we only update fields that are allowed and belong to the user
-            result = self.collection.update_one(
-                {"_id": ObjectId(event_id), "user_id": self.user_id},
-                {"$set": updates}
-            )
-            return result.modified_count > 0
+            updated = self.backend.update(self.user_id, event_id, updates)
+            self._invalidate_all([stale])
+            self.replica.patch(event_id, updates)
+            return updated
         except Exception as e:
             print(f"Error updating event: {e}")
             return False
 
     def delete_event(self, event_id):
-        if self.collection is None or not self.user_id:
+        if self.backend is None or not self.user_id:
             return
         
-        from bson.objectid import ObjectId
+        stale = self._delete_predicate(event_id)
         try:
-            self.collection.delete_one({"_id": ObjectId(event_id), "user_id": self.user_id})
+            self.backend.delete(self.user_id, event_id)
+            self._invalidate_all([stale])
+            self.replica.remove(event_id)
         except Exception as e:
             print(f"Error deleting event: {e}")
 
-    def get_events_for_month(self, year, month):
-        if self.collection is None or not self.user_id:
-            return []
+    # Bulk writes: one backend round trip and one cache invalidation per batch.
+    # Results line up with the input; items that failed, or were skipped because an
+    # earlier item failed in ordered mode, come back as None/False.
+
+    def add_events(self, events, ordered=True):
+        """Insert many events; `events` are dicts of add_event() keyword arguments. Returns the new docs (None on failure)."""
+        if self.backend is None or not self.user_id:
+            print("Event storage not available or user not set")
+            return [None] * len(events)
+
+        docs = [self._new_event_doc(**fields) for fields in events]
+        failed = self.backend.insert_many(docs, ordered)
+        results = [None if index in failed else doc for index, doc in enumerate(docs)]
+        self._invalidate_all([self._placement_predicate(doc) for doc in results if doc is not None])
+        for doc in results:
+            if doc is not None:
+                self.replica.upsert(doc)
+        return results
+
+    def update_events(self, changes, ordered=True):
+        """Apply many updates; `changes` is a list of (event_id, updates) pairs. Returns a bool per pair."""
+        if self.backend is None or not self.user_id:
+            return [False] * len(changes)
+
+        changes = [(event_id, self._normalize_updates(updates)) for event_id, updates in changes]
+        predicates = [self._update_predicate(event_id, updates) for event_id, updates in changes]
+        failed = self.backend.update_many(self.user_id, changes, ordered)
+        results = []
+        for index, (event_id, updates) in enumerate(changes):
+            results.append(index not in failed)
+            if results[index]:
+                self.replica.patch(event_id, updates)
+        self._invalidate_all(predicates)
+        return results
+
+    def delete_events(self, event_ids, ordered=True):
+        """Delete many events by id. Returns a bool per id."""
+        if self.backend is None or not self.user_id:
+            return [False] * len(event_ids)
+
+        # No per-id reads here: uncached events just drop the user's counts
+        predicates = [self._delete_predicate(event_id, lookup=False) for event_id in event_ids]
+        failed = self.backend.delete_many(self.user_id, event_ids, ordered)
+        results = []
+        for index, event_id in enumerate(event_ids):
+            results.append(index not in failed)
+            if results[index]:
+                self.replica.remove(event_id)
+        self._invalidate_all(predicates)
+        return results
+
+    def get_event(self, event_id):
+        """The full document of one event, e.g. when its details are opened."""
+        if self.backend is None or not self.user_id:
+            return None
 
-        # Get all events for the user (filtering by date is complex with recurrence, so we fetch all and filter in python for now)
-        # Optimization: In a real app, we would query for non-recurring events in range OR recurring events
         try:
-            cursor = self.collection.find({"user_id": self.user_id})
-            events = []
-            for doc in cursor:
-                doc["id"] = str(doc["_id"])
-                events.append(doc)
+            return self.backend.get(self.user_id, event_id)
         except Exception as e:
-            print(f"Error fetching events: {e}")
+            print(f"Error fetching event: {e}")
+            return None
+
+    def get_events_for_month(self, year, month, projection="timeline"):
+        return self.get_events_in_range(*month_bounds(year, month), projection=projection)
+
+    def get_events_in_range(self, start, end, projection="timeline"):
+        """
+        Occurrences of the user's events between two dates (inclusive), recurring series expanded.
+
+        `projection` names a PROJECTIONS profile limiting the fields fetched and copied per occurrence.
+        """
+        if self.backend is None or not self.user_id:
             return []
-        
+
+        months = months_between(start, end)
+        by_month = {}
+        missing = []
+        for year, month in months:
+            cached = self.cache.get((self.user_id, year, month, projection))
+            if cached is None:
+                missing.append((year, month))
+            else:
+                by_month[(year, month)] = cached
+
+        if missing:
+            fetched = self._fetch_months(missing, projection)
+            if fetched is None:
+                return []
+            by_month.update(fetched)
+
         results = []
-        
-        # Helper to get number of days in month
-        import calendar
-        _, num_days = calendar.monthrange(year, month)
-        
-        for event in events:
-            # Handle both "YYYY-MM-DD" and "YYYY-MM-DD HH:MM"
-            try:
-                start_str = event["start"].split(" ")[0]
-                start_dt = datetime.strptime(start_str, "%Y-%m-%d").date()
-            except (ValueError, IndexError):
-                continue
-
-            recurrence = event.get("recurrence")
-            
-            # If non-recurring, check if it falls in this month
-            if not recurrence or recurrence == "none":
-                if start_dt.year == year and start_dt.month == month:
-                    results.append(event)
-                continue
-                
-            # Handle recurrence
-            # We only care if the event started on or before this month (or if it repeats yearly in this month)
-            
-            # Optimization: If event starts after this month, skip
-            if start_dt.year > year or (start_dt.year == year and start_dt.month > month):
-                continue
-                
-            # Generate occurrences for this month
-            for day in range(1, num_days + 1):
-                current_date = datetime(year, month, day).date()
-                
-                # Skip if before start date
-                if current_date < start_dt:
-                    continue
-                    
-                should_add = False
-                
-                if recurrence == "daily":
-                    should_add = True
-                elif recurrence == "workdays":
-                    # Mon=0, Sun=6
-                    if current_date.weekday() < 5:
-                        should_add = True
-                elif recurrence == "weekends":
-                    if current_date.weekday() >= 5:
-                        should_add = True
-                elif recurrence == "monthly":
-                    if current_date.day == start_dt.day:
-                        should_add = True
-                elif recurrence == "yearly":
-                    if current_date.month == start_dt.month and current_date.day == start_dt.day:
-                        should_add = True
-                        
-                if should_add:
-                    # Create a virtual event instance
-                    instance = event.copy()
-                    instance["start"] = current_date.isoformat()
-                    instance["end"] = current_date.isoformat()
-                    # Append original ID to track it
-                    results.append(instance)
-                    
+        for year, month in months:
+            first_day, last_day = month_bounds(year, month)
+            if start <= first_day and last_day <= end:
+                results.extend(by_month[(year, month)])
+            else:
+                results.extend(e for e in by_month[(year, month)] if start <= parse_date(e["start"]) <= end)
         return results
 
+    def get_day_counts(self, year, month):
+        """
+        {date: {"events": n, "tasks": n}} for every day of a month that has something on it.
+
+        Counted without fetching the month: from an already cached month or the synced
+        replica when there is one, otherwise by the backend's per-day aggregation plus
+        the user's recurring series, expanded here. Cached like a month of occurrences.
+        """
+        if self.backend is None or not self.user_id:
+            return {}
+
+        key = (self.user_id, year, month, DENSITY)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return {row["date"]: {"events": row["events"], "tasks": row["tasks"]} for row in cached}
+
+        generation = self.cache.generation
+        first_day, last_day = month_bounds(year, month)
+        loaded = next(
+            (events for events in (self.cache.get((self.user_id, year, month, p)) for p in ("grid", "timeline")) if events is not None),
+            None
+        )
+        if loaded is not None:
+            counts = _count_by_day(loaded)
+        elif self.replica.ready.is_set():
+            counts = _count_by_day(
+                instance for event in self.replica.docs_in_range(first_day, last_day)
+                for instance in occurrences(event, first_day, last_day)
+            )
+        else:
+            try:
+                counts = self.backend.day_counts(self.user_id, first_day, last_day)
+                series = self.backend.find_series(self.user_id, last_day, {"type": 1, "start": 1, "end": 1, "recurrence": 1})
+            except Exception as e:
+                print(f"Error counting events: {e}")
+                return {}
+            for event in series:
+                kind = "tasks" if event.get("type") == "task" else "events"
+                for day in occurrence_dates(event, first_day, last_day):
+                    counts.setdefault(day, {"events": 0, "tasks": 0})[kind] += 1
+
+        rows = [{"date": day, **bucket} for day, bucket in sorted(counts.items())]
+        self.cache.put(key, rows, generation=generation)
+        return counts
+
+    def get_agenda_page(self, after=None, before=None, limit=50):
+        """
+        Up to `limit` occurrences in (start_at, id) order, one-off events and expanded
+        series merged, and the cursor for the page after them.
+
+        Keyset pagination: pass a returned cursor back as `after` to continue forward, or
+        as `before` to page back in time (nearest first). The backend only ever returns
+        `limit` one-off events, so no page loads more than it shows. The cursor is None
+        once there is nothing further in that direction.
+        """
+        if self.backend is None or not self.user_id:
+            return [], None
+
+        backward = before is not None
+        cursor = before if backward else after
+        fields = PROJECTIONS["timeline"]
+        try:
+            one_offs = self.backend.find_page(self.user_id, after=after, before=before, limit=limit, fields=fields)
+            series = self.backend.find_series(self.user_id, fields=fields)
+        except Exception as e:
+            print(f"Error fetching agenda page: {e}")
+            return [], None
+
+        streams = [[((doc["start_at"], doc["id"]), doc) for doc in one_offs if doc.get("start_at")]]
+        streams += [_series_stream(event, cursor, backward) for event in series]
+        page = list(itertools.islice(heapq.merge(*streams, key=lambda item: item[0], reverse=backward), limit))
+        next_cursor = page[-1][0] if len(page) == limit else None
+        return [occurrence for _, occurrence in page], next_cursor
+
+    def has_range(self, start, end, projection="timeline"):
+        """True when every month of the range is already cached, i.e. reading it costs no round trip."""
+        return all(self.cache.contains((self.user_id, year, month, projection)) for year, month in months_between(start, end))
+
+    def prefetch_range(self, start, end, projection="timeline"):
+        """Load the uncached months of a range into the cache without counting as a read."""
+        if self.backend is None or not self.user_id:
+            return
+        missing = [
+            (year, month) for year, month in months_between(start, end)
+            if not self.cache.contains((self.user_id, year, month, projection))
+        ]
+        if missing:
+            self._fetch_months(missing, projection)
+
+    def _query_events(self, start, end, projection):
+        try:
+            return self.backend.find_range(self.user_id, start, end, PROJECTIONS[projection])
+        except Exception as e:
+            print(f"Error fetching events: {e}")
+            return None
+
+    def _fetch_months(self, months, projection):
+        # One round trip covering every missing month, split into per-month cache entries
+        generation = self.cache.generation
+        first_day, _ = month_bounds(*months[0])
+        _, last_day = month_bounds(*months[-1])
+        if self.replica.ready.is_set():
+            # Served from the synced local copy: no round trip at all
+            events = self.replica.docs_in_range(first_day, last_day)
+        else:
+            events = self._query_events(first_day, last_day, projection)
+            if events is None:
+                return None
+
+        fetched = {key: [] for key in months}
+        for event in events:
+            for instance in occurrences(event, first_day, last_day):
+                day = parse_date(instance["start"])
+                if (day.year, day.month) in fetched:
+                    fetched[(day.year, day.month)].append(instance)
+
+        for (year, month), instances in fetched.items():
+            self.cache.put((self.user_id, year, month, projection), instances, generation=generation)
+        return fetched
+
+    # Async facade: blocking backend calls run on a bounded, named pool so the UI loop
+    # (and the loop's default executor) never wait on the network.
+
+    def _executor(self):
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("STORE_IO_WORKERS", "4")),
+                thread_name_prefix="store-io"
+            )
+        return self._io_executor
+
+    async def _run(self, func, *args, timeout=None, **kwargs):
+        """
+        Await func(*args, **kwargs) on the store I/O pool.
+
+        Raises asyncio.TimeoutError after `timeout` seconds (default: STORE_CALL_TIMEOUT_S).
+        Cancelling the awaiting task drops calls that have not started yet; a call that is
+        already talking to the server finishes in the background and its result is discarded.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor(), functools.partial(func, *args, **kwargs))
+        return await asyncio.wait_for(future, timeout or self.call_timeout)
+
+    async def aget_range(self, start, end, projection="timeline", timeout=None):
+        return await self._run(self.get_events_in_range, start, end, projection=projection, timeout=timeout)
+
+    async def aget_events_for_month(self, year, month, projection="timeline", timeout=None):
+        return await self._run(self.get_events_for_month, year, month, projection=projection, timeout=timeout)
+
+    async def aget_day_counts(self, year, month, timeout=None):
+        return await self._run(self.get_day_counts, year, month, timeout=timeout)
+
+    async def aget_agenda_page(self, after=None, before=None, limit=50, timeout=None):
+        return await self._run(self.get_agenda_page, after=after, before=before, limit=limit, timeout=timeout)
+
+    async def aget_event(self, event_id, timeout=None):
+        return await self._run(self.get_event, event_id, timeout=timeout)
+
+    async def aadd_event(self, *args, timeout=None, **kwargs):
+        return await self._run(self.add_event, *args, timeout=timeout, **kwargs)
+
+    async def aupdate_event(self, event_id, updates, timeout=None):
+        return await self._run(self.update_event, event_id, updates, timeout=timeout)
+
+    async def adelete_event(self, event_id, timeout=None):
+        return await self._run(self.delete_event, event_id, timeout=timeout)
+
+    async def aadd_events(self, events, ordered=True, timeout=None):
+        return await self._run(self.add_events, events, ordered=ordered, timeout=timeout)
+
+    async def aupdate_events(self, changes, ordered=True, timeout=None):
+        return await self._run(self.update_events, changes, ordered=ordered, timeout=timeout)
+
+    async def adelete_events(self, event_ids, ordered=True, timeout=None):
+        return await self._run(self.delete_events, event_ids, ordered=ordered, timeout=timeout)
+
 # Global instance
 store = EventStore()
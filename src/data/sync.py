@@ -0,0 +1,210 @@
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pymongo.errors import OperationFailure, PyMongoError
+
+
+def utcnow():
+    # Naive UTC truncated to milliseconds, i.e. exactly what MongoDB hands back
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+class EventReplica:
+    """
+    In-memory copy of the logged-in user's events, kept current incrementally.
+
+    After one initial load, changes arrive through a change stream when the backend and
+    deployment support them (Mongo replica sets), or else through a delta query on
+    `updated_at` plus the backend's tombstones for deletes. Every effective change is reported to
+    on_change(old_doc, new_doc) so the store can drop the cached months it affects;
+    listeners registered with subscribe() hear about changes made by other sessions.
+    """
+
+    def __init__(self, on_change=None):
+        self.on_change = on_change
+        self.poll_interval = float(os.getenv("SYNC_POLL_INTERVAL_S", "5"))
+        # Writers stamp updated_at with their own clock; re-read this much history on every poll
+        self.clock_skew = timedelta(seconds=float(os.getenv("SYNC_CLOCK_SKEW_S", "5")))
+        self.use_change_streams = os.getenv("SYNC_CHANGE_STREAMS", "on") != "off"
+        self.mode = None # "change_stream" or "polling" once running
+        self.watermark = None
+        self.ready = threading.Event()
+        self._docs = {}
+        self._fields = None
+        self._user_id = None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, backend, user_id, projection):
+        self.stop()
+        self._user_id = user_id
+        self._fields = set(projection) | {"id", "updated_at"}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(backend, user_id, self._stop),
+            name="event-sync",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+        self.mode = None
+        with self._lock:
+            self.ready.clear()
+            self._docs = {}
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # Reads
+
+    def docs_in_range(self, start, end):
+        """In-memory equivalent of the backends' range query (e.g. MongoBackend.range_query)."""
+        range_start = datetime.combine(start, datetime.min.time())
+        range_end = datetime.combine(end + timedelta(days=1), datetime.min.time())
+        results = []
+        with self._lock:
+            for doc in self._docs.values():
+                start_at = doc.get("start_at")
+                if start_at is None or start_at >= range_end:
+                    continue
+                recurrence = doc.get("recurrence")
+                if (not recurrence or recurrence == "none") and start_at < range_start:
+                    continue
+                results.append(dict(doc))
+        return results
+
+    # Writes (local ones are applied straight away; the stream/poll echo is then a no-op)
+
+    def upsert(self, doc, notify=False):
+        if not self.ready.is_set() or doc.get("user_id", self._user_id) != self._user_id:
+            return
+        new = {key: value for key, value in doc.items() if key in self._fields}
+        with self._lock:
+            old = self._docs.get(new["id"])
+            if old == new:
+                return
+            self._docs[new["id"]] = new
+        self._changed(old, new, notify)
+
+    def patch(self, event_id, updates):
+        with self._lock:
+            old = self._docs.get(event_id)
+            if old is None:
+                return
+            new = {**old, **{key: value for key, value in updates.items() if key in self._fields}}
+            self._docs[event_id] = new
+        self._changed(old, new, False)
+
+    def remove(self, event_id, notify=False):
+        with self._lock:
+            old = self._docs.pop(event_id, None)
+        if old is not None:
+            self._changed(old, None, notify)
+
+    def _changed(self, old, new, notify):
+        if self.on_change:
+            self.on_change(old, new)
+        if notify:
+            for callback in list(self._listeners):
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Error in sync listener: {e}")
+
+    # Background sync
+
+    def _initial_load(self, backend, user_id, stop):
+        """Load every doc of the user; False when the replica moved on while the query ran."""
+        docs = {doc["id"]: doc for doc in backend.find_all(user_id, self._fields)}
+        with self._lock:
+            # stop() may have given up waiting on this thread: never hand one user's
+            # events to the next
+            if stop.is_set() or user_id != self._user_id:
+                return False
+            self._docs = docs
+            self.ready.set()
+        print(f"Event replica loaded {len(docs)} events ({self.mode})")
+        return True
+
+    def _run(self, backend, user_id, stop):
+        try:
+            if self.use_change_streams and backend.supports_watch and self._watch(backend, user_id, stop):
+                return
+            self._poll(backend, user_id, stop)
+        except Exception as e:
+            print(f"Event sync stopped: {e}")
+
+    def _watch(self, backend, user_id, stop):
+        """Follow a change stream; returns False when the deployment does not support them."""
+        resume_token = None
+        while not stop.is_set():
+            try:
+                # Open the stream before the initial load so nothing slips in between
+                with backend.watch(user_id, resume_after=resume_token) as stream:
+                    if not self.ready.is_set():
+                        self.mode = "change_stream"
+                        if not self._initial_load(backend, user_id, stop):
+                            return True
+                    while not stop.is_set() and stream.alive:
+                        change = stream.try_next()
+                        resume_token = stream.resume_token
+                        if change is not None and not stop.is_set():
+                            self._apply_change(change)
+            except OperationFailure as e:
+                if not self.ready.is_set():
+                    # e.g. "The $changeStream stage is only supported on replica sets"
+                    print(f"Change streams unavailable, falling back to polling: {e}")
+                    return False
+                print(f"Change stream error, resuming: {e}")
+                stop.wait(1)
+            except PyMongoError as e:
+                print(f"Change stream error, resuming: {e}")
+                stop.wait(1)
+        return True
+
+    def _apply_change(self, change):
+        operation = change.get("operationType")
+        event_id = str(change.get("documentKey", {}).get("_id"))
+        if operation == "delete":
+            self.remove(event_id, notify=True)
+        elif operation in ("insert", "update", "replace"):
+            doc = change.get("fullDocument")
+            if doc is None:
+                # Deleted again before the lookup; the delete event follows
+                return
+            doc["id"] = str(doc["_id"])
+            self.upsert(doc, notify=True)
+
+    def _poll(self, backend, user_id, stop):
+        self.mode = "polling"
+        self.watermark = utcnow()
+        if not self._initial_load(backend, user_id, stop):
+            return
+        while not stop.wait(self.poll_interval):
+            since = self.watermark - self.clock_skew
+            polled_at = utcnow()
+            try:
+                changed, deleted = backend.changes_since(user_id, since, self._fields)
+            except Exception as e:
+                print(f"Error polling event changes: {e}")
+                continue
+            if stop.is_set():
+                return # A late answer for a replica that has moved on
+            for doc in changed:
+                self.upsert(doc, notify=True)
+            for event_id in deleted:
+                self.remove(event_id, notify=True)
+            self.watermark = polled_at
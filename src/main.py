@@ -3,17 +3,20 @@ from components.layout import AppLayout
 from components.header import Header
 from components.chat import ChatWidget
 from components.login_view import LoginView
-from utils.translations import translations
+from utils.translations import Translations
 from data.store import store
+from services.auth_service import auth_service
 
 def main(page: ft.Page):
     page.title = "AI Calendar"
     page.theme_mode = ft.ThemeMode.LIGHT
+
+    # Warm the database connection up while the login screen renders
+    auth_service.connect_in_background()
+    store.connect_in_background()
     
-    # Load saved language preference
-    saved_language = page.client_storage.get("language")
-    if saved_language:
-        translations.set_language(saved_language)
+    # This page's language, from its saved preference; other sessions keep their own
+    translations = Translations(page.client_storage.get("language") or "en")
     
     # Set Google Calendar-like colors
     page.theme = ft.Theme(
@@ -51,30 +54,16 @@ def main(page: ft.Page):
         page.add(login_view)
         page.update()
 
-    def refresh_ui():
-        """Refresh all UI components when language changes"""
-        page.clean()
-        # Get current user info if available
-        if hasattr(page, 'current_user_info'):
-            show_app(page.current_user_info)
-        else:
-            show_login()
-
     def show_app(user_info):
-        # Store user info for language change refresh
-        page.current_user_info = user_info
-        
+        # Language and theme changes are applied in place by the components
+        # (see utils.translations / utils.theme), so the app is built once per login
         # Initialize the main layout
-        app_layout = AppLayout(page, user_info, on_logout)
+        app_layout = AppLayout(page, user_info, on_logout, translations=translations)
         
         # Header needs to know about account click to switch view
         def on_account_click():
             app_layout.set_view("Account")
 
-        def on_language_change():
-            """Handle language change - refresh entire UI"""
-            refresh_ui()
-
         def on_menu_click(e):
             """Handle menu button click to toggle sidebar"""
             app_layout.toggle_sidebar()
@@ -82,9 +71,9 @@ def main(page: ft.Page):
         page.appbar = Header(
             page, 
             on_account_click, 
-            on_language_change=on_language_change, 
             on_menu_click=on_menu_click,
-            on_theme_change=on_language_change # Reuse refresh_ui for theme change
+            theme=app_layout.theme,
+            translations=app_layout.translations,
         )
         
         # Use Stack to overlay ChatWidget
@@ -1,28 +1,24 @@
 import os
 import json
+import hashlib
+import threading
+from collections import OrderedDict
 import google.generativeai as genai
 from dotenv import load_dotenv
 from datetime import datetime
+from services.response_cache import ResponseCache
 
 # Load environment variables
 load_dotenv()
 
-class AIService:
-    def __init__(self):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            print("Warning: GEMINI_API_KEY not found in .env")
-            self.model = None
-            return
-
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-lite')
-        
-        self.system_prompt = """
+# Sent once per session as the system instruction. It never changes between calls, so
+# the API can reuse it as a cached prefix; the date travels in each turn instead.
+SYSTEM_PROMPT = """
 You are a smart calendar assistant. Your goal is to help the user manage their schedule and tasks.
 The user will ask you to schedule events or tasks. You must extract the details and return a JSON object.
 
-Current Date: {current_date}
+Every message starts with a line giving the user's current date and time.
+Resolve relative dates ("tomorrow", "next Monday") against it.
 
 Rules:
 1.  Analyze the user's request to determine if it's an 'event' or a 'task'.
@@ -32,9 +28,12 @@ Rules:
     -   'Low': Reminders, "nice to do", far future.
 3.  Extract the title, start date, end date, and description.
 4.  If time is not specified, default to 09:00 for start and 10:00 for end.
-5.  Return ONLY a JSON object with the following structure (no markdown, no extra text):
+5.  Set "standalone" to true when the message is a complete request that would get the same
+    answer in any conversation, and to false when it relies on earlier messages (replies such
+    as "yes", or "it"/"that" referring back).
+6.  Return ONLY a JSON object with the following structure (no markdown, no extra text):
 
-{{
+{
     "action": "create",
     "type": "event" | "task",
     "title": "string",
@@ -42,31 +41,170 @@ Rules:
     "end": "YYYY-MM-DD HH:MM",
     "description": "string",
     "priority": "High" | "Medium" | "Low",
-    "response_message": "A friendly confirmation message to show the user"
-}}
+    "response_message": "A friendly confirmation message to show the user",
+    "standalone": true | false
+}
 
 If the user's request is not about scheduling, just chat normally but return a JSON with action="chat":
-{{
+{
     "action": "chat",
-    "response_message": "Your conversational response here"
-}}
+    "response_message": "Your conversational response here",
+    "standalone": true | false
+}
 """
 
-    def process_message(self, user_message: str):
+USAGE_FIELDS = ("prompt_tokens", "response_tokens", "cached_tokens", "total_tokens")
+
+
+def _usage(response):
+    """Token counts of one call, from the response's usage_metadata (zeros when missing)."""
+    metadata = getattr(response, "usage_metadata", None)
+    return {
+        "prompt_tokens": getattr(metadata, "prompt_token_count", 0) or 0,
+        "response_tokens": getattr(metadata, "candidates_token_count", 0) or 0,
+        "cached_tokens": getattr(metadata, "cached_content_token_count", 0) or 0,
+        "total_tokens": getattr(metadata, "total_token_count", 0) or 0,
+    }
+
+
+def _content_text(content):
+    # History entries are protos from the API, or dicts where record() added them
+    if isinstance(content, dict):
+        return content["role"], [str(part) for part in content["parts"]]
+    return content.role, [part.text for part in content.parts]
+
+
+class ChatSession:
+    """
+    One user's conversation: a model chat kept across messages with a bounded history.
+
+    Only the last `max_turns` exchanges are resent with each message, so context such as
+    "move it to 3pm" still resolves while the prompt stays a fixed size. Messages of one
+    session are sent one at a time; different users don't wait for each other.
+    """
+
+    def __init__(self, model, max_turns=10):
+        self.model = model
+        self.chat = model.start_chat(history=[])
+        self.max_turns = max_turns
+        self.usage = dict.fromkeys(USAGE_FIELDS, 0)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def send(self, text):
+        with self.lock:
+            history = list(self.chat.history)
+            try:
+                response = self.chat.send_message(text)
+                reply = response.text # Raises for blocked responses
+                self._trim()
+            except Exception:
+                # Start over from the last good history rather than keep a half-finished turn
+                self.chat = self.model.start_chat(history=history)
+                raise
+            usage = _usage(response)
+            self.calls += 1
+            for field in USAGE_FIELDS:
+                self.usage[field] += usage[field]
+            return reply, usage
+
+    def context(self):
+        """Digest of the history the next message is read against ("new" before the first one)."""
+        with self.lock:
+            history = self.chat.history
+            if not history:
+                return "new" # Never "", which keys the standalone requests
+            digest = hashlib.sha256(json.dumps([_content_text(content) for content in history]).encode("utf-8"))
+            return digest.hexdigest()[:16]
+
+    def record(self, text, reply):
+        """Add an exchange answered without the model (a cache hit) to the history."""
+        with self.lock:
+            self.chat.history = list(self.chat.history) + [
+                {"role": "user", "parts": [text]},
+                {"role": "model", "parts": [reply]},
+            ]
+            self._trim()
+
+    def _trim(self):
+        history = self.chat.history
+        if len(history) > 2 * self.max_turns:
+            self.chat.history = history[-2 * self.max_turns:]
+
+
+class AIService:
+    def __init__(self):
+        # Repeated requests are answered from here instead of the API; see ResponseCache
+        self.cache = ResponseCache(
+            max_size=int(os.getenv("AI_CACHE_SIZE", "256")),
+            ttl=float(os.getenv("AI_CACHE_TTL_S", "3600")),
+            path=os.getenv("AI_CACHE_PATH") or None,
+        )
+        self.max_turns = int(os.getenv("AI_HISTORY_TURNS", "10"))
+        self.max_sessions = int(os.getenv("AI_MAX_SESSIONS", "32"))
+        self.sessions = OrderedDict() # user id -> ChatSession, least recently used first
+        self.sessions_lock = threading.Lock()
+        self.usage = dict.fromkeys(USAGE_FIELDS, 0) # summed over every session
+        self.calls = 0
+        self.last_usage = None
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            print("Warning: GEMINI_API_KEY not found in .env")
+            self.model = None
+            return
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel('gemini-2.0-flash-lite', system_instruction=SYSTEM_PROMPT)
+
+    def session(self, user_id=None):
+        """The ChatSession of `user_id`, started on first use; past max_sessions the idlest is dropped."""
+        with self.sessions_lock:
+            session = self.sessions.get(user_id)
+            if session is None:
+                session = self.sessions[user_id] = ChatSession(self.model, self.max_turns)
+                while len(self.sessions) > self.max_sessions:
+                    self.sessions.popitem(last=False)
+            self.sessions.move_to_end(user_id)
+            return session
+
+    def reset_session(self, user_id=None):
+        with self.sessions_lock:
+            self.sessions.pop(user_id, None)
+
+    def usage_stats(self):
+        with self.sessions_lock:
+            return {"calls": self.calls, **self.usage, "sessions": len(self.sessions)}
+
+    def process_message(self, user_message: str, user_id=None):
         if not self.model:
             return {
                 "action": "chat",
                 "response_message": "AI Service is not configured. Please check your API key."
             }
 
+        now = datetime.now()
+        session = self.session(user_id)
+        # A short preamble per turn instead of the whole prompt; the weekday helps "next Monday"
+        text = f"[Now: {now.strftime('%Y-%m-%d %H:%M, %A')}]\n{user_message}"
+        # Requests the model marked standalone are cached by their words alone, so repeats hit
+        # in any conversation; a follow-up such as "yes" or "move it to 3pm" only under the
+        # exact history it was answered against
+        standalone_key = self.cache.key(user_message, now.date(), user_id)
+        context_key = self.cache.key(user_message, now.date(), user_id, session.context())
+        cached = self.cache.lookup([standalone_key, context_key])
+        if cached is not None:
+            session.record(text, json.dumps(cached)) # Follow-ups can still refer to it
+            return cached
+
         try:
-            current_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-            prompt = self.system_prompt.format(current_date=current_date)
-            
-            chat = self.model.start_chat(history=[])
-            response = chat.send_message(f"{prompt}\n\nUser: {user_message}")
-            
-            text_response = response.text.strip()
+            reply, usage = session.send(text)
+            with self.sessions_lock:
+                self.calls += 1
+                self.last_usage = usage
+                for field in USAGE_FIELDS:
+                    self.usage[field] += usage[field]
+
+            text_response = reply.strip()
             
             # Clean up potential markdown code blocks
             if text_response.startswith("```json"):
@@ -76,7 +214,10 @@ If the user's request is not about scheduling, just chat normally but return a J
             if text_response.endswith("```"):
                 text_response = text_response[:-3]
             
-            return json.loads(text_response.strip())
+            result = json.loads(text_response.strip())
+            standalone = result.pop("standalone", False) is True
+            self.cache.put(standalone_key if standalone else context_key, result) # Errors below are never cached
+            return result
             
         except Exception as e:
             error_str = str(e)
@@ -1,29 +1,32 @@
-import os
 import hashlib
 import datetime
-from pymongo import MongoClient
-from dotenv import load_dotenv
+from data.connection import get_client, LazyConnection, DATABASE_NAME
+from data.indexes import ensure_indexes
 
-load_dotenv()
-
-class AuthService:
+class AuthService(LazyConnection):
     def __init__(self):
+        super().__init__()
         self.client = None
         self.db = None
-        self.users = None
-        self._connect()
+        self._users = None
+
+    @property
+    def users(self):
+        self._ensure_connected()
+        return self._users
 
     def _connect(self):
-        mongo_uri = os.getenv("MONGO_URI")
-        if mongo_uri:
-            try:
-                self.client = MongoClient(mongo_uri)
-                self.db = self.client.get_database("ai_calendar_db")
-                self.users = self.db.get_collection("users")
-            except Exception as e:
-                print(f"Error connecting to MongoDB (Auth): {e}")
-        else:
-            print("MONGO_URI not found in .env")
+        try:
+            client = get_client()
+            if client is None:
+                print("MONGO_URI not found in .env")
+                return
+            self.client = client
+            self.db = self.client.get_database(DATABASE_NAME)
+            self._users = self.db.get_collection("users")
+            ensure_indexes(self.db, "users")
+        except Exception as e:
+            print(f"Error connecting to MongoDB (Auth): {e}")
 
     def _hash_password(self, password):
         return hashlib.sha256(password.encode()).hexdigest()
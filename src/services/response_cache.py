@@ -0,0 +1,118 @@
+import os
+import re
+import json
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import date
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(message):
+    """Case, width, spacing and trailing punctuation don't change what a request means."""
+    text = unicodedata.normalize("NFKC", message or "").casefold()
+    return _WHITESPACE.sub(" ", text).strip().rstrip(".!?").strip()
+
+
+class ResponseCache:
+    """
+    Bounded LRU of AI responses keyed by (user, date bucket, context, normalized message), with a TTL.
+
+    The date is part of the key because "lunch tomorrow at 1" means a different day
+    tomorrow. With `path`, entries are written to a JSON file and reloaded (minus the
+    expired ones) on the next start. Lookups hold a lock; the service is called from
+    worker threads.
+    """
+
+    def __init__(self, max_size=256, ttl=3600, path=None, clock=time.time):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._entries = OrderedDict() # key -> (stored_at, response)
+        self._lock = threading.Lock()
+        if path:
+            self._load()
+
+    def key(self, message, today=None, user_id=None, context=""):
+        """`context` names the conversation a reply depends on; "" for requests that stand alone."""
+        return f"{user_id or ''}|{(today or date.today()).isoformat()}|{context}|{normalize_message(message)}"
+
+    def get(self, key):
+        return self.lookup([key])
+
+    def lookup(self, keys):
+        """The response under the first of `keys` that has one; counts as a single hit or miss."""
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and self.clock() - entry[0] > self.ttl:
+                    del self._entries[key]
+                    self.expired += 1
+                    entry = None
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(entry[1])
+            self.misses += 1
+            return None
+
+    def put(self, key, response):
+        # Stored serialized, so callers can't mutate what later hits get back
+        with self._lock:
+            self._entries[key] = (self.clock(), json.dumps(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            if self.path:
+                self._save()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self.path:
+                self._save()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Error loading AI response cache: {e}")
+            return
+        now = self.clock()
+        for key, stored_at, response in stored[-self.max_size:]:
+            if now - stored_at <= self.ttl:
+                self._entries[key] = (stored_at, response)
+
+    def _save(self):
+        # Write-then-rename so a crash mid-write never leaves a truncated file behind
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump([[key, stored_at, response] for key, (stored_at, response) in self._entries.items()], f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Error saving AI response cache: {e}")
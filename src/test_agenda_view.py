@@ -0,0 +1,79 @@
+import asyncio
+import datetime
+from types import SimpleNamespace
+from data.store import store
+import components.agenda_view as agenda_module
+from components.agenda_view import AgendaView
+from conftest import LoopPage
+
+
+def occurrences_around(today):
+    events = []
+    for offset in range(-3, 3):
+        day = today + datetime.timedelta(days=offset)
+        for hour in (9, 14, 18):
+            events.append({"id": f"{offset}-{hour}", "title": f"{day} {hour}", "start": f"{day} {hour:02d}:00", "end": f"{day} {hour:02d}:30",
+                           "type": "task" if hour == 14 else "event"})
+    return events
+
+
+def test_pages_load_on_demand_and_keep_one_header_per_day(monkeypatch):
+    today = datetime.date.today()
+    events = occurrences_around(today)
+    requests = []
+
+    async def aget_agenda_page(after=None, before=None, limit=50, timeout=None):
+        # Keyset over (start, id) like the store's; the view's first cursor is (datetime, "")
+        requests.append("before" if before is not None else "after")
+        key = lambda e: (e["start"], e["id"])
+        cursor = before if before is not None else after
+        edge = (cursor[0].strftime("%Y-%m-%d %H:%M") if isinstance(cursor[0], datetime.datetime) else cursor[0], cursor[1])
+        if before is not None:
+            page = sorted((e for e in events if key(e) < edge), key=key, reverse=True)[:limit]
+        else:
+            page = sorted((e for e in events if key(e) > edge), key=key)[:limit]
+        return page, (key(page[-1]) if len(page) == limit else None)
+
+    monkeypatch.setattr(store, "aget_agenda_page", aget_agenda_page)
+    monkeypatch.setattr(agenda_module, "PAGE_SIZE", 4)
+
+    async def scenario():
+        view = AgendaView()
+        view.page = LoopPage()
+        view.load_events()
+        await asyncio.sleep(0.01)
+        # First page: today's three rows and the first of tomorrow, nothing from the past
+        assert [c.data["title"] for c in view.list_view.controls if c.data] == [e["title"] for e in events[9:13]]
+
+        view.handle_scroll(SimpleNamespace(pixels=0, max_scroll_extent=10_000))
+        await asyncio.sleep(0.01)
+        assert requests == ["after"] # far from the end: nothing loaded
+        view.handle_scroll(SimpleNamespace(pixels=9_900, max_scroll_extent=10_000))
+        await asyncio.sleep(0.01)
+        view.load_earlier(None)
+        await asyncio.sleep(0.01)
+        view.load_earlier(None)
+        await asyncio.sleep(0.01)
+        return view
+
+    view = asyncio.run(scenario())
+    assert requests == ["after", "after", "before", "before"]
+    rows = [c.data["title"] for c in view.list_view.controls if c.data]
+    assert rows == [e["title"] for e in events[1:17]]
+    # Days split across pages still have exactly one header, directly above their rows
+    headers = [i for i, c in enumerate(view.list_view.controls) if c.data is None]
+    assert len(headers) == len(view.day_headers) == 6
+    assert all(view.list_view.controls[i + 1].data is not None for i in headers)
+
+    view.update_filter({"events": True, "tasks": False})
+    assert [c.data["title"] for c in view.list_view.controls if c.data and c.visible] == [e["title"] for e in events[1:17] if e["type"] == "event"]
+
+
+def test_loaded_day_headers_follow_the_language():
+    view = AgendaView()
+    view.append([{"id": "a", "title": "A", "start": "2025-03-10 09:00", "end": "2025-03-10 10:00"}])
+    header = view.day_headers[datetime.date(2025, 3, 10)]
+    assert header.content.value == "Mon, 10 March 2025"
+    view.translations.set_language("ru")
+    view.relabel()
+    assert header.content.value == "Пн, 10 Март 2025"
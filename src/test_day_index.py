@@ -0,0 +1,40 @@
+import datetime
+from data.day_index import DayIndex, start_minute
+
+
+def event(title, start, event_type="event"):
+    return {"title": title, "start": start, "type": event_type}
+
+
+def test_buckets_by_date_sorted_by_start():
+    index = DayIndex([
+        event("Late", "2025-03-10 17:30"),
+        event("Task", "2025-03-10 08:00", "task"),
+        event("Early", "2025-03-10 09:15"),
+        event("Next day", "2025-03-11 09:00"),
+        event("All day", "2025-03-10"),
+    ])
+    day = datetime.date(2025, 3, 10)
+    assert [e["title"] for e in index.on(day)] == ["All day", "Task", "Early", "Late"]
+    assert [e["title"] for e in index.on(datetime.date(2025, 3, 11))] == ["Next day"]
+    assert index.on(datetime.date(2025, 3, 12)) == []
+    assert index.days() == [datetime.date(2025, 3, 10), datetime.date(2025, 3, 11)]
+    assert len(index) == 5
+
+
+def test_filters_pick_the_presplit_lists():
+    index = DayIndex([event("Meeting", "2025-03-10 10:00"), event("Report", "2025-03-10 09:00", "task")])
+    day = datetime.date(2025, 3, 10)
+    assert [e["title"] for e in index.on(day, {"events": True, "tasks": False})] == ["Meeting"]
+    assert [e["title"] for e in index.on(day, {"events": False, "tasks": True})] == ["Report"]
+    assert index.on(day, {"events": False, "tasks": False}) == []
+
+
+def test_skips_events_without_a_date():
+    index = DayIndex([event("Broken", None), event("Garbled", "soon")])
+    assert len(index) == 0
+
+
+def test_start_minute():
+    assert start_minute(event("x", "2025-03-10 13:45")) == 13 * 60 + 45
+    assert start_minute(event("x", "2025-03-10")) == 0
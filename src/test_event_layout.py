@@ -0,0 +1,45 @@
+import datetime
+import random
+from data.day_index import DayIndex
+from utils.event_layout import LayoutCache, layout_events, MIN_DURATION
+
+
+def event(i, start, end):
+    return {"id": str(i), "title": f"E{i}", "start": f"2025-03-10 {start // 60:02d}:{start % 60:02d}", "end": f"2025-03-10 {end // 60:02d}:{end % 60:02d}"}
+
+
+def test_lanes_are_reused_once_free():
+    clusters = layout_events([event(1, 60, 180), event(2, 90, 120), event(3, 120, 150), event(4, 240, 270)])
+    assert [(c.start, c.end, c.lanes) for c in clusters] == [(60, 180, 2), (240, 270, 1)]
+    assert [(b.key[0], b.lane) for b in clusters[0].boxes] == [("1", 0), ("2", 1), ("3", 1)]
+
+
+def test_random_days_never_share_a_lane_and_use_the_minimum():
+    rng = random.Random(3)
+    for _ in range(50):
+        events = []
+        for i in range(rng.randint(1, 60)):
+            start = rng.randrange(0, 23 * 60)
+            events.append(event(i, start, min(start + rng.randint(5, 180), 23 * 60 + 59)))
+        for cluster in layout_events(events):
+            boxes = cluster.boxes
+            assert {b.lane for b in boxes} == set(range(cluster.lanes))
+            for a in boxes:
+                assert a.end - a.start >= MIN_DURATION
+                for b in boxes:
+                    if a is not b and a.lane == b.lane:
+                        assert a.end <= b.start or b.end <= a.start
+            # Lanes used == most events overlapping at one instant
+            assert cluster.lanes == max(sum(b.start <= a.start < b.end for b in boxes) for a in boxes)
+
+
+def test_views_share_one_layout_per_version():
+    cache = LayoutCache()
+    day = datetime.date(2025, 3, 10)
+    events = [event(1, 60, 120), event(2, 90, 150)]
+    day_view_index, week_view_index = DayIndex(events), DayIndex(list(events))
+    first = cache.get(day, day_view_index.version(day), day_view_index.on(day))
+    assert cache.get(day, week_view_index.version(day), week_view_index.on(day)) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    moved = DayIndex([events[0], dict(events[1], start="2025-03-10 03:00", end="2025-03-10 04:00")])
+    assert cache.get(day, moved.version(day), moved.on(day)) is not first
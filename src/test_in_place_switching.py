@@ -0,0 +1,66 @@
+import datetime
+import flet as ft
+from data.day_index import DayIndex
+from components.layout import AppLayout
+from conftest import FakePage
+
+
+def make_layout():
+    layout = AppLayout(FakePage(), {"name": "Ann", "email": "ann@example.com"}, on_logout=None)
+    month = layout.month_view
+    month.current_date = datetime.date(2025, 3, 1)
+    month.is_loading = False
+    month.day_index = DayIndex([{"id": "a", "title": "Meeting", "start": "2025-03-10 10:00", "type": "event"}])
+    month.relabel_header()
+    month.render_calendar()
+    return layout
+
+
+def meeting_cell(month):
+    return next(cell for cells in month.day_cells for cell in cells if cell.date == datetime.date(2025, 3, 10))
+
+
+def test_language_and_theme_switch_keep_the_app():
+    layout = make_layout()
+    month = layout.month_view
+    index = month.day_index
+    cell = meeting_cell(month)
+    chip = next(iter(cell.chips.values()))
+    sidebar = layout.sidebar.content
+    layout.did_mount()
+    try:
+        layout.translations.set_language("ru")
+        assert month.title_text.value == "Март 2025"
+        assert month.weekday_texts[0].value == "Пн"
+        assert sidebar.events_checkbox.label == "События"
+        assert layout.account_view.name_field.label == layout.translations.get("name")
+
+        layout.theme.set_mode(ft.ThemeMode.DARK)
+        assert cell.container.bgcolor == ft.Colors.SURFACE
+
+        # Same views, same loaded events, same chips: nothing was rebuilt or refetched
+        assert layout.month_view is month and month.day_index is index
+        assert next(iter(cell.chips.values())) is chip
+    finally:
+        layout.translations.set_language("en")
+        layout.theme.set_mode(ft.ThemeMode.LIGHT)
+        layout.will_unmount()
+    assert month.title_text.value == "March 2025"
+    assert cell.container.bgcolor == ft.Colors.WHITE
+
+
+def test_theme_and_language_are_per_session():
+    first, second = make_layout(), make_layout()
+    first.did_mount()
+    second.did_mount()
+    try:
+        first.theme.set_mode(ft.ThemeMode.DARK)
+        first.translations.set_language("ru")
+        assert meeting_cell(first.month_view).container.bgcolor == ft.Colors.SURFACE
+        assert first.month_view.title_text.value == "Март 2025"
+        assert meeting_cell(second.month_view).container.bgcolor == ft.Colors.WHITE
+        assert second.month_view.title_text.value == "March 2025"
+        assert not second.theme.dark and second.translations.current_language == "en"
+    finally:
+        first.will_unmount()
+        second.will_unmount()
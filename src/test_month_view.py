@@ -0,0 +1,136 @@
+import asyncio
+import datetime
+from data.store import store
+from data.day_index import DayIndex
+from components.calendar import MonthView, DayCell
+from conftest import FakePage, LoopPage
+
+
+def make_view(events, height=None):
+    view = MonthView()
+    view.page = FakePage(height)
+    view.current_date = datetime.date(2025, 3, 1)
+    view.is_loading = False
+    view.day_index = DayIndex(events)
+    view.render_calendar("events loaded")
+    return view
+
+
+def chips_on(view, date):
+    for cells in view.day_cells:
+        for cell in cells:
+            if cell.date == date:
+                return list(cell.chips.values())
+    return []
+
+
+EVENTS = [
+    {"id": "a", "title": "Meeting", "start": "2025-03-10 10:00", "type": "event"},
+    {"id": "b", "title": "Report", "start": "2025-03-10 09:00", "type": "task"},
+    {"id": "c", "title": "Lunch", "start": "2025-03-12 12:00", "type": "event"},
+]
+
+
+def test_first_render_creates_one_chip_per_occurrence():
+    view = make_view(EVENTS)
+    assert view.render_stats.last["created"] == 3 * DayCell.CHIP_CONTROLS
+    assert [chip.content.value for chip in chips_on(view, datetime.date(2025, 3, 10))] == ["Report", "Meeting"]
+
+
+def test_filter_toggle_keeps_the_remaining_chips():
+    view = make_view(EVENTS)
+    report, meeting = chips_on(view, datetime.date(2025, 3, 10))
+    view.update_filter({"events": True, "tasks": False})
+    assert view.render_stats.last["created"] == 0
+    assert chips_on(view, datetime.date(2025, 3, 10)) == [meeting]
+
+
+def test_single_edit_reuses_every_other_control():
+    view = make_view(EVENTS)
+    lunch = chips_on(view, datetime.date(2025, 3, 12))[0]
+    edited = [dict(EVENTS[0], title="Renamed")] + EVENTS[1:] + [
+        {"id": "d", "title": "New", "start": "2025-03-20 08:00", "type": "event"}
+    ]
+    view.day_index = DayIndex(edited)
+    view.render_calendar("events loaded")
+    assert view.render_stats.last["created"] == DayCell.CHIP_CONTROLS # just the new event
+    assert chips_on(view, datetime.date(2025, 3, 12))[0] is lunch
+    assert [chip.content.value for chip in chips_on(view, datetime.date(2025, 3, 10))] == ["Report", "Renamed"]
+
+
+def test_month_layout_hides_unused_rows():
+    view = make_view([])
+    # March 2025 spans six Monday-first weeks, February 2021 exactly four
+    assert all(row.visible for row in view.week_rows)
+    view.current_date = datetime.date(2021, 2, 1)
+    view.render_calendar()
+    assert [row.visible for row in view.week_rows] == [True] * 4 + [False] * 2
+
+
+def test_navigation_rebinds_existing_chips():
+    march = [{"id": f"m{i}", "title": f"March {i}", "start": f"2025-03-{i + 1:02d} 09:00", "type": "event"} for i in range(20)]
+    april = [{"id": f"a{i}", "title": f"April {i}", "start": f"2025-04-{i + 3:02d} 09:00", "type": "event"} for i in range(20)]
+    view = make_view(march)
+    view.current_date = datetime.date(2025, 4, 1)
+    view.day_index = DayIndex(april)
+    view.render_calendar("navigate")
+    # Every April chip reuses a March one, rebound in its cell or taken from the pool
+    assert view.render_stats.last["created"] == 0
+    assert sorted(chip.content.value for cells in view.day_cells for cell in cells for chip in cell.chips.values()) == sorted(e["title"] for e in april)
+
+
+def test_busy_days_are_capped_behind_more():
+    busy = [{"id": f"t{i}", "title": f"Task {i}", "start": f"2025-03-{1 + i % 31:02d} 08:00", "type": "task"} for i in range(31 * 50)]
+    view = make_view(busy, height=900)
+    capacity = view.chips_per_cell
+    # (900 - header) / 6 rows leaves room for a handful of chips, not 50
+    assert 1 < capacity < 10
+    cell = next(cell for cells in view.day_cells for cell in cells if cell.date == datetime.date(2025, 3, 10))
+    assert len(cell.chips) == capacity - 1
+    assert cell.more.visible and cell.more_text.value == f"+{50 - capacity + 1} more"
+    assert view.render_stats.last["created"] == 31 * (capacity - 1) * DayCell.CHIP_CONTROLS
+
+    # The full list is built only when asked for
+    assert view.page.opened == []
+    view.show_day_overflow(cell.date)
+    assert len(view.page.opened[0].content.content.controls) == 50
+
+
+def test_rapid_navigation_fetches_only_the_last_month(monkeypatch):
+    reads = []
+
+    async def aget_range(first_day, last_day, projection="timeline", timeout=None):
+        reads.append(first_day)
+        # Earlier months answer last, as a slow first request would
+        await asyncio.sleep(0.05 if first_day.month == 4 else 0.01)
+        return [{"id": f"{first_day:%m}", "title": f"{first_day:%B}", "start": f"{first_day} 09:00", "type": "event"}]
+
+    monkeypatch.setattr(store, "aget_range", aget_range)
+    monkeypatch.setattr(store, "has_range", lambda *args, **kwargs: False)
+
+    async def scenario():
+        view = MonthView()
+        view.page = LoopPage()
+        view.prefetcher.schedule = lambda ranges: None # neighbours are not this test's business
+        view.current_date = datetime.date(2025, 3, 1)
+        for _ in range(5):
+            view.next_month(None)
+            await asyncio.sleep(0.01) # faster than the debounce
+        await asyncio.sleep(0.3)
+        assert reads == [datetime.date(2025, 8, 1)]
+
+        # A read that lands after the user moved on is dropped even when nothing cancelled it
+        view.current_date = datetime.date(2025, 4, 1)
+        view.fetch_generation += 1
+        stale = asyncio.create_task(view._fetch_events(view.fetch_generation))
+        await asyncio.sleep(0.02) # April is being read
+        view.next_month(None)
+        await stale
+        await asyncio.sleep(0.3)
+        assert reads[1:] == [datetime.date(2025, 4, 1), datetime.date(2025, 5, 1)]
+        return view
+
+    view = asyncio.run(scenario())
+    assert view.current_date == datetime.date(2025, 5, 1)
+    assert [e["title"] for e in view.day_index.on(datetime.date(2025, 5, 1))] == ["May"]
+    assert view.day_index.on(datetime.date(2025, 4, 1)) == []
@@ -0,0 +1,73 @@
+import datetime
+from data.recurrence import occurrences, month_bounds
+
+
+def brute_force_dates(event, range_start, range_end):
+    # Reference implementation: the old per-day scan
+    start = datetime.datetime.strptime(event["start"].split(" ")[0], "%Y-%m-%d").date()
+    recurrence = event.get("recurrence")
+    dates = []
+    current = range_start
+    while current <= range_end:
+        if current >= start:
+            if recurrence == "daily":
+                match = True
+            elif recurrence == "workdays":
+                match = current.weekday() < 5
+            elif recurrence == "weekends":
+                match = current.weekday() >= 5
+            elif recurrence == "monthly":
+                match = current.day == start.day
+            elif recurrence == "yearly":
+                match = current.month == start.month and current.day == start.day
+            else:
+                match = False
+            if match:
+                dates.append(current)
+        current += datetime.timedelta(days=1)
+    return dates
+
+
+def make_event(start, recurrence, end=None):
+    return {"id": "1", "title": "Test", "start": start, "end": end or start, "recurrence": recurrence}
+
+
+def test_matches_brute_force():
+    anchors = ["2024-01-31 09:30", "2024-02-29", "2023-11-15 18:00", "2025-06-07 07:00"]
+    ranges = [
+        month_bounds(2024, 2),
+        month_bounds(2025, 3),
+        (datetime.date(2024, 1, 1), datetime.date(2026, 12, 31)),
+        (datetime.date(2024, 3, 3), datetime.date(2024, 3, 9)),
+        (datetime.date(2024, 5, 1), datetime.date(2024, 5, 1)),
+    ]
+    for anchor in anchors:
+        for recurrence in ["daily", "workdays", "weekends", "monthly", "yearly"]:
+            event = make_event(anchor, recurrence)
+            for range_start, range_end in ranges:
+                got = [
+                    datetime.date.fromisoformat(i["start"].split(" ")[0])
+                    for i in occurrences(event, range_start, range_end)
+                ]
+                assert got == brute_force_dates(event, range_start, range_end), (anchor, recurrence, range_start)
+
+
+def test_one_off_event():
+    event = make_event("2024-02-10 14:00", None, "2024-02-10 15:00")
+    assert list(occurrences(event, *month_bounds(2024, 2))) == [event]
+    assert list(occurrences(event, *month_bounds(2024, 3))) == []
+
+
+def test_instances_keep_time_and_span():
+    event = make_event("2024-01-01 23:00", "weekends", "2024-01-02 01:00")
+    instances = list(occurrences(event, datetime.date(2024, 1, 6), datetime.date(2024, 1, 7)))
+    assert [i["start"] for i in instances] == ["2024-01-06 23:00", "2024-01-07 23:00"]
+    assert [i["end"] for i in instances] == ["2024-01-07 01:00", "2024-01-08 01:00"]
+    assert all(i["id"] == "1" for i in instances)
+    assert event["start"] == "2024-01-01 23:00"
+
+
+if __name__ == "__main__":
+    for test in [test_matches_brute_force, test_one_off_event, test_instances_keep_time_and_span]:
+        test()
+        print(f"PASS: {test.__name__}")
@@ -0,0 +1,137 @@
+import datetime
+from types import SimpleNamespace
+from services.response_cache import ResponseCache, normalize_message
+from services.ai_service import AIService
+
+TODAY = datetime.date(2025, 3, 10)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_keys_ignore_formatting_but_not_the_date():
+    assert normalize_message("  Lunch   TOMORROW at 1!! ") == "lunch tomorrow at 1"
+    cache = ResponseCache()
+    assert cache.key("Lunch tomorrow at 1.", TODAY) == cache.key("lunch  tomorrow at 1", TODAY)
+    assert cache.key("lunch tomorrow at 1", TODAY) != cache.key("lunch tomorrow at 1", TODAY + datetime.timedelta(days=1))
+    assert cache.key("yes", TODAY, "ann") != cache.key("yes", TODAY, "bob")
+
+
+def test_ttl_lru_and_hit_rate():
+    clock = Clock()
+    cache = ResponseCache(max_size=2, ttl=60, clock=clock)
+    cache.put("a", {"action": "chat", "response_message": "A"})
+    cache.put("b", {"action": "chat", "response_message": "B"})
+    hit = cache.get("a")
+    hit["response_message"] = "changed by the caller"
+    assert cache.get("a")["response_message"] == "A"
+    cache.put("c", {"action": "chat"}) # evicts "b", the least recently used
+    assert cache.get("b") is None
+    clock.now += 61
+    assert cache.get("a") is None
+    assert cache.stats() == {
+        "size": 1, "max_size": 2, "hits": 2, "misses": 2, "expired": 1, "evictions": 1, "hit_rate": 0.5,
+    }
+
+
+def test_entries_survive_a_restart(tmp_path):
+    path = str(tmp_path / "ai_cache.json")
+    clock = Clock()
+    cache = ResponseCache(ttl=60, path=path, clock=clock)
+    cache.put("fresh", {"action": "chat"})
+    clock.now += 50
+    cache.put("newer", {"action": "create"})
+    clock.now += 20 # "fresh" is now past its TTL
+    reloaded = ResponseCache(ttl=60, path=path, clock=clock)
+    assert reloaded.get("newer") == {"action": "create"}
+    assert reloaded.get("fresh") is None and reloaded.stats()["size"] == 1
+
+
+class FakeChat:
+    """Stands in for a Gemini chat: keeps its history and reports token usage."""
+
+    def __init__(self, model, history):
+        self.model = model
+        self.history = list(history)
+
+    def send_message(self, text):
+        self.model.sent.append((text, len(self.history)))
+        self.history = self.history + [{"role": "user", "parts": [text]}, {"role": "model", "parts": [self.model.reply]}]
+        usage = SimpleNamespace(prompt_token_count=40, candidates_token_count=10, cached_content_token_count=30, total_token_count=50)
+        return SimpleNamespace(text=self.model.reply, usage_metadata=usage)
+
+
+class FakeModel:
+    def __init__(self, reply='```json\n{"action": "chat", "response_message": "Hi"}\n```'):
+        self.reply = reply
+        self.sent = [] # (text, history length when sent)
+
+    def start_chat(self, history):
+        return FakeChat(self, history)
+
+
+def make_service(monkeypatch, **env):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.delenv("AI_CACHE_PATH", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    service = AIService()
+    service.model = FakeModel()
+    return service
+
+
+def test_repeated_opening_messages_skip_the_model(monkeypatch):
+    service = make_service(monkeypatch)
+    assert service.process_message("Hello there") == {"action": "chat", "response_message": "Hi"}
+    service.reset_session() # a new conversation opening the same way
+    assert service.process_message("hello  there!") == {"action": "chat", "response_message": "Hi"}
+    assert len(service.model.sent) == 1
+    assert service.cache.stats()["hits"] == 1
+    # The cached answer still joins the conversation, and what follows depends on it
+    assert len(service.session().chat.history) == 2
+    service.process_message("Hello there")
+    assert len(service.model.sent) == 2
+
+
+def test_sessions_keep_a_bounded_history_and_count_tokens(monkeypatch):
+    service = make_service(monkeypatch, AI_HISTORY_TURNS="2")
+    for n in range(4):
+        service.process_message(f"message {n}", user_id="ann")
+    text, history_length = service.model.sent[-1]
+    # Ann's cached opening message is hers only: Bob's same words reach the model
+    service.process_message("message 0", user_id="bob")
+    assert len(service.model.sent) == 5 and service.model.sent[-1][0].endswith("\nmessage 0")
+    assert service.cache.stats()["hits"] == 0
+
+    assert text.startswith("[Now: ") and text.endswith("\nmessage 3")
+    assert "calendar assistant" not in text # the instructions go once, as the system instruction
+    assert history_length == 4 # two earlier turns, not three
+    assert len(service.session("ann").chat.history) == 4
+    assert len(service.session("bob").chat.history) == 2
+    assert service.last_usage["total_tokens"] == 50
+    assert service.usage_stats() == {
+        "calls": 5, "prompt_tokens": 200, "response_tokens": 50, "cached_tokens": 150, "total_tokens": 250, "sessions": 2,
+    }
+
+
+def test_standalone_requests_hit_within_a_session_and_follow_ups_do_not(monkeypatch):
+    service = make_service(monkeypatch)
+    service.model.reply = '{"action": "create", "title": "Lunch", "response_message": "Booked", "standalone": true}'
+    first = service.process_message("Lunch tomorrow at 1", user_id="ann")
+    assert first == {"action": "create", "title": "Lunch", "response_message": "Booked"}
+    assert service.process_message("lunch tomorrow at 1", user_id="ann") == first # same session, later turn
+    assert len(service.model.sent) == 1
+    assert len(service.session("ann").chat.history) == 4
+
+    service.model.reply = '{"action": "chat", "response_message": "Done", "standalone": false}'
+    service.process_message("yes", user_id="ann")
+    service.process_message("Lunch tomorrow at 1", user_id="ann") # still a hit
+    service.process_message("yes", user_id="ann") # the history changed, so it is asked again
+    service.reset_session("ann")
+    service.process_message("yes", user_id="ann") # nor does an opening "yes" reuse either answer
+    assert [text.rsplit("\n", 1)[1] for text, _ in service.model.sent] == ["Lunch tomorrow at 1", "yes", "yes", "yes"]
@@ -0,0 +1,251 @@
+import time
+import threading
+import datetime
+import pytest
+from data.store import EventStore
+from data.sync import EventReplica
+from data.backends.sqlite import SQLiteBackend
+
+USER = "backend-test-user"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EventStore(SQLiteBackend(str(tmp_path / "calendar.db")))
+    store.replica.poll_interval = 0.05
+    store.set_user(USER)
+    assert store.replica.ready.wait(2)
+    yield store
+    store.set_user(None)
+
+
+def test_event_round_trip(store):
+    event = store.add_event("Standup", "2025-03-10 09:00", "2025-03-10 09:15", "daily sync", priority="High")
+    stored = store.get_event(event["id"])
+    assert stored["title"] == "Standup"
+    assert stored["start_at"] == datetime.datetime(2025, 3, 10, 9, 0)
+    assert stored["completed"] is False
+
+    assert store.update_event(event["id"], {"completed": True, "location": "Room 2"})
+    stored = store.get_event(event["id"])
+    assert stored["completed"] is True
+    assert stored["location"] == "Room 2"
+
+    store.delete_event(event["id"])
+    assert store.get_event(event["id"]) is None
+
+
+def test_range_reads_expand_series(store):
+    store.add_event("Inside", "2025-03-12 10:00", "2025-03-12 11:00", "")
+    store.add_event("Outside", "2025-04-02 10:00", "2025-04-02 11:00", "")
+    store.add_event("Spans in", "2025-02-28 22:00", "2025-03-01 01:00", "")
+    store.add_event("Gym", "2025-02-01 07:00", "2025-02-01 08:00", "", recurrence="weekends")
+
+    events = store.get_events_in_range(datetime.date(2025, 3, 1), datetime.date(2025, 3, 9), projection="grid")
+    assert sorted(e["start"] for e in events) == [
+        "2025-03-01 07:00", "2025-03-02 07:00", "2025-03-08 07:00", "2025-03-09 07:00"
+    ]
+    # Reads go straight to the backend too. "Spans in" shows on the day it starts, in
+    # February, so March's query doesn't send it at all
+    docs = store.backend.find_range(USER, datetime.date(2025, 3, 1), datetime.date(2025, 3, 31), {"title": 1})
+    assert sorted(doc["title"] for doc in docs) == ["Gym", "Inside"]
+    assert [doc["title"] for doc in store.replica.docs_in_range(datetime.date(2025, 3, 1), datetime.date(2025, 3, 31)) if doc["title"] == "Spans in"] == []
+
+
+def test_bulk_writes(store):
+    added = store.add_events([
+        {"title": f"Item {i}", "start_date": "2025-05-01 09:00", "end_date": "2025-05-01 10:00", "description": ""}
+        for i in range(3)
+    ])
+    ids = [doc["id"] for doc in added]
+    assert store.update_events([(event_id, {"title": "Renamed"}) for event_id in ids]) == [True] * 3
+    assert {e["title"] for e in store.get_events_for_month(2025, 5)} == {"Renamed"}
+    assert store.delete_events(ids) == [True] * 3
+    assert store.get_events_for_month(2025, 5) == []
+
+
+def test_range_query_uses_index(store):
+    plan = store.backend.explain_range(USER, datetime.date(2025, 3, 1), datetime.date(2025, 3, 31))
+    assert any("USING INDEX events_user_start_at_id (" in step for step in plan), plan
+
+
+def test_legacy_events_are_backfilled_in_the_background(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "legacy.db"))
+    backend.connect()
+    for day in (3, 4, 5):
+        backend.insert({"user_id": USER, "title": f"Old {day}", "start": f"2024-05-0{day} 10:00", "end": f"2024-05-0{day} 11:00"})
+    legacy = EventStore(backend)
+    legacy.sync_enabled = False
+    legacy.set_user(USER)
+    assert legacy.backfill.result(timeout=2) == 3
+    assert backend.missing_normalized_dates(USER) == []
+    assert [e["title"] for e in legacy.get_events_for_month(2024, 5)] == ["Old 3", "Old 4", "Old 5"]
+
+
+def test_replica_polls_other_sessions(store, tmp_path):
+    other = EventStore(SQLiteBackend(str(tmp_path / "calendar.db")))
+    other.sync_enabled = False
+    other.set_user(USER)
+
+    event = other.add_event("From elsewhere", "2025-06-01 09:00", "2025-06-01 10:00", "")
+    deadline = time.time() + 2
+    while time.time() < deadline and not store.get_events_for_month(2025, 6):
+        time.sleep(0.05)
+    assert [e["title"] for e in store.get_events_for_month(2025, 6)] == ["From elsewhere"]
+
+    other.delete_event(event["id"])
+    deadline = time.time() + 2
+    while time.time() < deadline and store.get_events_for_month(2025, 6):
+        time.sleep(0.05)
+    assert store.get_events_for_month(2025, 6) == []
+
+
+class SlowBackend:
+    """Answers find_all only once released, like a slow server; the first user's load is stuck."""
+    supports_watch = False
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def find_all(self, user_id, fields=None):
+        if user_id == "alice":
+            self.release.wait(5)
+        return [{"id": f"{user_id}-1", "title": f"secret of {user_id}", "start_at": datetime.datetime(2025, 3, 1, 9)}]
+
+    def changes_since(self, user_id, since, fields=None):
+        return [], []
+
+
+def test_replica_drops_a_load_that_finishes_after_a_user_switch():
+    backend = SlowBackend()
+    replica = EventReplica()
+    replica.start(backend, "alice", {"title": 1})
+    first = replica._thread
+    join = first.join
+    first.join = lambda timeout=None: None # stop() gives up on the stuck load straight away
+    replica.start(backend, "bob", {"title": 1})
+    assert replica.ready.wait(2)
+    backend.release.set() # Alice's query finally answers
+    join(2)
+    titles = [doc["title"] for doc in replica.docs_in_range(datetime.date(2025, 3, 1), datetime.date(2025, 3, 31))]
+    assert titles == ["secret of bob"]
+    replica.stop()
+
+
+def test_day_counts_match_the_month(store, tmp_path):
+    store.add_event("Call", "2025-03-12 10:00", "2025-03-12 11:00", "")
+    store.add_event("Review", "2025-03-12 15:00", "2025-03-12 16:00", "", event_type="task")
+    store.add_event("Late", "2025-03-31 23:30", "2025-04-01 00:30", "")
+    store.add_event("Gym", "2025-02-01 07:00", "2025-02-01 08:00", "", recurrence="weekends")
+    expected = {}
+    for event in store.get_events_for_month(2025, 3, projection="grid"):
+        day = datetime.date.fromisoformat(event["start"][:10])
+        bucket = expected.setdefault(day, {"events": 0, "tasks": 0})
+        bucket["tasks" if event.get("type") == "task" else "events"] += 1
+
+    # Counted by the backend's GROUP BY plus the expanded series, with nothing loaded or synced
+    counting = EventStore(SQLiteBackend(str(tmp_path / "calendar.db")))
+    counting.sync_enabled = False
+    counting.set_user(USER)
+    assert counting.get_day_counts(2025, 3) == expected
+    assert counting.get_day_counts(2025, 3) == expected # now from the cache
+    assert counting.cache.stats()["hits"] == 1
+
+    # A write drops the cached counts with the rest of the month
+    counting.add_event("Extra", "2025-03-12 18:00", "2025-03-12 19:00", "")
+    assert counting.get_day_counts(2025, 3)[datetime.date(2025, 3, 12)] == {"events": 2, "tasks": 1}
+    # The first store counts the grid month it already loaded and agrees
+    assert store.get_day_counts(2025, 3) == expected
+
+    # So does a delete, single or bulk, of an event the store never loaded
+    late = next(e for e in store.get_events_for_month(2025, 3, projection="grid") if e["title"] == "Late")
+    review = next(e for e in store.get_events_for_month(2025, 3, projection="grid") if e["title"] == "Review")
+    counting.delete_event(late["id"])
+    assert datetime.date(2025, 3, 31) not in counting.get_day_counts(2025, 3)
+    counting.delete_events([review["id"]])
+    assert counting.get_day_counts(2025, 3)[datetime.date(2025, 3, 12)] == {"events": 2, "tasks": 0}
+
+
+def test_agenda_pages_merge_series_in_order(store):
+    for i in range(40):
+        day = datetime.date(2025, 1, 3) + datetime.timedelta(days=9 * i)
+        store.add_event(f"One-off {i}", f"{day} 10:00", f"{day} 11:00", "")
+    # Same start as one of the one-offs above: order is settled by id
+    store.add_event("Tie", "2025-01-12 10:00", "2025-01-12 10:30", "", event_type="task")
+    store.add_event("Gym", "2025-06-01 07:00", "2025-06-01 08:00", "", recurrence="weekends")
+
+    def key(e):
+        return (datetime.datetime.strptime(e["start"], "%Y-%m-%d %H:%M"), e["id"])
+    expected = [key(e) for e in sorted(store.get_events_in_range(datetime.date(2025, 1, 1), datetime.date(2025, 12, 31)), key=key)]
+
+    forward, cursor = [], (datetime.datetime(2025, 1, 1), "")
+    while True:
+        page, cursor = store.get_agenda_page(after=cursor, limit=7)
+        assert len(page) <= 7
+        forward += [key(e) for e in page]
+        if cursor is None or cursor[0].year > 2025:
+            break
+    assert [k for k in forward if k[0].year == 2025] == expected
+
+    backward, cursor = [], (datetime.datetime(2026, 1, 1), "")
+    while cursor is not None:
+        page, cursor = store.get_agenda_page(before=cursor, limit=7)
+        backward += [key(e) for e in page]
+    assert backward == expected[::-1]
+
+
+@pytest.fixture
+def cached_store(tmp_path):
+    # No replica, so only the store's own invalidation keeps the cache honest
+    store = EventStore(SQLiteBackend(str(tmp_path / "calendar.db")))
+    store.sync_enabled = False
+    store.set_user(USER)
+    yield store
+    store.set_user(None)
+
+
+def cached_months(store, year, months):
+    return [month for month in months if store.cache.contains((USER, year, month, "timeline"))]
+
+
+def load_months(store, year, months):
+    for month in months:
+        store.get_events_for_month(year, month)
+
+
+def test_series_invalidate_the_months_they_reach(cached_store):
+    load_months(cached_store, 2025, range(1, 7))
+    cached_store.add_event("Standup", "2025-03-05 09:00", "2025-03-05 09:15", "", recurrence="daily")
+    # Every month from the series' start onwards, nothing before it
+    assert cached_months(cached_store, 2025, range(1, 7)) == [1, 2]
+
+    load_months(cached_store, 2025, range(1, 7))
+    cached_store.add_event("Anniversary", "2025-04-20 19:00", "2025-04-20 22:00", "", recurrence="yearly")
+    assert cached_months(cached_store, 2025, range(1, 7)) == [1, 2, 3, 5, 6]
+    assert [e["title"] for e in cached_store.get_events_for_month(2025, 4) if e["title"] == "Anniversary"] == ["Anniversary"]
+
+
+def test_update_moving_an_event_drops_both_months(cached_store):
+    event = cached_store.add_event("Dentist", "2025-03-12 10:00", "2025-03-12 11:00", "")
+    load_months(cached_store, 2025, (3, 4, 5))
+    cached_store.update_event(event["id"], {"start": "2025-05-02 10:00", "end": "2025-05-02 11:00"})
+    assert cached_months(cached_store, 2025, (3, 4, 5)) == [4]
+    assert cached_store.get_events_for_month(2025, 3) == []
+    assert [e["title"] for e in cached_store.get_events_for_month(2025, 5)] == ["Dentist"]
+
+
+def test_month_cache_is_a_bounded_lru_and_revisits_are_free(cached_store, monkeypatch):
+    cached_store.cache.max_size = 3
+    load_months(cached_store, 2025, (1, 2, 3))
+    cached_store.get_events_for_month(2025, 1) # January is now the most recently used
+    load_months(cached_store, 2025, (4,))
+    assert cached_months(cached_store, 2025, range(1, 5)) == [1, 3, 4]
+
+    round_trips = []
+    find_range = cached_store.backend.find_range
+    monkeypatch.setattr(cached_store.backend, "find_range", lambda *args: round_trips.append(args) or find_range(*args))
+    before = cached_store.cache.stats()
+    cached_store.get_events_for_month(2025, 3)
+    after = cached_store.cache.stats()
+    assert round_trips == []
+    assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (1, 0)
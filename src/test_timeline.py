@@ -0,0 +1,85 @@
+import datetime
+from types import SimpleNamespace
+from data.day_index import DayIndex
+from components.timeline import Timeline, PIXELS_PER_HOUR, event_span
+from components.day_view import DayView
+from components.week_view import WeekView
+from conftest import FakePage
+
+
+DAY = datetime.date(2025, 3, 10)
+
+
+def show(timeline, events, dates=(DAY,)):
+    timeline.show(DayIndex(events), list(dates))
+
+
+def hourly(day, prefix):
+    return [
+        {"id": f"{prefix}{hour}", "title": f"{prefix} {hour}", "start": f"{day} {hour:02d}:00", "end": f"{day} {hour:02d}:30", "type": "event"}
+        for hour in range(24)
+    ]
+
+
+def make_timeline(days=1):
+    timeline = Timeline(days=days)
+    timeline.page = FakePage()
+    timeline.viewport = 4 * PIXELS_PER_HOUR
+    return timeline
+
+
+def card_titles(column):
+    return sorted(card.content.controls[0].value for card in column.cards.values())
+
+
+def test_only_the_scroll_window_gets_cards():
+    timeline = make_timeline()
+    show(timeline, hourly("2025-03-10", "A"))
+    # 4 visible hours plus a 2 hour margin below
+    assert card_titles(timeline.columns[0]) == sorted(f"A {hour}" for hour in range(6))
+
+    timeline.handle_scroll(SimpleNamespace(pixels=12 * PIXELS_PER_HOUR, viewport_dimension=4 * PIXELS_PER_HOUR))
+    assert card_titles(timeline.columns[0]) == sorted(f"A {hour}" for hour in range(10, 18))
+    # Cards that scrolled out were recycled, not recreated; only the window grew by two
+    # single-lane clusters
+    assert timeline.render_stats.last["created"] == 2 * (Timeline.CARD_CONTROLS + Timeline.CLUSTER_CONTROLS + 1)
+
+
+def test_navigation_costs_only_cards():
+    timeline = make_timeline()
+    column = timeline.columns[0]
+    time_labels, lines = timeline.time_column.controls, list(column.lines)
+    show(timeline, hourly("2025-03-10", "A"))
+    show(timeline, hourly("2025-03-11", "B"), [DAY + datetime.timedelta(days=1)])
+    assert timeline.render_stats.last["created"] == 0
+    assert timeline.time_column.controls is time_labels
+    assert column.stack.controls[:24] == lines
+    assert card_titles(column) == sorted(f"B {hour}" for hour in range(6))
+
+
+def test_overlapping_events_share_the_width():
+    timeline = make_timeline()
+    show(timeline, [
+        {"id": "a", "title": "A", "start": "2025-03-10 01:00", "end": "2025-03-10 02:00"},
+        {"id": "b", "title": "B", "start": "2025-03-10 01:30", "end": "2025-03-10 02:30"},
+        {"id": "c", "title": "C", "start": "2025-03-10 03:00", "end": "2025-03-10 03:30"},
+    ])
+    first, second = timeline.columns[0].views
+    assert [[card.content.controls[0].value for card in lane.controls] for lane in first.row.controls] == [["A"], ["B"]]
+    assert first.container.top == PIXELS_PER_HOUR and first.container.height == 1.5 * PIXELS_PER_HOUR
+    assert first.cards[("b", "2025-03-10 01:30")].top == 0.5 * PIXELS_PER_HOUR # relative to the cluster
+    assert len(second.row.controls) == 1
+
+
+def test_event_span_defaults():
+    assert event_span({"start": "2025-03-10 13:15", "end": "2025-03-10 14:00"}) == (13 * 60 + 15, 14 * 60)
+    assert event_span({"start": "2025-03-10"}) == (9 * 60, 10 * 60)
+
+
+def test_views_keep_their_chrome():
+    for view in (DayView(), WeekView()):
+        view.page = FakePage()
+        controls = list(view.controls)
+        view.render_view()
+        view.render_view()
+        assert view.controls == controls
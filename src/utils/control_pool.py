@@ -0,0 +1,29 @@
+class ControlPool:
+    """
+    Free list of detached controls of one kind.
+
+    acquire() hands back a released control when there is one and only calls the
+    factory otherwise; callers rebind data into whatever they get. At most max_size
+    controls are kept, the rest are left to the garbage collector.
+    """
+
+    def __init__(self, factory, max_size=256):
+        self.factory = factory
+        self.max_size = max_size
+        self._free = []
+        self.created = 0
+        self.recycled = 0
+
+    def acquire(self):
+        if self._free:
+            self.recycled += 1
+            return self._free.pop()
+        self.created += 1
+        return self.factory()
+
+    def release(self, control):
+        if len(self._free) < self.max_size:
+            self._free.append(control)
+
+    def __len__(self):
+        return len(self._free)
@@ -0,0 +1,114 @@
+import heapq
+import threading
+from collections import OrderedDict, namedtuple
+
+MIN_DURATION = 30 # minutes; shorter events are drawn this tall, so they overlap as if they were
+
+# One event placed in a cluster: its (id, start) key, minutes after midnight and lane.
+# Only geometry is kept, so cached layouts never hold on to stale titles or colours.
+Box = namedtuple("Box", "key start end lane")
+# Events that overlap directly or through each other share a cluster and split its width into lanes
+Cluster = namedtuple("Cluster", "start end lanes boxes")
+
+
+def event_span(event):
+    """(start, end) in minutes after midnight; date-only starts sit at 09:00, missing ends last an hour."""
+    start = _minutes(event.get("start"))
+    if start is None:
+        start = 9 * 60 # Default start time for all-day/date-only events
+    end = _minutes(event.get("end"))
+    if end is None:
+        end = start + 60
+    return start, end
+
+
+def _minutes(value):
+    parts = value.split(" ") if isinstance(value, str) else []
+    if len(parts) < 2:
+        return None
+    hour, minute = map(int, parts[1].split(":")[:2])
+    return hour * 60 + minute
+
+
+def layout_events(events):
+    """
+    Assign overlapping events to side-by-side lanes with one sweep in start order.
+
+    Ending events free their lane (min-heap on end), a starting event takes the lowest
+    free lane (min-heap of lanes), and a cluster closes whenever nothing is active.
+    That is O(n log n) and uses as many lanes as the most events overlapping at once.
+    """
+    items = []
+    for event in events:
+        try:
+            start, end = event_span(event)
+        except (ValueError, AttributeError) as e:
+            print(f"Error laying out event {event.get('title')}: {e}")
+            continue
+        items.append((start, max(end, start + MIN_DURATION), (event.get("id"), event.get("start"))))
+    items.sort(key=lambda item: (item[0], -item[1]))
+
+    clusters = []
+    boxes = []
+    active = [] # (end, lane)
+    free = [] # lanes given back inside the current cluster
+    lanes = 0
+    cluster_start = cluster_end = None
+    for start, end, key in items:
+        while active and active[0][0] <= start:
+            heapq.heappush(free, heapq.heappop(active)[1])
+        if not active and boxes:
+            clusters.append(Cluster(cluster_start, cluster_end, lanes, boxes))
+            boxes, free, lanes = [], [], 0
+        if not boxes:
+            cluster_start, cluster_end = start, end
+        if free:
+            lane = heapq.heappop(free)
+        else:
+            lane = lanes
+            lanes += 1
+        heapq.heappush(active, (end, lane))
+        cluster_end = max(cluster_end, end)
+        boxes.append(Box(key, start, end, lane))
+    if boxes:
+        clusters.append(Cluster(cluster_start, cluster_end, lanes, boxes))
+    return clusters
+
+
+class LayoutCache:
+    """
+    Memoized layout_events() results keyed by (date, event-set version).
+
+    Shared by every timeline, so the day and week views lay a given day out once.
+    The version must change whenever that day's events do (see DayIndex.version).
+    """
+
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, date, version, events):
+        key = (date, version)
+        with self._lock:
+            clusters = self._entries.get(key)
+            if clusters is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return clusters
+            self.misses += 1
+        clusters = layout_events(events)
+        with self._lock:
+            self._entries[key] = clusters
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return clusters
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+layout_cache = LayoutCache()
@@ -0,0 +1,40 @@
+import os
+
+
+class RenderStats:
+    """
+    Counts the controls a view creates versus reuses for each interaction.
+
+    Views call begin() when an interaction starts (navigation, filter toggle, data
+    arriving) and created()/reused() while rendering; end() records the totals in
+    `last` and prints them when RENDER_STATS=on.
+    """
+
+    def __init__(self, view_name):
+        self.view_name = view_name
+        self.enabled = os.getenv("RENDER_STATS", "off") == "on"
+        self.interaction = None
+        self.counts = {"created": 0, "reused": 0, "removed": 0}
+        self.last = None
+
+    def begin(self, interaction):
+        self.interaction = interaction
+        self.counts = {"created": 0, "reused": 0, "removed": 0}
+
+    def created(self, count=1):
+        self.counts["created"] += count
+
+    def reused(self, count=1):
+        self.counts["reused"] += count
+
+    def removed(self, count=1):
+        self.counts["removed"] += count
+
+    def end(self):
+        self.last = {"interaction": self.interaction, **self.counts}
+        if self.enabled:
+            print(
+                f"[render] {self.view_name} {self.interaction}: "
+                f"created {self.counts['created']}, reused {self.counts['reused']}, removed {self.counts['removed']}"
+            )
+        return self.last
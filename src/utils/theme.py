@@ -0,0 +1,35 @@
+import flet as ft
+
+
+class ThemeState:
+    """
+    Light/dark mode of one page; components that pick colours by mode subscribe to re-skin in place.
+
+    Each session's AppLayout owns one and hands it to its header and views, so a toggle
+    in one browser tab never repaints another.
+    """
+
+    def __init__(self, mode=None):
+        self.mode = mode or ft.ThemeMode.LIGHT
+        self._listeners = [] # called after the mode changes
+
+    @property
+    def dark(self):
+        return self.mode == ft.ThemeMode.DARK
+
+    def set_mode(self, mode):
+        if mode == self.mode:
+            return
+        self.mode = mode
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in theme listener: {e}")
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
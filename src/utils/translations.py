@@ -1,90 +1,142 @@
+# UI strings per language code; shared by every page's Translations
+STRINGS = {
+    "en": {
+        "app_title": "AI Calendar",
+        "login": "Login",
+        "logout": "Logout",
+        "settings": "Settings",
+        "language": "Language",
+        "save": "Save",
+        "cancel": "Cancel",
+        "create": "Create",
+        "month_view": "Month View",
+        "week_view": "Week View",
+        "day_view": "Day View",
+        "agenda_view": "Agenda",
+        "my_calendars": "My calendars",
+        "events": "Events",
+        "tasks": "Tasks",
+        "birthdays": "Birthdays",
+        "holidays": "Holidays",
+        "account": "Account",
+        "name": "Name",
+        "email": "Email",
+        "current_password": "Current Password",
+        "new_password": "New Password",
+        "confirm_password": "Confirm New Password",
+        "account_info": "Account Information",
+        "save_name": "Save Name",
+        "security": "Security",
+        "change_password": "Change Password",
+        "actions": "Actions",
+        "delete_account": "Delete Account",
+        "months": ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"],
+        "weekdays_short": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+        "no_events": "No events today",
+        "event_details": "Event Details",
+        "description": "Description",
+        "time": "Time",
+        "close": "Close",
+        "calendar": "Calendar",
+        "more_events": "+{count} more",
+        "show_earlier": "Show earlier",
+        "no_more_events": "Nothing further",
+    },
+    "ru": {
+        "app_title": "AI Календарь",
+        "login": "Войти",
+        "logout": "Выйти",
+        "settings": "Настройки",
+        "language": "Язык",
+        "save": "Сохранить",
+        "cancel": "Отмена",
+        "create": "Создать",
+        "month_view": "Месяц",
+        "week_view": "Неделя",
+        "day_view": "День",
+        "agenda_view": "Список",
+        "my_calendars": "Мои календари",
+        "events": "События",
+        "tasks": "Задачи",
+        "birthdays": "Дни рождения",
+        "holidays": "Праздники",
+        "account": "Аккаунт",
+        "name": "Имя",
+        "email": "Email",
+        "current_password": "Текущий пароль",
+        "new_password": "Новый пароль",
+        "confirm_password": "Подтвердите пароль",
+        "account_info": "Информация об аккаунте",
+        "save_name": "Сохранить имя",
+        "security": "Безопасность",
+        "change_password": "Сменить пароль",
+        "actions": "Действия",
+        "delete_account": "Удалить аккаунт",
+        "months": ["Январь", "Февраль", "Март", "Апрель", "Май", "Июнь", "Июль", "Август", "Сентябрь", "Октябрь", "Ноябрь", "Декабрь"],
+        "weekdays_short": ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"],
+        "no_events": "Нет событий сегодня",
+        "event_details": "Детали события",
+        "description": "Описание",
+        "time": "Время",
+        "close": "Закрыть",
+        "calendar": "Календарь",
+        "more_events": "ещё {count}",
+        "show_earlier": "Показать раньше",
+        "no_more_events": "Больше ничего нет",
+    }
+}
+
+
 class Translations:
-    def __init__(self):
-        self.current_language = "en"
-        self.translations = {
-            "en": {
-                "app_title": "AI Calendar",
-                "login": "Login",
-                "logout": "Logout",
-                "settings": "Settings",
-                "language": "Language",
-                "save": "Save",
-                "cancel": "Cancel",
-                "create": "Create",
-                "month_view": "Month View",
-                "week_view": "Week View",
-                "day_view": "Day View",
-                "my_calendars": "My calendars",
-                "events": "Events",
-                "tasks": "Tasks",
-                "birthdays": "Birthdays",
-                "holidays": "Holidays",
-                "account": "Account",
-                "name": "Name",
-                "email": "Email",
-                "current_password": "Current Password",
-                "new_password": "New Password",
-                "confirm_password": "Confirm New Password",
-                "account_info": "Account Information",
-                "save_name": "Save Name",
-                "security": "Security",
-                "change_password": "Change Password",
-                "actions": "Actions",
-                "delete_account": "Delete Account",
-                "months": ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"],
-                "weekdays_short": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
-                "no_events": "No events today",
-                "event_details": "Event Details",
-                "description": "Description",
-                "time": "Time",
-                "close": "Close",
-                "calendar": "Calendar",
-            },
-            "ru": {
-                "app_title": "AI Календарь",
-                "login": "Войти",
-                "logout": "Выйти",
-                "settings": "Настройки",
-                "language": "Язык",
-                "save": "Сохранить",
-                "cancel": "Отмена",
-                "create": "Создать",
-                "month_view": "Месяц",
-                "week_view": "Неделя",
-                "day_view": "День",
-                "my_calendars": "Мои календари",
-                "events": "События",
-                "tasks": "Задачи",
-                "birthdays": "Дни рождения",
-                "holidays": "Праздники",
-                "account": "Аккаунт",
-                "name": "Имя",
-                "email": "Email",
-                "current_password": "Текущий пароль",
-                "new_password": "Новый пароль",
-                "confirm_password": "Подтвердите пароль",
-                "account_info": "Информация об аккаунте",
-                "save_name": "Сохранить имя",
-                "security": "Безопасность",
-                "change_password": "Сменить пароль",
-                "actions": "Действия",
-                "delete_account": "Удалить аккаунт",
-                "months": ["Январь", "Февраль", "Март", "Апрель", "Май", "Июнь", "Июль", "Август", "Сентябрь", "Октябрь", "Ноябрь", "Декабрь"],
-                "weekdays_short": ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"],
-                "no_events": "Нет событий сегодня",
-                "event_details": "Детали события",
-                "description": "Описание",
-                "time": "Время",
-                "close": "Закрыть",
-                "calendar": "Календарь",
-            }
-        }
+    """
+    The language of one page, with listeners to re-label in place when it changes.
+
+    Each session's AppLayout owns one and hands it to its header and views, so switching
+    the language in one browser session never touches another.
+    """
+
+    def __init__(self, language="en"):
+        self.current_language = language if language in STRINGS else "en"
+        self.translations = STRINGS
+        self._listeners = [] # called after the language changes
 
     def set_language(self, language_code):
-        if language_code in self.translations:
+        if language_code in self.translations and language_code != self.current_language:
             self.current_language = language_code
+            for callback in list(self._listeners):
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Error in language listener: {e}")
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
 
     def get(self, key):
         return self.translations.get(self.current_language, {}).get(key, key)
 
-translations = Translations()
+
+class Labels:
+    """
+    Controls whose text comes from a Translations.
+
+    bind() sets the text now and remembers where it came from; apply() re-reads every
+    bound key, so a language switch re-labels the existing controls in place.
+    """
+
+    def __init__(self, translations):
+        self.translations = translations
+        self._bound = [] # (control, attribute, key)
+
+    def bind(self, control, key, attr="value"):
+        setattr(control, attr, self.translations.get(key))
+        self._bound.append((control, attr, key))
+        return control
+
+    def apply(self):
+        for control, attr, key in self._bound:
+            setattr(control, attr, self.translations.get(key))